@@ -0,0 +1,94 @@
+"""batch_push / batch_pull 종단 간 벤치마크 (localhost 가짜 Notion 서버)
+
+실제 HTTP 요청(notion-client → httpx)으로 가짜 서버에 파일을 올리고 다시 받습니다.
+응답 지연·429·5xx 주입으로 워커 수·속도 제한 설정의 효과를 재현할 수 있습니다.
+
+    python benchmarks/bench_batch.py
+    python benchmarks/bench_batch.py --files 40 --workers 4 --latency 0.05 --rate-limit-every 25
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from generators import korean_document
+
+from md_notion_bridge.batch import batch_pull, batch_push
+from md_notion_bridge.client import NotionClient
+from md_notion_bridge.fake_server import FakeNotionServer
+from md_notion_bridge.ratelimit import RateLimiter
+from md_notion_bridge.retry import RetryPolicy
+
+
+def _client(server: FakeNotionServer, rate: float) -> NotionClient:
+    client = NotionClient(
+        api_key="bench",
+        rate_limiter=RateLimiter(rate=rate, burst=max(1, int(rate))),
+        retry_policy=RetryPolicy(max_retries=5, base_delay=0.1),
+        base_url=server.url,
+    )
+    logging.getLogger("notion_client").setLevel(logging.ERROR)     # 429 경고 로그 숨김
+    return client
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--lines", type=int, default=300, help="파일당 줄 수")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.02, help="응답 지연 (초)")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="N번째 요청마다 429")
+    parser.add_argument("--retry-after", type=float, default=0.05)
+    parser.add_argument("--server-rate", type=float, default=0.0, help="서버 초당 허용 요청 수")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="무작위 5xx 비율")
+    parser.add_argument("--rate", type=float, default=1000.0, help="클라이언트 초당 요청 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, FakeNotionServer(
+        latency=args.latency,
+        rate_limit_every=args.rate_limit_every,
+        retry_after=args.retry_after,
+        rate_limit=args.server_rate,
+        error_rate=args.error_rate,
+        seed=0,
+    ) as server:
+        source = Path(tmp) / "docs"
+        source.mkdir()
+        files = []
+        for i in range(args.files):
+            path = source / f"doc_{i:03d}.md"
+            path.write_text(korean_document(args.lines), encoding="utf-8")
+            files.append(path)
+
+        client = _client(server, args.rate)
+
+        start = time.perf_counter()
+        push = batch_push(files, client, "root", workers=args.workers)
+        push_seconds = time.perf_counter() - start
+        push_requests = server.requests
+
+        start = time.perf_counter()
+        pull = batch_pull(list(server.pages), client, Path(tmp) / "out", workers=args.workers)
+        pull_seconds = time.perf_counter() - start
+
+        print(
+            f"파일 {args.files}개 × {args.lines}줄 · 워커 {args.workers} · "
+            f"지연 {args.latency * 1000:.0f}ms · 429 주기 {args.rate_limit_every or '-'}"
+        )
+        print(f"  push: {push_seconds:.2f}초 · 요청 {push_requests}회 | {push.summary()}")
+        print(
+            f"  pull: {pull_seconds:.2f}초 · 요청 {server.requests - push_requests}회 | "
+            f"{pull.summary()}"
+        )
+        print(f"  서버 429 응답: {server.rate_limited}회 · 5xx 응답: {server.server_errors}회")
+        print(f"  push 요청 지표: {push.metrics_summary()}")
+        print(f"  pull 요청 지표: {pull.metrics_summary()}")
+        print(f"  push 단계별: {push.timings.breakdown()}")
+        print(f"  pull 단계별: {pull.timings.breakdown()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""compile_tree 프로세스 수별 벤치마크 (md → 블록 JSON, 네트워크 없음)
+
+임시 디렉토리에 합성 문서 트리를 만들고 ``--jobs`` 값마다 전체를 변환해
+경과 시간과 첫 번째 ``--jobs`` 값 대비 배율을 출력합니다. 변환 캐시는 쓰지 않습니다.
+
+    python benchmarks/bench_compile.py
+    python benchmarks/bench_compile.py --files 200 --lines 2000 --jobs 1 2 4 8
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from generators import english_document, korean_document
+
+from md_notion_bridge.batch import compile_tree
+
+
+def _default_jobs() -> list[int]:
+    cores = os.cpu_count() or 1
+    jobs = [1]
+    while jobs[-1] * 2 <= cores:
+        jobs.append(jobs[-1] * 2)
+    return jobs if jobs[-1] == cores else [*jobs, cores]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=64)
+    parser.add_argument("--lines", type=int, default=1_000, help="파일당 줄 수")
+    parser.add_argument("--jobs", type=int, nargs="+", default=_default_jobs())
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        docs = Path(tmp) / "docs"
+        for i in range(args.files):
+            make = korean_document if i % 2 == 0 else english_document
+            path = docs / f"section{i % 8}" / f"doc{i}.md"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 파일마다 내용이 달라지도록 번호를 붙임
+            path.write_text(f"# 문서 {i}\n\n" + make(args.lines), encoding="utf-8")
+
+        print(f"파일 {args.files}개 × {args.lines:,}줄 (CPU {os.cpu_count()}개)")
+        base = None
+        for jobs in args.jobs:
+            start = time.perf_counter()
+            report = compile_tree(docs, Path(tmp) / f"out{jobs}", jobs=jobs)
+            seconds = time.perf_counter() - start
+            base = base or seconds
+            print(
+                f"  jobs={jobs:<3} {seconds:.2f}초 · {base / seconds:.2f}배 | "
+                f"파일별 합계 {report.timings.total:.2f}초 | 성공 {report.success}/{report.total}"
+            )
+
+
+if __name__ == "__main__":
+    main()
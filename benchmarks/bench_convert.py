@@ -0,0 +1,44 @@
+"""md_to_notion.convert 벤치마크
+
+API 레퍼런스처럼 제목·목록·표·코드블록이 섞인 큰 문서를 만들어 변환 시간을 잽니다.
+
+    python benchmarks/bench_convert.py
+    python benchmarks/bench_convert.py --lines 100000 --repeat 5
+    python benchmarks/bench_convert.py --engine mistune
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from generators import english_document, korean_document
+
+from md_notion_bridge.md_to_notion import convert
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-korean-opt", action="store_true")
+    parser.add_argument("--english", action="store_true", help="영어 문서로 측정")
+    parser.add_argument("--engine", default="line", choices=["line", "mistune"], help="파서 엔진")
+    args = parser.parse_args()
+
+    document = (english_document if args.english else korean_document)(args.lines)
+    korean_optimize = not args.no_korean_opt
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        blocks = convert(document, korean_optimize=korean_optimize, engine=args.engine)
+        timings.append(time.perf_counter() - start)
+
+    print(
+        f"convert[{args.engine}]: {len(document.splitlines()):,}줄 → {len(blocks):,}블록 | "
+        f"최소 {min(timings):.3f}초 · 중앙값 {statistics.median(timings):.3f}초"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""파서 엔진 비교 벤치마크 (줄 단위 ``line`` vs ``mistune``)
+
+같은 합성 문서를 두 엔진으로 변환해 시간과 결과 동일 여부를 나란히 출력합니다.
+``깊은 목록`` 처럼 결과가 다른 문서는 줄 단위 엔진이 중첩을 2단계까지만
+처리하기 때문입니다.
+
+    python benchmarks/bench_engines.py
+    python benchmarks/bench_engines.py --lines 5000 --repeat 3
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from generators import deep_list, english_document, korean_document, long_paragraph, wide_table
+
+from md_notion_bridge.md_to_notion import convert
+
+ENGINES = ("line", "mistune")
+
+
+def _best(func, repeat: int) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=20_000, help="문서 크기 (줄 / 행 / 항목 수)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-korean-opt", action="store_true")
+    args = parser.parse_args()
+
+    documents = {
+        "한국어 문서": korean_document(args.lines),
+        "영어 문서": english_document(args.lines),
+        "넓은 표": wide_table(args.lines // 4, cols=8),
+        "깊은 목록": deep_list(args.lines),
+        "긴 문단": long_paragraph(args.lines * 10),
+    }
+    korean_optimize = not args.no_korean_opt
+
+    for name, text in documents.items():
+        seconds, results = {}, {}
+        for engine in ENGINES:
+            seconds[engine], results[engine] = _best(
+                lambda: convert(text, korean_optimize=korean_optimize, engine=engine), args.repeat
+            )
+        same = results["line"] == results["mistune"]
+        print(
+            f"{name:<8} | line {seconds['line'] * 1000:8.1f}ms"
+            f" | mistune {seconds['mistune'] * 1000:8.1f}ms"
+            f" ({seconds['mistune'] / seconds['line']:4.2f}x)"
+            f" | {'동일' if same else '다름'}"
+        )
+
+if __name__ == "__main__":
+    main()
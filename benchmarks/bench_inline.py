@@ -0,0 +1,52 @@
+"""인라인 파싱 마이크로 벤치마크 (표 위주 문서)
+
+행이 많은 표는 셀마다 ``parse_inline`` 을 호출하므로 인라인 파싱 비용이
+변환 시간 대부분을 차지합니다. 셀 내용은 일정 비율로 반복됩니다.
+
+    python benchmarks/bench_inline.py
+    python benchmarks/bench_inline.py --rows 20000 --distinct 500
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from generators import wide_table
+
+from md_notion_bridge.md_to_notion import convert, parse_inline
+
+def _best(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--distinct", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    document = wide_table(args.rows, distinct=args.distinct)
+    cells = [c for line in document.splitlines()[2:] for c in line.strip("|").split("|")]
+
+    results = {
+        "parse_inline (셀 단위)": _best(
+            lambda: [parse_inline(c.strip()) for c in cells], args.repeat
+        ),
+        "convert": _best(lambda: convert(document), args.repeat),
+        "convert (셀 메모이제이션)": _best(
+            lambda: convert(document, memoize_cells=True), args.repeat
+        ),
+    }
+    print(f"표 {args.rows:,}행 · 셀 {len(cells):,}개 (고유 내용 {args.distinct}가지)")
+    for name, seconds in results.items():
+        print(f"  {name}: {seconds * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
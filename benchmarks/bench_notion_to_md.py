@@ -0,0 +1,55 @@
+"""notion_to_md.convert 벤치마크 (API 응답 모양의 블록 트리)
+
+``blocks.children.list`` 응답과 같은 필드를 가진 블록 5만 개로 변환 시간과
+트리가 차지하는 메모리를 원본 딕셔너리 / ``CompactBlock`` 으로 비교합니다.
+
+    python benchmarks/bench_notion_to_md.py
+    python benchmarks/bench_notion_to_md.py --blocks 100000 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+from generators import api_export
+
+from md_notion_bridge.blocks import compact_block
+from md_notion_bridge.notion_to_md import convert
+
+
+def _measure(build) -> tuple[object, int]:
+    tracemalloc.start()
+    tree = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return tree, size
+
+
+def _best(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    raw, raw_size = _measure(lambda: api_export(args.blocks))
+    compact, compact_size = _measure(lambda: [compact_block(b) for b in api_export(args.blocks)])
+    assert convert(compact) == convert(raw)
+
+    print(f"블록 {args.blocks:,}개")
+    for name, tree, size in (("dict", raw, raw_size), ("CompactBlock", compact, compact_size)):
+        seconds = _best(lambda: convert(tree), args.repeat)
+        print(f"  {name}: 변환 {seconds * 1000:.1f}ms · 트리 메모리 {size / 1_048_576:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
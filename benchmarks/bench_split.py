@@ -0,0 +1,56 @@
+"""긴 텍스트 분할(``split_long_text``) 벤치마크
+
+짧은 문장을 이어 붙인 1MB 문단(한국어·영어·이모지)과 긴 코드블록을
+2000자(UTF-16) 청크로 나누는 시간을 잽니다.
+
+    python benchmarks/bench_split.py
+    python benchmarks/bench_split.py --chars 4000000 --repeat 3
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from generators import long_paragraph
+
+from md_notion_bridge.blocks import build_code_block
+from md_notion_bridge.utils.korean import LINE_BOUNDARY, split_long_text, utf16_len
+
+
+def _best(func, repeat: int) -> tuple[float, object]:
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chars", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    korean = long_paragraph(args.chars)
+    english = long_paragraph(args.chars, korean=False)
+    emoji = ("이모지 문장 😀🎉. " * (args.chars // 10 + 1))[:args.chars]
+    code = "\n".join(f"value_{i} = compute({i})  # 계산" for i in range(args.chars // 30))
+    cases = {
+        "한국어 문단": lambda: split_long_text(korean),
+        "영어 문단": lambda: split_long_text(english),
+        "이모지 문단": lambda: split_long_text(emoji),
+        "코드 (줄 단위)": lambda: split_long_text(code, boundary=LINE_BOUNDARY),
+    }
+    print(f"입력 약 {args.chars:,}자")
+    for name, func in cases.items():
+        seconds, chunks = _best(func, args.repeat)
+        longest = max(utf16_len(c) for c in chunks)
+        print(f"  {name}: {seconds * 1000:.1f}ms · 청크 {len(chunks):,}개 (최대 {longest}자)")
+
+    seconds, _ = _best(lambda: build_code_block(code, "python"), args.repeat)
+    print(f"  build_code_block: {seconds * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""변환 핫패스 벤치마크 모음
+
+합성 문서(한국어·영어, 넓은 표, 깊은 목록, 긴 문단, API 응답 블록)로 변환 함수들을
+한 번에 측정합니다. 결과를 JSON으로 저장해 두고 다음 실행에서 비교하면
+기준보다 ``--threshold`` 이상 느려진 항목을 표시하고 종료 코드 1을 반환합니다.
+
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --save baseline.json
+    python benchmarks/bench_suite.py --compare baseline.json --threshold 0.2
+    python benchmarks/bench_suite.py --filter convert --scale 0.2
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from generators import (
+    api_export,
+    api_table,
+    deep_list,
+    english_document,
+    fullwidth_text,
+    korean_document,
+    long_paragraph,
+    wide_table,
+)
+
+from md_notion_bridge import md_to_notion, notion_to_md
+from md_notion_bridge.blocks import parse_table_block
+from md_notion_bridge.utils.korean import normalize_markdown_korean, split_long_text
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[float], Callable[[], object]]   # 규모 배율 → 측정할 함수
+
+
+def _n(base: int, scale: float) -> int:
+    return max(1, int(base * scale))
+
+
+def _convert(make_text, base: int, **kwargs):
+    def setup(scale: float):
+        text = make_text(_n(base, scale))
+        return lambda: md_to_notion.convert(text, **kwargs)
+    return setup
+
+
+def _parse_inline(scale: float):
+    rows = wide_table(_n(5_000, scale), cols=8).splitlines()[2:]
+    cells = [c.strip() for row in rows for c in row.strip("|").split("|")]
+    return lambda: [md_to_notion.parse_inline(c) for c in cells]
+
+
+def _split_long_text(chars: int, korean: bool = True):
+    def setup(scale: float):
+        text = long_paragraph(_n(chars, scale), korean=korean)
+        return lambda: split_long_text(text)
+    return setup
+
+
+def _normalize(make_text, base: int):
+    def setup(scale: float):
+        text = make_text(_n(base, scale))
+        return lambda: normalize_markdown_korean(text)
+    return setup
+
+
+def _blocks_to_md(scale: float):
+    blocks = api_export(_n(20_000, scale))
+    return lambda: notion_to_md.convert(blocks)
+
+
+def _parse_table(scale: float):
+    table = api_table(_n(5_000, scale), cols=8)
+    return lambda: parse_table_block(table, table["children"])
+
+
+CASES = [
+    Case("md_to_notion.convert[korean]", _convert(korean_document, 20_000)),
+    Case("md_to_notion.convert[english]", _convert(english_document, 20_000)),
+    Case("md_to_notion.convert[wide_table]", _convert(lambda n: wide_table(n, cols=8), 5_000)),
+    Case("md_to_notion.convert[deep_list]", _convert(deep_list, 20_000)),
+    Case("md_to_notion.convert[korean,mistune]", _convert(korean_document, 20_000, engine="mistune")),
+    Case("md_to_notion.convert[deep_list,mistune]", _convert(deep_list, 20_000, engine="mistune")),
+    Case("parse_inline[table_cells]", _parse_inline),
+    Case("split_long_text[200k]", _split_long_text(200_000)),
+    Case("split_long_text[1MB]", _split_long_text(1_000_000)),
+    Case("split_long_text[1MB,english]", _split_long_text(1_000_000, korean=False)),
+    Case("normalize_markdown_korean[document]", _normalize(korean_document, 20_000)),
+    Case("normalize_markdown_korean[fullwidth]", _normalize(fullwidth_text, 20_000)),
+    Case("notion_to_md.convert[export]", _blocks_to_md),
+    Case("parse_table_block[5000x8]", _parse_table),
+]
+
+
+def _time(func: Callable[[], object], repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="입력 크기 배율")
+    parser.add_argument("--filter", default="", help="이름에 이 문자열이 든 항목만 실행")
+    parser.add_argument("--save", type=Path, help="결과(항목별 최소 시간)를 JSON으로 저장")
+    parser.add_argument("--compare", type=Path, help="저장된 기준 결과와 비교")
+    parser.add_argument("--threshold", type=float, default=0.15, help="회귀로 볼 느려짐 비율")
+    args = parser.parse_args()
+
+    baseline = (
+        json.loads(args.compare.read_text(encoding="utf-8"))["results"] if args.compare else {}
+    )
+    results: dict[str, float] = {}
+    regressions = []
+
+    for case in CASES:
+        if args.filter not in case.name:
+            continue
+        timings = _time(case.setup(args.scale), args.repeat)
+        best = min(timings)
+        results[case.name] = best
+        line = (
+            f"{case.name:<40} 최소 {best * 1000:9.1f}ms · "
+            f"중앙값 {statistics.median(timings) * 1000:9.1f}ms"
+        )
+        if case.name in baseline:
+            ratio = best / baseline[case.name]
+            line += f" · 기준 대비 {ratio:5.2f}x"
+            if ratio > 1 + args.threshold:
+                line += "  ⚠ 회귀"
+                regressions.append(case.name)
+        print(line)
+
+    if args.save:
+        args.save.write_text(
+            json.dumps({"scale": args.scale, "results": results}, indent=1),
+            encoding="utf-8",
+        )
+    if regressions:
+        print(f"\n기준보다 {args.threshold:.0%} 이상 느려진 항목 {len(regressions)}개", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
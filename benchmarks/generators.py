@@ -0,0 +1,204 @@
+"""벤치마크용 합성 데이터 생성기
+
+모든 생성기는 결정적(같은 인자 → 같은 결과)이라 실행 간 비교가 가능합니다.
+"""
+from __future__ import annotations
+
+import unicodedata
+
+# ------------------------------------------------------------------ #
+# 마크다운 문서
+# ------------------------------------------------------------------ #
+
+KOREAN_SECTION = """\
+## `Client.method_{n}`
+
+메서드 {n} 설명입니다. **필수** 인자와 *선택* 인자를 받으며
+결과는 `dict` 로 반환합니다. 자세한 내용은 [문서](https://example.com/{n}) 참고.
+
+- 인자 `block_id` — 대상 블록 ID
+- 인자 `children` — 추가할 블록 목록
+  - 최대 100개
+- [ ] 비동기 버전 추가
+- [x] 재시도 지원
+
+1. 요청 생성
+2. 응답 확인
+
+| 이름 | 타입 | 설명 |
+|------|------|------|
+| block_id | str | 블록 ID |
+| children | list | 자식 블록 |
+
+```python
+client.method_{n}(block_id="abc")
+```
+
+> 참고: 속도 제한이 적용됩니다.
+
+---
+"""
+
+ENGLISH_SECTION = """\
+## `Client.method_{n}`
+
+Method {n} takes **required** and *optional* arguments
+and returns a `dict`. See the [docs](https://example.com/{n}) for details.
+
+- `block_id` — target block ID
+- `children` — blocks to append
+  - at most 100
+- [ ] add an async variant
+- [x] retries supported
+
+1. Build the request
+2. Check the response
+
+| Name | Type | Description |
+|------|------|-------------|
+| block_id | str | Block ID |
+| children | list | Child blocks |
+
+```python
+client.method_{n}(block_id="abc")
+```
+
+> Note: rate limits apply.
+
+---
+"""
+
+
+def _document(section: str, title: str, lines: int) -> str:
+    per_section = section.count("\n")
+    sections = max(1, lines // per_section)
+    return f"# {title}\n\n" + "\n".join(section.format(n=n) for n in range(sections))
+
+
+def korean_document(lines: int) -> str:
+    """약 ``lines`` 줄짜리 한국어 API 레퍼런스 문서 (제목·목록·표·코드 혼합)"""
+    return _document(KOREAN_SECTION, "API 레퍼런스", lines)
+
+
+def english_document(lines: int) -> str:
+    """``korean_document`` 와 같은 구조의 영어 문서"""
+    return _document(ENGLISH_SECTION, "API Reference", lines)
+
+
+TABLE_CELLS = [
+    "`block_id`",
+    "**필수**",
+    "문자열",
+    "[문서](https://developers.notion.com)",
+    "~~deprecated~~ 대신 *children* 사용",
+    "최대 100개",
+]
+
+
+def wide_table(rows: int, cols: int = 4, distinct: int = 200) -> str:
+    """``rows`` 행 × ``cols`` 열 표 (셀 내용은 ``distinct`` 가지가 반복)"""
+    header = "| " + " | ".join(f"열 {c}" for c in range(cols)) + " |"
+    lines = [header, "|" + "---|" * cols]
+    for r in range(rows):
+        k = r % distinct
+        cells = [f"`param_{k}`"] + [
+            f"{TABLE_CELLS[(k + c) % len(TABLE_CELLS)]} {k}" for c in range(1, cols)
+        ]
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+def deep_list(items: int, depth: int = 4) -> str:
+    """들여쓰기 깊이가 0 ~ ``depth - 1`` 을 오가는 ``items`` 줄짜리 중첩 목록"""
+    lines = []
+    for i in range(items):
+        level = i % depth
+        marker = "-" if level % 2 == 0 else "1."
+        lines.append(f"{'  ' * level}{marker} 항목 {i} — **굵게** 와 `코드`")
+    return "\n".join(lines)
+
+
+def long_paragraph(chars: int, korean: bool = True) -> str:
+    """짧은 문장을 이어 붙인 ``chars`` 자 안팎의 한 문단 (줄바꿈 없음)"""
+    sentence = "한국어 문장입니다. " if korean else "This is a sentence. "
+    return (sentence * (chars // len(sentence) + 1))[:chars]
+
+
+def fullwidth_text(lines: int) -> str:
+    """전각 문장부호·연속 공백이 섞인 NFD 한국어 텍스트 (정규화 대상이 있는 입력)"""
+    line = "안녕하세요！  질문이 있습니다？  시간：  오후 3시，  장소．"
+    return unicodedata.normalize("NFD", "\n".join([line] * lines))
+
+
+# ------------------------------------------------------------------ #
+# Notion API 응답 모양의 블록
+# ------------------------------------------------------------------ #
+
+def rich_text(text: str, **annotations) -> list[dict]:
+    """API 응답과 같은 필드를 가진 rich_text 리스트"""
+    return [{
+        "type": "text",
+        "text": {"content": text, "link": None},
+        "annotations": {
+            "bold": False, "italic": False, "strikethrough": False,
+            "underline": False, "code": False, "color": "default",
+            **annotations,
+        },
+        "plain_text": text,
+        "href": None,
+    }]
+
+
+def api_block(n: int, block_type: str, data: dict, children: list | None = None) -> dict:
+    """``blocks.children.list`` 결과와 같은 모양의 블록 (``children`` 은 트리 조회 후 붙는 필드)"""
+    block = {
+        "object": "block",
+        "id": f"00000000-0000-0000-0000-{n:012d}",
+        "parent": {"type": "page_id", "page_id": "page"},
+        "created_time": "2026-01-01T00:00:00.000Z",
+        "last_edited_time": "2026-01-02T00:00:00.000Z",
+        "created_by": {"object": "user", "id": "user"},
+        "last_edited_by": {"object": "user", "id": "user"},
+        "has_children": bool(children),
+        "archived": False,
+        "in_trash": False,
+        "type": block_type,
+        block_type: data,
+    }
+    if children is not None:
+        block["children"] = children
+    return block
+
+
+def api_table(rows: int, cols: int = 4, start: int = 0) -> dict:
+    """table_row 자식이 붙은 table 블록"""
+    children = [
+        api_block(start + 1 + r, "table_row", {
+            "cells": [rich_text(f"r{r}c{c}", code=c == 0) for c in range(cols)],
+        }, [])
+        for r in range(rows)
+    ]
+    return api_block(start, "table", {"table_width": cols, "has_column_header": True}, children)
+
+
+def api_export(count: int) -> list[dict]:
+    """약 ``count`` 개 블록짜리 페이지 트리 (제목·문단·목록·코드·표 반복)"""
+    blocks: list[dict] = []
+    n = 0
+    while n < count:
+        blocks.append(api_block(n, "heading_2", {"rich_text": rich_text(f"섹션 {n}")}))
+        blocks.append(api_block(n + 1, "paragraph", {
+            "rich_text": rich_text(f"문단 {n} 설명입니다. 결과는 dict 로 반환합니다.", bold=n % 2 == 0),
+        }))
+        child = api_block(n + 2, "bulleted_list_item", {"rich_text": rich_text("최대 100개")}, [])
+        blocks.append(api_block(
+            n + 3, "bulleted_list_item", {"rich_text": rich_text("인자 children")}, [child]
+        ))
+        blocks.append(api_block(n + 4, "code", {
+            "rich_text": rich_text(f"client.method_{n}(block_id='abc')"),
+            "language": "python",
+        }))
+        blocks.append(api_table(3, 3, start=n + 5))
+        blocks.append(api_block(n + 9, "divider", {}, []))
+        n += 10
+    return blocks
@@ -1,20 +1,26 @@
 from __future__ import annotations
 
-import time
-from dataclasses import dataclass, field
+import asyncio
+import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 from notion_client.errors import APIResponseError
 
-from .client import NotionClient
+from .cache import ConversionCache
+from .client import AsyncNotionClient, NotionClient
 from .exceptions import ConversionError, FileSizeError
+from .manifest import ManifestEntry, PullManifest, content_hash, write_if_changed
 from .md_to_notion import convert_file
+from .metrics import PhaseTimings, RequestMetrics
 from .notion_to_md import convert_page
+from .retry import RetryStats
 
-# Notion API 속도 제한 대응 (초당 3회 제한)
-REQUEST_INTERVAL = 0.4   # 초
+# Notion API 속도 제한 / 재시도는 NotionClient 가 요청 단위로 처리
 MAX_FILE_SIZE_MB = 5
-MAX_RETRIES = 3
 
 
 # ------------------------------------------------------------------ #
@@ -29,6 +35,9 @@ class PushResult:
     page_url: str = ""
     block_count: int = 0
     error: str = ""
+    skipped: bool = False       # 동기화 모드에서 내용이 그대로라 건너뜀
+    changes: str = ""           # 동기화 모드에서 반영한 변경 요약
+    timings: PhaseTimings = field(default_factory=PhaseTimings, repr=False, compare=False)
 
 
 @dataclass
@@ -39,6 +48,20 @@ class PullResult:
     output_path: str = ""
     block_count: int = 0
     error: str = ""
+    skipped: bool = False       # 수정되지 않아 블록 조회 없이 건너뜀
+    timings: PhaseTimings = field(default_factory=PhaseTimings, repr=False, compare=False)
+
+
+@dataclass
+class CompileResult:
+    """단일 파일 compile 결과"""
+    file: str                   # 입력 디렉토리 기준 상대 경로
+    success: bool
+    output_path: str = ""
+    block_count: int = 0
+    error: str = ""
+    skipped: bool = False       # 출력 JSON 내용이 그대로라 다시 쓰지 않음
+    timings: PhaseTimings = field(default_factory=PhaseTimings, repr=False, compare=False)
 
 
 @dataclass
@@ -47,25 +70,82 @@ class BatchReport:
     total: int = 0
     success: int = 0
     failed: int = 0
-    results: list[PushResult | PullResult] = field(default_factory=list)
+    skipped: int = 0                # 성공 중 변경이 없어 건너뛴 건수
+    retries: int = 0                # 배치 중 API 재시도 횟수
+    throttled_seconds: float = 0.0  # 재시도 대기(429 / 5xx 백오프)에 쓴 시간
+    results: list[PushResult | PullResult | CompileResult] = field(default_factory=list)
+    metrics: RequestMetrics | None = None  # 배치 중 API 요청 지표 (엔드포인트별)
 
     @property
     def success_rate(self) -> float:
         return (self.success / self.total * 100) if self.total else 0.0
 
+    def record_retries(self, stats: RetryStats) -> None:
+        self.retries = stats.retries
+        self.throttled_seconds = stats.wait_seconds
+
+    def record_client(self, client, before: _ClientSnapshot) -> None:
+        """배치 시작 시점 스냅샷 이후 클라이언트의 재시도 / 요청 지표 기록"""
+        retry_before, metrics_before = before
+        self.record_retries(client.retry_stats.since(retry_before))
+        if metrics_before is not None:
+            self.metrics = client.metrics.since(metrics_before)
+
+    @property
+    def timings(self) -> PhaseTimings:
+        """모든 결과의 단계별 소요 시간 합계"""
+        total = PhaseTimings()
+        for result in self.results:
+            total = total.combine(result.timings)
+        return total
+
+    def metrics_summary(self) -> str:
+        """요청 지표 한 줄 요약 (지표가 없으면 빈 문자열)"""
+        return self.metrics.summary() if self.metrics else ""
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "success": self.success,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "retries": self.retries,
+            "throttled_seconds": round(self.throttled_seconds, 3),
+            "results": [{**asdict(r), "timings": r.timings.to_dict()} for r in self.results],
+            "timings": self.timings.to_dict(),
+            "metrics": self.metrics.to_dict() if self.metrics else None,
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, **kwargs)
+
     def summary(self) -> str:
-        return (
+        text = (
             f"총 {self.total}건 | "
             f"성공 {self.success}건 | "
             f"실패 {self.failed}건 | "
             f"성공률 {self.success_rate:.1f}%"
         )
+        if self.skipped:
+            text += f" | 변경 없음 {self.skipped}건"
+        if self.retries:
+            text += f" | 재시도 {self.retries}회 ({self.throttled_seconds:.1f}초 대기)"
+        return text
 
 
 # ------------------------------------------------------------------ #
 # 유틸
 # ------------------------------------------------------------------ #
 
+# 배치 시작 시점의 (재시도 통계, 요청 지표) - 요청 지표가 없는 클라이언트는 None
+_ClientSnapshot = tuple[RetryStats, RequestMetrics | None]
+
+
+def _client_snapshot(client) -> _ClientSnapshot:
+    metrics = getattr(client, "metrics", None)
+    return client.retry_stats.snapshot(), (metrics.snapshot() if metrics is not None else None)
+
+
 def _check_file_size(path: Path) -> None:
     """파일 크기 제한 검사"""
     size_mb = path.stat().st_size / (1024 * 1024)
@@ -75,95 +155,157 @@ def _check_file_size(path: Path) -> None:
         )
 
 
-def _retry(func, retries: int = MAX_RETRIES, delay: float = 1.0):
-    """API 호출 재시도 래퍼 (지수 백오프)"""
-    for attempt in range(retries):
-        try:
-            return func()
-        except APIResponseError as e:
-            # 429 Rate Limit → 대기 후 재시도
-            if e.status == 429 and attempt < retries - 1:
-                wait = delay * (2 ** attempt)
-                time.sleep(wait)
-                continue
-            # 그 외 에러는 즉시 raise
-            raise
-    return None
+def _extract_title(file: Path) -> str:
+    """첫 번째 H1 을 페이지 제목으로 사용 (없으면 파일명)"""
+    with open(file, encoding="utf-8") as f:
+        for raw in f:
+            for line in raw.splitlines():
+                if line.startswith("# "):
+                    return line[2:].strip()
+    return file.stem
+
+
+def _prepare_push(
+    file: Path,
+    korean_optimize: bool,
+    timings: PhaseTimings | None = None,
+    cache: ConversionCache | None = None,
+) -> tuple[str, list[dict]]:
+    """파일 검사 + 블록 변환 + 제목 추출 (네트워크 없음)
+
+    업로드 전용 검사(파일 크기, 빈 문서)를 한 뒤 ``_convert_source`` 로 변환합니다.
+    """
+    timings = timings or PhaseTimings()
+    with timings.phase("read"):
+        _check_file_size(file)
+
+    title, blocks = _convert_source(file, korean_optimize, timings, cache)
+    if not blocks:
+        raise ConversionError("변환된 블록이 없습니다.", source=str(file))
+    return title, blocks
+
+
+def _convert_source(
+    file: Path,
+    korean_optimize: bool,
+    timings: PhaseTimings,
+    cache: ConversionCache | None = None,
+) -> tuple[str, list[dict]]:
+    """블록 변환 + 제목 추출 (검사 없음, 빈 문서는 빈 목록)
+
+    ``cache`` 가 있으면 내용이 그대로인 파일은 파싱 없이 저장된 블록을 씁니다.
+    """
+    convert = cache.convert_file if cache else convert_file
+    blocks = convert(str(file), korean_optimize=korean_optimize, timings=timings)
+
+    with timings.phase("read"):
+        return _extract_title(file), blocks
+
+
+def _page_url(page_id: str) -> str:
+    return f"https://www.notion.so/{page_id.replace('-', '')}"
+
+
+def _push_error(e: Exception) -> str:
+    """push 실패 예외 → 결과 메시지"""
+    if isinstance(e, FileSizeError):
+        return f"[크기 초과] {e}"
+    if isinstance(e, ConversionError):
+        return f"[변환 실패] {e}"
+    if isinstance(e, APIResponseError):
+        return f"[API 오류 {e.status}] {e}"
+    return f"[알 수 없는 오류] {e}"
+
+
+def _pull_error(e: Exception) -> str:
+    """pull 실패 예외 → 결과 메시지"""
+    if isinstance(e, APIResponseError):
+        return f"[API 오류 {e.status}] {e}"
+    return f"[알 수 없는 오류] {e}"
+
+
+def _unique_output_path(output_dir: Path, title: str, fallback: str) -> Path:
+    """파일명으로 쓸 수 없는 문자를 제거하고, 중복 시 _1, _2 … 접미사 부여"""
+    safe_title = "".join(
+        c for c in title if c not in r'\/:*?"<>|'
+    ).strip() or fallback
+    output_path = output_dir / f"{safe_title}.md"
+
+    counter = 1
+    while output_path.exists():
+        output_path = output_dir / f"{safe_title}_{counter}.md"
+        counter += 1
+    return output_path
 
 
 # ------------------------------------------------------------------ #
 # 배치 Push (md → Notion)
 # ------------------------------------------------------------------ #
 
+def _push_one(
+    file: Path,
+    client: NotionClient,
+    parent_id: str,
+    korean_optimize: bool,
+    cache: ConversionCache | None = None,
+) -> PushResult:
+    """파일 하나 변환 + 업로드 (예외는 결과에 기록)"""
+    result = PushResult(file=file.name, success=False)
+
+    try:
+        title, blocks = _prepare_push(file, korean_optimize, result.timings, cache)
+
+        # Notion 업로드 (첫 청크는 페이지 생성 요청에 포함, 재시도는 클라이언트가 처리)
+        with result.timings.phase("api"):
+            page = client.create_page(parent_id, title, children=blocks)
+
+        result.success = True
+        result.page_url = _page_url(page["id"])
+        result.block_count = len(blocks)
+
+    except Exception as e:
+        result.error = _push_error(e)
+
+    return result
+
+
 def batch_push(
     files: list[Path],
     client: NotionClient,
     parent_id: str,
     korean_optimize: bool = True,
     on_progress=None,  # 콜백: (current, total, result) → None
+    workers: int = 1,
+    cache: ConversionCache | None = None,
 ) -> BatchReport:
-    """마크다운 파일 목록을 Notion에 일괄 업로드"""
-    report = BatchReport(total=len(files))
+    """마크다운 파일 목록을 Notion에 일괄 업로드
 
-    for idx, file in enumerate(files):
-        result = PushResult(file=file.name, success=False)
-
-        try:
-            # 파일 크기 검사
-            _check_file_size(file)
-
-            # 마크다운 → 블록 변환
-            blocks = convert_file(str(file), korean_optimize=korean_optimize)
-            if not blocks:
-                raise ConversionError("변환된 블록이 없습니다.", source=str(file))
-
-            # 제목 추출
-            title = file.stem
-            content = file.read_text(encoding="utf-8")
-            for line in content.splitlines():
-                if line.startswith("# "):
-                    title = line[2:].strip()
-                    break
+    ``workers`` 가 2 이상이면 워커 풀에서 파일별 파싱과 업로드를 겹쳐 실행합니다.
+    요청 속도는 클라이언트의 속도 제한기가 함께 관리하며,
+    ``on_progress`` 호출과 ``report.results`` 는 항상 입력 순서를 따릅니다.
+    ``cache`` 를 주면 내용이 바뀌지 않은 파일은 변환 결과를 캐시에서 읽습니다.
+    """
+    report = BatchReport(total=len(files))
+    before = _client_snapshot(client)
 
-            # Notion 업로드 (재시도 포함)
-            page = _retry(
-                lambda: client.create_page(parent_id, title, children=blocks[:100])
-            )
-            page_id = page["id"]
-
-            # 100블록 초과분 추가
-            if len(blocks) > 100:
-                for i in range(100, len(blocks), 100):
-                    chunk = blocks[i:i + 100]
-                    _retry(lambda: client.append_blocks(page_id, chunk))
-                    time.sleep(REQUEST_INTERVAL)
-
-            result.success = True
-            result.page_url = f"https://www.notion.so/{page_id.replace('-', '')}"
-            result.block_count = len(blocks)
-            report.success += 1
-
-        except FileSizeError as e:
-            result.error = f"[크기 초과] {e}"
-            report.failed += 1
-        except ConversionError as e:
-            result.error = f"[변환 실패] {e}"
-            report.failed += 1
-        except APIResponseError as e:
-            result.error = f"[API 오류 {e.status}] {e}"
-            report.failed += 1
-        except Exception as e:
-            result.error = f"[알 수 없는 오류] {e}"
-            report.failed += 1
+    def push(file: Path) -> PushResult:
+        return _push_one(file, client, parent_id, korean_optimize, cache)
 
-        report.results.append(result)
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        # 단일 워커는 스레드 없이 순차 처리
+        results = pool.map(push, files) if workers > 1 else map(push, files)
 
-        if on_progress:
-            on_progress(idx + 1, len(files), result)
+        for idx, result in enumerate(results):
+            if result.success:
+                report.success += 1
+            else:
+                report.failed += 1
+            report.results.append(result)
 
-        # API 속도 제한 대응
-        time.sleep(REQUEST_INTERVAL)
+            if on_progress:
+                on_progress(idx + 1, len(files), result)
 
+    report.record_client(client, before)
     return report
 
 
@@ -171,57 +313,362 @@ def batch_push(
 # 배치 Pull (Notion → md)
 # ------------------------------------------------------------------ #
 
+def _fetch_page(
+    client: NotionClient,
+    page_id: str,
+    manifest: PullManifest | None = None,
+    timings: PhaseTimings | None = None,
+) -> tuple[dict, list[dict] | None, str | None]:
+    """페이지 메타 + 블록 트리 조회 후 마크다운 변환
+
+    매니페스트 기준으로 변경이 없으면 블록 조회·변환 없이 (page, None, None) 반환
+    """
+    timings = timings or PhaseTimings()
+    with timings.phase("api"):
+        page = client.get_page(page_id)
+        if manifest and manifest.is_current(page_id, page):
+            return page, None, None
+        blocks = client.get_block_children(
+            page_id, last_edited_time=page.get("last_edited_time"), compact=True
+        )
+    with timings.phase("convert"):
+        return page, blocks, convert_page(page, blocks)
+
+
+def _pull_output_path(
+    output_dir: Path,
+    title: str,
+    page_id: str,
+    manifest: PullManifest | None,
+) -> Path:
+    """이전에 받은 페이지는 같은 파일에, 제목이 바뀌었으면 새 파일명으로 옮김"""
+    entry = manifest.get(page_id) if manifest else None
+    if entry:
+        previous = manifest.output_path(entry)
+        if entry.title == title:
+            return previous
+        previous.unlink(missing_ok=True)
+    return _unique_output_path(output_dir, title, page_id)
+
+
 def batch_pull(
     page_ids: list[str],
     client: NotionClient,
     output_dir: Path,
     on_progress=None,
+    workers: int = 1,
+    manifest: PullManifest | None = None,
+    force: bool = False,
 ) -> BatchReport:
-    """Notion 페이지 목록을 마크다운 파일로 일괄 추출"""
+    """Notion 페이지 목록을 마크다운 파일로 일괄 추출
+
+    ``workers`` 가 2 이상이면 페이지 조회·변환을 워커 풀에서 겹쳐 실행합니다.
+    파일 쓰기와 파일명 중복 처리는 입력 순서대로 한 곳에서 하므로
+    같은 제목의 페이지도 항상 같은 파일명(_1, _2 …)을 받습니다.
+
+    ``manifest`` 를 주면 ``last_edited_time`` 이 그대로이고 출력 파일도 바뀌지 않은
+    페이지는 블록 조회·변환·파일 쓰기를 모두 건너뜁니다 (``force`` 면 전부 다시 받음).
+    내용이 같은 파일은 다시 쓰지 않으므로 mtime 이 유지됩니다.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
     report = BatchReport(total=len(page_ids))
+    before = _client_snapshot(client)
+    clean_ids = [NotionClient.extract_page_id(raw_id) for raw_id in page_ids]
+    check = None if force else manifest
 
-    for idx, raw_id in enumerate(page_ids):
-        clean_id = NotionClient.extract_page_id(raw_id)
-        result = PullResult(page_id=clean_id, success=False)
-
+    def fetch(page_id: str):
+        timings = PhaseTimings()
         try:
-            page = _retry(lambda: client.get_page(clean_id))
-            blocks = client.get_block_children(clean_id)
-            markdown = convert_page(page, blocks)
-
-            # 파일명 결정
-            title = client.get_page_title(page)
-            safe_title = "".join(
-                c for c in title if c not in r'\/:*?"<>|'
-            ).strip() or clean_id
-            output_path = output_dir / f"{safe_title}.md"
-
-            # 파일명 중복 처리
-            counter = 1
-            while output_path.exists():
-                output_path = output_dir / f"{safe_title}_{counter}.md"
-                counter += 1
-
-            output_path.write_text(markdown, encoding="utf-8")
-
-            result.success = True
-            result.output_path = str(output_path)
-            result.block_count = len(blocks)
-            report.success += 1
-
-        except APIResponseError as e:
-            result.error = f"[API 오류 {e.status}] {e}"
-            report.failed += 1
+            return _fetch_page(client, page_id, check, timings), None, timings
         except Exception as e:
-            result.error = f"[알 수 없는 오류] {e}"
-            report.failed += 1
+            return None, e, timings
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+            fetched = pool.map(fetch, clean_ids) if workers > 1 else map(fetch, clean_ids)
+
+            for idx, (clean_id, (data, error, timings)) in enumerate(zip(clean_ids, fetched)):
+                result = PullResult(page_id=clean_id, success=False, timings=timings)
+
+                try:
+                    if error:
+                        raise error
+                    page, blocks, markdown = data
+
+                    if blocks is None:
+                        entry = manifest.get(clean_id)
+                        result.skipped = True
+                        result.output_path = str(manifest.output_path(entry))
+                        result.block_count = entry.block_count
+                        report.skipped += 1
+                    else:
+                        title = client.get_page_title(page)
+                        output_path = _pull_output_path(output_dir, title, clean_id, manifest)
+                        with timings.phase("write"):
+                            write_if_changed(output_path, markdown)
+                        if manifest:
+                            manifest.set(clean_id, ManifestEntry(
+                                last_edited_time=page.get("last_edited_time", ""),
+                                path=manifest.relative(output_path),
+                                hash=content_hash(markdown),
+                                title=title,
+                                block_count=len(blocks),
+                            ))
+                        result.output_path = str(output_path)
+                        result.block_count = len(blocks)
+
+                    result.success = True
+                    report.success += 1
+
+                except Exception as e:
+                    result.error = _pull_error(e)
+                    report.failed += 1
+
+                report.results.append(result)
+
+                if on_progress:
+                    on_progress(idx + 1, len(page_ids), result)
+    finally:
+        if manifest:
+            manifest.save()
+
+    report.record_client(client, before)
+    return report
+
+
+# ------------------------------------------------------------------ #
+# 배치 컴파일 (md → 블록 JSON, 네트워크 없음)
+# ------------------------------------------------------------------ #
+
+# 프로세스 풀 워커마다 한 번 여는 변환 캐시 (SQLite 연결은 프로세스 간 공유 불가)
+_worker_cache: ConversionCache | None = None
+
+
+def _init_compile_worker(cache_dir: str | None) -> None:
+    global _worker_cache
+    try:
+        _worker_cache = ConversionCache(cache_dir) if cache_dir else None
+    except sqlite3.Error:
+        # 캐시를 열지 못해도 변환은 할 수 있음
+        _worker_cache = None
+
+
+def _compile_one(
+    task: tuple[Path, Path, str, bool],
+    cache: ConversionCache | None = None,
+) -> CompileResult:
+    """파일 하나 변환 + 블록 JSON 저장 (예외는 결과에 기록)
+
+    업로드하지 않으므로 크기 제한·빈 문서 검사는 하지 않습니다 (빈 문서는 ``[]``).
+    JSON 은 워커가 직접 쓰고, 부모 프로세스에는 작은 결과만 돌려보냅니다.
+    """
+    source, target, name, korean_optimize = task
+    result = CompileResult(file=name, success=False, output_path=str(target))
+
+    try:
+        title, blocks = _convert_source(source, korean_optimize, result.timings, cache)
+        with result.timings.phase("write"):
+            text = json.dumps(
+                {"source": name, "title": title, "children": blocks},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            target.parent.mkdir(parents=True, exist_ok=True)
+            result.skipped = not write_if_changed(target, text)
+
+        result.success = True
+        result.block_count = len(blocks)
+
+    except Exception as e:
+        result.error = _push_error(e)
+
+    return result
+
+
+def _compile_in_worker(task: tuple[Path, Path, str, bool]) -> CompileResult:
+    return _compile_one(task, _worker_cache)
+
+
+def compile_tree(
+    directory: str | Path,
+    out_dir: str | Path,
+    pattern: str = "**/*.md",
+    korean_optimize: bool = True,
+    on_progress=None,  # 콜백: (current, total, result) → None
+    jobs: int | None = None,
+    cache_dir: str | Path | None = None,
+) -> BatchReport:
+    """디렉토리의 마크다운 파일을 Notion 블록 JSON 으로 일괄 변환
+
+    ``directory`` 기준 상대 경로를 유지해 ``out_dir`` 에 ``.json`` 으로 저장합니다.
+    파일마다 ``{"source", "title", "children"}`` 객체이며, ``children`` 은
+    ``create_page`` 에 그대로 넘길 수 있는 블록 목록입니다.
+
+    변환은 CPU 작업이므로 ``jobs`` 개 프로세스(기본: CPU 코어 수)에 나눠 실행합니다.
+    ``jobs`` 가 1이면 현재 프로세스에서 순차 처리합니다.
+    ``cache_dir`` 를 주면 워커마다 같은 디렉토리의 변환 캐시를 엽니다.
+    ``on_progress`` 호출과 ``report.results`` 는 항상 입력 순서를 따릅니다.
+    """
+    directory, out_dir = Path(directory), Path(out_dir)
+    files = sorted(p for p in directory.glob(pattern) if p.is_file())
+    tasks = []
+    for file in files:
+        relative = file.relative_to(directory)
+        tasks.append(
+            (file, out_dir / relative.with_suffix(".json"), relative.as_posix(), korean_optimize)
+        )
+
+    jobs = jobs or os.cpu_count() or 1
+    report = BatchReport(total=len(tasks))
+
+    def collect(results) -> None:
+        for idx, result in enumerate(results):
+            if result.success:
+                report.success += 1
+                if result.skipped:
+                    report.skipped += 1
+            else:
+                report.failed += 1
+            report.results.append(result)
+
+            if on_progress:
+                on_progress(idx + 1, len(tasks), result)
+
+    if jobs == 1 or len(tasks) <= 1:
+        cache = ConversionCache(cache_dir) if cache_dir else None
+        try:
+            collect(_compile_one(task, cache) for task in tasks)
+        finally:
+            if cache:
+                cache.close()
+        return report
+
+    if cache_dir:
+        # DB 생성·WAL 전환은 부모에서 한 번만 (워커가 동시에 하면 잠금 충돌)
+        ConversionCache(cache_dir).close()
+
+    # 작은 파일이 많으면 프로세스 간 왕복이 커지므로 여러 파일씩 묶어 보냄
+    chunksize = max(1, len(tasks) // (jobs * 8))
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(tasks)),
+        initializer=_init_compile_worker,
+        initargs=(str(cache_dir) if cache_dir else None,),
+    ) as pool:
+        collect(pool.map(_compile_in_worker, tasks, chunksize=chunksize))
 
-        report.results.append(result)
+    return report
+
+
+# ------------------------------------------------------------------ #
+# 비동기 배치 (AsyncNotionClient)
+# ------------------------------------------------------------------ #
+
+async def _gather_in_order(coros, total: int, on_progress) -> list:
+    """코루틴을 동시에 실행하고 입력 순서대로 결과 반환 (진행 콜백은 완료 순)"""
+    done = 0
 
+    async def run(coro):
+        nonlocal done
+        result = await coro
+        done += 1
         if on_progress:
-            on_progress(idx + 1, len(page_ids), result)
+            on_progress(done, total, result)
+        return result
+
+    return await asyncio.gather(*(run(c) for c in coros))
+
 
-        time.sleep(REQUEST_INTERVAL)
+def _build_report(results: list[PushResult | PullResult]) -> BatchReport:
+    report = BatchReport(total=len(results), results=list(results))
+    report.success = sum(1 for r in results if r.success)
+    report.failed = report.total - report.success
+    return report
+
+
+async def async_batch_push(
+    files: list[Path],
+    client: AsyncNotionClient,
+    parent_id: str,
+    korean_optimize: bool = True,
+    on_progress=None,  # 콜백: (completed, total, result) → None
+    concurrency: int = 8,
+    cache: ConversionCache | None = None,
+) -> BatchReport:
+    """마크다운 파일 목록을 Notion에 동시 업로드
 
-    return report
\ No newline at end of file
+    최대 ``concurrency`` 개 파일을 동시에 처리하며, 요청 속도는
+    클라이언트의 ``RateLimiter`` 하나로 함께 제한됩니다.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    before = _client_snapshot(client)
+
+    async def push_one(file: Path) -> PushResult:
+        result = PushResult(file=file.name, success=False)
+        async with semaphore:
+            try:
+                # 파싱은 CPU 작업이므로 이벤트 루프 밖에서 실행
+                title, blocks = await asyncio.to_thread(
+                    _prepare_push, file, korean_optimize, result.timings, cache
+                )
+                with result.timings.phase("api"):
+                    page = await client.create_page(parent_id, title, children=blocks)
+
+                result.success = True
+                result.page_url = _page_url(page["id"])
+                result.block_count = len(blocks)
+            except Exception as e:
+                result.error = _push_error(e)
+        return result
+
+    results = await _gather_in_order(
+        (push_one(f) for f in files), len(files), on_progress
+    )
+    report = _build_report(results)
+    report.record_client(client, before)
+    return report
+
+
+async def async_batch_pull(
+    page_ids: list[str],
+    client: AsyncNotionClient,
+    output_dir: Path,
+    on_progress=None,
+    concurrency: int = 8,
+) -> BatchReport:
+    """Notion 페이지 목록을 마크다운 파일로 동시 추출"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(concurrency)
+    before = _client_snapshot(client)
+
+    async def pull_one(raw_id: str) -> PullResult:
+        clean_id = NotionClient.extract_page_id(raw_id)
+        result = PullResult(page_id=clean_id, success=False)
+        async with semaphore:
+            try:
+                timings = result.timings
+                with timings.phase("api"):
+                    page = await client.get_page(clean_id)
+                    blocks = await client.get_block_children(clean_id, compact=True)
+                markdown = await asyncio.to_thread(
+                    timings.wrap("convert", convert_page), page, blocks
+                )
+
+                # 경로 결정과 쓰기 사이에 await 가 없어야 파일명 중복 검사가 안전함
+                title = client.get_page_title(page)
+                output_path = _unique_output_path(output_dir, title, clean_id)
+                with timings.phase("write"):
+                    output_path.write_text(markdown, encoding="utf-8")
+
+                result.success = True
+                result.output_path = str(output_path)
+                result.block_count = len(blocks)
+            except Exception as e:
+                result.error = _pull_error(e)
+        return result
+
+    results = await _gather_in_order(
+        (pull_one(p) for p in page_ids), len(page_ids), on_progress
+    )
+    report = _build_report(results)
+    report.record_client(client, before)
+    return report
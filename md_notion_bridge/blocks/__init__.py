@@ -1,8 +1,11 @@
 from .code import build_code_block, parse_code_block
+from .compact import CompactBlock, compact_block
 from .image import build_image_block, parse_image_block_with_warning
 from .table import build_table_blocks, parse_table_block
 
 __all__ = [
+    "CompactBlock",
+    "compact_block",
     "build_code_block",
     "parse_code_block",
     "build_image_block",
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from ..utils.korean import LINE_BOUNDARY, split_long_text
+
 # Notion이 지원하는 언어 목록 (지원 외 언어는 plain text로 대체)
 SUPPORTED_LANGUAGES = {
     "abap", "arduino", "bash", "basic", "c", "clojure", "coffeescript",
@@ -24,11 +26,16 @@ def build_code_block(code: str, language: str = "") -> dict:
     
     # 빈 코드블록 안전 처리
     content = code if code.strip() else " "
-    
+    # 2000자 제한 - 긴 코드는 줄 단위로 나눠 rich_text 여러 개로
+    rich_text = [
+        {"type": "text", "text": {"content": chunk}}
+        for chunk in split_long_text(content, boundary=LINE_BOUNDARY)
+    ]
+
     return {
         "type": "code",
         "code": {
-            "rich_text": [{"type": "text", "text": {"content": content}}],
+            "rich_text": rich_text,
             "language": lang,
         },
     }
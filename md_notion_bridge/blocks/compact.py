@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import Any
+
+# 변환기가 읽는 rich_text 어노테이션 (color 등은 마크다운으로 표현하지 않음)
+_ANNOTATIONS = ("bold", "italic", "strikethrough", "underline", "code")
+# 블록 데이터 중 rich_text 리스트를 담는 키
+_RICH_TEXT_KEYS = ("rich_text", "caption")
+
+
+class CompactBlock:
+    """변환에 필요한 필드만 담는 가벼운 블록 표현
+
+    API 응답 블록(``object``, ``created_by``, ``parent`` 등 10여 개 키 + rich_text마다
+    ``text`` / ``annotations`` 딕셔너리)을 그대로 들고 있는 대신, 블록 타입·데이터·
+    자식 조회에 쓰는 ID만 슬롯에 보관합니다. rich_text는 ``plain_text``, 켜진 어노테이션,
+    ``href`` 만 남깁니다.
+
+    ``block["type"]``, ``block[block_type]``, ``block.get("children", [])`` 처럼
+    원본 딕셔너리와 같은 방식으로 읽을 수 있어 기존 변환 함수에 그대로 넘길 수 있습니다.
+    """
+
+    __slots__ = ("type", "data", "id", "has_children", "last_edited_time", "children")
+
+    def __init__(
+        self,
+        type: str,
+        data: dict,
+        id: str = "",
+        has_children: bool = False,
+        last_edited_time: str | None = None,
+        children: list | None = None,
+    ) -> None:
+        self.type = type
+        self.data = data
+        self.id = id
+        self.has_children = has_children
+        self.last_edited_time = last_edited_time
+        self.children = children
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == self.type:
+            return self.data
+        if key in _FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == self.type:
+            self.data = value
+        elif key in _FIELDS:
+            setattr(self, key, value)
+        else:
+            raise KeyError(key)
+
+    def to_dict(self) -> dict:
+        """원본과 같은 모양의 딕셔너리 (축약된 rich_text 포함)"""
+        result: dict = {"type": self.type, self.type: self.data}
+        if self.id:
+            result["id"] = self.id
+        if self.has_children:
+            result["has_children"] = True
+        if self.last_edited_time:
+            result["last_edited_time"] = self.last_edited_time
+        if self.children is not None:
+            result["children"] = [
+                c.to_dict() if isinstance(c, CompactBlock) else c for c in self.children
+            ]
+        return result
+
+    def __repr__(self) -> str:
+        return f"CompactBlock(type={self.type!r}, id={self.id!r})"
+
+
+# 딕셔너리 키처럼 읽고 쓸 수 있는 슬롯 (``data`` 는 ``block[block_type]`` 으로 접근)
+_FIELDS = frozenset(("type", "id", "has_children", "last_edited_time", "children"))
+
+
+def _compact_rich_text(rich_texts: list[dict]) -> list[dict]:
+    result = []
+    for rt in rich_texts:
+        item: dict = {"plain_text": rt.get("plain_text", "")}
+        annotations = rt.get("annotations")
+        if annotations:
+            on = {k: True for k in _ANNOTATIONS if annotations.get(k)}
+            if on:
+                item["annotations"] = on
+        if rt.get("href"):
+            item["href"] = rt["href"]
+        result.append(item)
+    return result
+
+
+def compact_block(block: dict) -> CompactBlock:
+    """API 응답 블록 → ``CompactBlock`` (``children`` 이 붙어 있으면 하위 트리까지 변환)"""
+    if isinstance(block, CompactBlock):
+        return block
+    block_type = block.get("type", "")
+    data = block.get(block_type)
+    if isinstance(data, dict):
+        data = dict(data)
+        for key in _RICH_TEXT_KEYS:
+            if key in data:
+                data[key] = _compact_rich_text(data[key])
+        if "cells" in data:
+            data["cells"] = [_compact_rich_text(cell) for cell in data["cells"]]
+    else:
+        data = {}
+    children = block.get("children")
+    return CompactBlock(
+        block_type,
+        data,
+        block.get("id", ""),
+        bool(block.get("has_children")),
+        block.get("last_edited_time"),
+        children if children is None else [compact_block(c) for c in children],
+    )
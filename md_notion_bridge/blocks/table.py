@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 
-def build_table_blocks(rows: list[list[str]], has_header: bool = True) -> dict:
+def build_table_blocks(
+    rows: list[list[str]],
+    has_header: bool = True,
+    parse_cell=None,    # 셀 텍스트 → rich_text (기본값: parse_inline)
+) -> dict:
     """마크다운 표 rows → Notion table 블록"""
+    if parse_cell is None:
+        from ..md_to_notion import parse_inline as parse_cell
+
     table_rows = []
-    for i, row in enumerate(rows):
-        cells = []
-        for cell in row:
-            from ..md_to_notion import parse_inline
-            cells.append(parse_inline(cell.strip()))
+    for row in rows:
+        cells = [parse_cell(cell.strip()) for cell in row]
         table_rows.append({
             "type": "table_row",
             "table_row": {"cells": cells},
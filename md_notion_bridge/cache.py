@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from . import __version__
+from .md_to_notion import CONVERTER_VERSION, _phase, convert
+
+if TYPE_CHECKING:
+    from .metrics import PhaseTimings
+
+
+def default_cache_dir() -> Path:
+    """기본 캐시 디렉토리 (``$XDG_CACHE_HOME/md-notion``, 없으면 ``~/.cache/md-notion``)"""
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "md-notion"
+
+
+# ------------------------------------------------------------------ #
+# 블록 자식 목록 캐시 (pull)
+# ------------------------------------------------------------------ #
+
+class BlockCache:
+    """블록 자식 목록 디스크 캐시 (SQLite)
+
+    ``blocks.children.list`` 로 받은 원본 블록 JSON을 부모 블록 ID와
+    시각 키로 저장합니다. 키가 그대로면 API 호출 없이 저장된 자식 목록을 돌려줍니다.
+
+    Notion은 페이지 안의 블록이 바뀌면 페이지의 ``last_edited_time`` 을 갱신하지만,
+    중첩 블록은 손자 블록만 수정된 경우 중간 부모의 수정 시각이 바뀌지 않습니다.
+    그래서 ``NotionClient`` 는 하위 블록의 자식 목록도 페이지(루트)의 수정 시각을
+    키로 저장하고, 페이지 시각이 바뀌면 트리 전체를 다시 조회합니다.
+    """
+
+    FILENAME = "blocks.sqlite3"
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.directory / self.FILENAME, check_same_thread=False
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS block_children ("
+            " block_id TEXT PRIMARY KEY,"
+            " last_edited_time TEXT NOT NULL,"
+            " children TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, block_id: str, last_edited_time: str) -> list[dict] | None:
+        """수정 시각이 일치하는 자식 목록 반환 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT children FROM block_children"
+                " WHERE block_id = ? AND last_edited_time = ?",
+                (block_id, last_edited_time),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, block_id: str, last_edited_time: str, children: list[dict]) -> None:
+        """자식 목록 저장 (같은 블록의 이전 버전은 교체)"""
+        data = json.dumps(children, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO block_children"
+                " (block_id, last_edited_time, children) VALUES (?, ?, ?)",
+                (block_id, last_edited_time, data),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM block_children")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ------------------------------------------------------------------ #
+# 마크다운 변환 결과 캐시 (push)
+# ------------------------------------------------------------------ #
+
+class ConversionCache:
+    """마크다운 → 블록 변환 결과 디스크 캐시 (SQLite, 내용 주소 기반)
+
+    파일 내용 해시 + ``korean_optimize`` + 파서 엔진 + 변환기 버전을 키로
+    ``convert_file`` 결과(블록 JSON)를 저장합니다. 내용이 그대로인 파일은
+    정규화·파싱 없이 저장된 블록을 돌려줍니다. 경로는 키에 들어가지 않으므로
+    이름만 바뀐 파일이나 내용이 같은 파일도 적중합니다.
+
+    저장된 JSON 크기 합이 ``max_bytes`` 를 넘으면 가장 오래 쓰지 않은 항목부터 지웁니다.
+    크기 합은 저장할 때마다 DB에서 다시 세므로 여러 프로세스(compile 워커)가
+    같은 디렉토리를 열어도 제한은 전체에 한 번만 적용됩니다.
+    ``convert_file`` 은 DB 오류(다른 프로세스의 잠금 등)가 나면 캐시 없이 변환합니다.
+    """
+
+    FILENAME = "conversions.sqlite3"
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0                 # convert_file 에서 무시한 DB 오류 수
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.directory / self.FILENAME, check_same_thread=False
+        )
+        # 적중할 때마다 사용 시각을 쓰므로 커밋이 가벼운 WAL 모드 사용
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS conversions ("
+            " key TEXT PRIMARY KEY,"
+            " blocks TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS conversions_last_used ON conversions (last_used)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key(data: bytes, korean_optimize: bool, engine: str = "line") -> str:
+        """파일 내용(바이트)과 변환 옵션 → 캐시 키"""
+        digest = hashlib.sha256(data)
+        digest.update(
+            f"\0{int(korean_optimize)}\0{engine}\0{__version__}\0{CONVERTER_VERSION}".encode()
+        )
+        return digest.hexdigest()
+
+    @property
+    def size(self) -> int:
+        """저장된 블록 JSON 크기 합 (바이트)"""
+        with self._lock:
+            return self._total()
+
+    def _total(self) -> int:
+        return self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM conversions"
+        ).fetchone()[0]
+
+    def get(self, key: str) -> list[dict] | None:
+        """저장된 블록 목록 반환 (없으면 None). 적중하면 최근 사용 시각 갱신"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT blocks FROM conversions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            try:
+                self._conn.execute(
+                    "UPDATE conversions SET last_used = ? WHERE key = ?", (time.time(), key)
+                )
+                self._conn.commit()
+            except sqlite3.Error:
+                # 다른 프로세스가 쓰는 중 - 사용 시각만 못 남기고 결과는 그대로 사용
+                self._conn.rollback()
+        return json.loads(row[0])
+
+    def put(self, key: str, blocks: list[dict]) -> None:
+        """블록 목록 저장 후 크기 제한을 넘으면 오래된 항목부터 제거
+
+        ``max_bytes`` 보다 큰 결과 하나는 저장하지 않습니다.
+        """
+        data = json.dumps(blocks, ensure_ascii=False, separators=(",", ":"))
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            try:
+                # INSERT 부터 커밋까지 쓰기 잠금을 쥐므로 다른 프로세스와 섞이지 않음
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO conversions (key, blocks, size, last_used)"
+                    " VALUES (?, ?, ?, ?)",
+                    (key, data, size, time.time()),
+                )
+                self._evict(self._total())
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+                raise
+
+    def _evict(self, total: int) -> None:
+        """LRU 제거 (잠금·트랜잭션 안에서 호출)"""
+        while total > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM conversions ORDER BY last_used LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM conversions WHERE key = ?", (key,))
+                total -= size
+                self.evictions += 1
+
+    def convert_file(
+        self,
+        path: str | Path,
+        korean_optimize: bool = True,
+        timings: PhaseTimings | None = None,
+        engine: str = "line",
+    ) -> list[dict]:
+        """``md_to_notion.convert_file`` 과 같은 결과 - 내용이 같으면 캐시에서 읽음"""
+        with _phase(timings, "read"):
+            data = Path(path).read_bytes()
+            key = self.key(data, korean_optimize, engine)
+            try:
+                blocks = self.get(key)
+            except sqlite3.Error:
+                with self._lock:
+                    self.errors += 1
+                blocks = None
+        if blocks is not None:
+            return blocks
+
+        with _phase(timings, "read"):
+            # open(..., encoding="utf-8") 텍스트 모드와 같은 줄바꿈 변환
+            markdown = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        blocks = convert(markdown, korean_optimize=korean_optimize, timings=timings, engine=engine)
+        try:
+            self.put(key, blocks)
+        except sqlite3.Error:
+            with self._lock:
+                self.errors += 1
+        return blocks
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM conversions")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+
+from .config import config
+
+# Notion API 요청 단위 제한
+MAX_BLOCKS_PER_REQUEST = 1000   # 요청 하나에 담을 수 있는 블록 수 (중첩 포함)
+MAX_PAYLOAD_BYTES = 450_000     # 요청 본문 500KB 제한에서 여유분을 뺀 값
+MAX_NESTING = 2                 # 요청 하나에서 허용되는 자식 중첩 단계
+
+
+@dataclass
+class Chunk:
+    """``blocks.children.append`` 한 번에 보낼 블록 묶음"""
+    blocks: list[dict] = field(default_factory=list)
+    # 청크 내 위치 → 생성된 블록 ID에 나중에 추가할 자식 블록
+    deferred: dict[int, list[dict]] = field(default_factory=dict)
+    elements: int = 0
+    size: int = 0
+
+
+@dataclass
+class _Measure:
+    count: int      # 자신 포함 하위 블록 수
+    depth: int      # 자식 중첩 단계 (자식 없으면 0)
+    size: int       # 직렬화 크기 (bytes)
+    widest: int     # 하위 트리에서 가장 긴 children 배열 길이
+
+
+def _children(block: dict) -> list[dict]:
+    data = block.get(block.get("type", ""))
+    if not isinstance(data, dict):
+        return []
+    return data.get("children") or []
+
+
+def _with_children(block: dict, children: list[dict]) -> dict:
+    """children 만 바꾼 얕은 복사본 (원본 블록은 건드리지 않음)"""
+    block_type = block["type"]
+    data = dict(block[block_type])
+    if children:
+        data["children"] = children
+    else:
+        data.pop("children", None)
+    return {**block, block_type: data}
+
+
+def _json_size(obj: dict) -> int:
+    return len(json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def _measure(block: dict) -> _Measure:
+    children = _children(block)
+    if not children:
+        return _Measure(1, 0, _json_size(block), 0)
+
+    m = _Measure(1, 0, _json_size(_with_children(block, [])), len(children))
+    for child in children:
+        c = _measure(child)
+        m.count += c.count
+        m.depth = max(m.depth, c.depth + 1)
+        m.size += c.size + 1
+        m.widest = max(m.widest, c.widest)
+    return m
+
+
+def _fits(m: _Measure, max_children: int, max_elements: int, max_bytes: int) -> bool:
+    return (
+        m.depth <= MAX_NESTING
+        and m.widest <= max_children
+        and m.count <= max_elements
+        and m.size <= max_bytes
+    )
+
+
+def _split(
+    block: dict,
+    max_children: int,
+    max_elements: int,
+    max_bytes: int,
+) -> tuple[dict, list[dict], _Measure]:
+    """최상위 블록 → (이번 요청에 담을 블록, 후속 요청으로 미룰 자식, 크기)
+
+    자식은 앞에서부터 제한 안에 들어가는 만큼만 남기고 나머지는 미룹니다.
+    순서를 지키기 위해 중간에 하나라도 넘치면 그 뒤 자식은 모두 미룹니다.
+    """
+    m = _measure(block)
+    if _fits(m, max_children, max_elements, max_bytes):
+        return block, [], m
+
+    children = _children(block)
+    # 표는 생성 시 행이 최소 1개 있어야 함
+    keep_min = 1 if block["type"] == "table" else 0
+
+    head = _measure(_with_children(block, []))
+    inline: list[dict] = []
+    for child in children[:max_children]:
+        c = _measure(child)
+        fits = (
+            c.depth + 1 <= MAX_NESTING
+            and c.widest <= max_children
+            and head.count + c.count <= max_elements
+            and head.size + c.size + 1 <= max_bytes
+        )
+        if not fits and len(inline) >= keep_min:
+            break
+        inline.append(child)
+        head.count += c.count
+        head.depth = max(head.depth, c.depth + 1)
+        head.size += c.size + 1
+
+    return _with_children(block, inline), children[len(inline):], head
+
+
+def plan_chunks(
+    children: list[dict],
+    max_children: int | None = None,
+    max_elements: int = MAX_BLOCKS_PER_REQUEST,
+    max_bytes: int = MAX_PAYLOAD_BYTES,
+) -> list[Chunk]:
+    """블록 리스트 → API 요청 단위 청크 목록
+
+    최상위 블록 수(``config.chunk_size``), 중첩 포함 블록 수, 직렬화 크기,
+    중첩 단계 제한 안에서 요청 하나에 최대한 많은 블록을 담습니다.
+    제한을 넘는 자식은 ``Chunk.deferred`` 에 담겨 부모 블록 생성 후 추가됩니다.
+    """
+    max_children = max_children or config.chunk_size
+    chunks: list[Chunk] = []
+    current = Chunk()
+
+    for block in children:
+        inline, deferred, m = _split(block, max_children, max_elements, max_bytes)
+
+        if current.blocks and (
+            len(current.blocks) >= max_children
+            or current.elements + m.count > max_elements
+            or current.size + m.size > max_bytes
+        ):
+            chunks.append(current)
+            current = Chunk()
+
+        if deferred:
+            current.deferred[len(current.blocks)] = deferred
+        current.blocks.append(inline)
+        current.elements += m.count
+        current.size += m.size + 1
+
+    if current.blocks:
+        chunks.append(current)
+    return chunks
+
+
+def inline_prefix(chunks: list[Chunk]) -> list[dict]:
+    """첫 청크에서 미룬 자식이 없는 앞부분 (pages.create 에 함께 보낼 블록)
+
+    ``pages.create`` 응답에는 자식 블록 ID가 없으므로 미룬 자식이 있는
+    블록부터는 ``append_blocks`` 로 보내야 합니다.
+    """
+    if not chunks:
+        return []
+    first = chunks[0]
+    end = min(first.deferred, default=len(first.blocks))
+    return first.blocks[:end]
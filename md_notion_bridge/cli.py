@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import cProfile
+import functools
+import os
+import sqlite3
 import sys
+import tempfile
+import time
+from itertools import islice
 from pathlib import Path
+from types import SimpleNamespace
 
 import click
 from rich.console import Console
@@ -9,10 +17,15 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from .batch import _extract_title
+from .cache import BlockCache, ConversionCache, default_cache_dir
 from .client import NotionClient
 from .config import config
-from .md_to_notion import convert as md_to_blocks, convert_file
-from .notion_to_md import convert as blocks_to_md, convert_page, convert_to_file
+from .manifest import MANIFEST_FILENAME, PullManifest
+from .md_to_notion import convert as md_to_blocks, iter_blocks
+from .metrics import PHASES, PhaseTimings
+from .notion_to_md import convert as blocks_to_md, convert_page, convert_to_file, write_page
+from .sync import STATE_FILENAME, SyncState, sync_file
 
 console = Console()
 err_console = Console(stderr=True, style="bold red")
@@ -22,16 +35,167 @@ err_console = Console(stderr=True, style="bold red")
 # 공통 옵션
 # ------------------------------------------------------------------ #
 
-def _get_client(api_key: str | None = None) -> NotionClient:
-    """클라이언트 생성 (API 키 검증 포함)"""
+def _get_client(
+    api_key: str | None = None,
+    cache_dir: str | None = None,
+    clear_cache: bool = False,
+) -> NotionClient:
+    """클라이언트 생성 (API 키 검증 포함)
+    
+    cache_dir 이 있으면 블록 캐시를 붙입니다 (pull 계열 명령).
+    clear_cache 면 캐시를 비운 뒤 붙입니다.
+    """
     try:
         config.validate()
-        return NotionClient(api_key)
+        block_cache = BlockCache(cache_dir) if cache_dir else None
+        if block_cache and clear_cache:
+            block_cache.clear()
+        return NotionClient(api_key, block_cache=block_cache)
     except ValueError as e:
         err_console.print(f"❌ {e}")
         sys.exit(1)
 
 
+def _block_cache_options(func):
+    """``--cache-dir`` / ``--no-cache`` / ``--clear-cache`` 옵션 (pull 계열 블록 캐시)"""
+    func = click.option(
+        "--clear-cache",
+        is_flag=True,
+        default=False,
+        help="블록 캐시를 비우고 모두 다시 조회.",
+    )(func)
+    func = click.option(
+        "--no-cache",
+        is_flag=True,
+        default=False,
+        help="블록 캐시를 쓰지 않음.",
+    )(func)
+    return click.option(
+        "--cache-dir",
+        default=lambda: config.cache_dir or None,
+        help="블록 캐시 디렉토리. 수정되지 않은 페이지의 블록은 API 대신 캐시에서 읽음 "
+             "(기본값: MD_NOTION_CACHE_DIR).",
+    )(func)
+
+
+def _conversion_cache_options(func):
+    """``--cache-dir`` / ``--no-cache`` 옵션 (push 계열 변환 캐시)"""
+    func = click.option(
+        "--no-cache",
+        is_flag=True,
+        default=False,
+        help="변환 캐시를 쓰지 않고 모든 파일을 다시 파싱.",
+    )(func)
+    return click.option(
+        "--cache-dir",
+        default=lambda: config.cache_dir or None,
+        help="변환 캐시 디렉토리. 내용이 바뀌지 않은 파일은 파싱 대신 캐시에서 읽음 "
+             "(기본값: MD_NOTION_CACHE_DIR, 없으면 ~/.cache/md-notion).",
+    )(func)
+
+
+def _open_conversion_cache(cache_dir: str | None, no_cache: bool) -> ConversionCache | None:
+    """변환 캐시 열기 - 열 수 없으면 경고만 하고 캐시 없이 진행"""
+    if no_cache:
+        return None
+    try:
+        return ConversionCache(cache_dir or default_cache_dir())
+    except (OSError, sqlite3.Error) as e:
+        console.print(f"[yellow]⚠️  변환 캐시를 열 수 없어 사용하지 않습니다: {e}[/yellow]")
+        return None
+
+
+_sync_option = click.option(
+    "--sync",
+    is_flag=True,
+    default=False,
+    help="이전에 올린 페이지를 갱신. 바뀐 블록만 수정/추가/삭제하고 "
+         "내용이 그대로인 파일은 건너뜀.",
+)
+
+_state_option = click.option(
+    "--state", "state_file",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help=f"동기화 상태 파일 경로 (기본값: 대상 디렉토리의 {STATE_FILENAME}).",
+)
+
+_metrics_json_option = click.option(
+    "--metrics-json",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="배치 결과와 API 요청 지표(엔드포인트별 지연 시간·재시도·페이로드 크기)를 JSON으로 저장.",
+)
+
+
+def _profile_options(func):
+    """``--profile`` / ``--profile-out`` 옵션 추가
+
+    ``--profile-out`` 을 주면 명령 전체를 cProfile 로 감싸 pstats 파일로 저장합니다
+    (``--profile`` 포함).
+    """
+    @functools.wraps(func)
+    def wrapper(*args, profile_out: str | None = None, **kwargs):
+        if not profile_out:
+            return func(*args, **kwargs)
+        kwargs["profile"] = True
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+            profiler.dump_stats(profile_out)
+            console.print(
+                f"[dim]cProfile 결과 저장: {profile_out} (python -m pstats {profile_out})[/dim]"
+            )
+
+    wrapper = click.option(
+        "--profile-out",
+        default=None,
+        type=click.Path(dir_okay=False),
+        help="cProfile 결과를 pstats 파일로 저장 (--profile 포함, 워커 스레드는 제외).",
+    )(wrapper)
+    return click.option(
+        "--profile",
+        is_flag=True,
+        default=False,
+        help="단계별(읽기·한국어 정규화·파싱·API 호출·변환·쓰기) 소요 시간 출력.",
+    )(wrapper)
+
+
+def _umask() -> int:
+    """현재 프로세스 umask (조회하려면 한 번 바꿨다 되돌려야 함)"""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def _print_timings(timings: PhaseTimings) -> None:
+    """단계별 소요 시간 표 출력"""
+    total = timings.total
+    table = Table(title="⏱️  단계별 소요 시간")
+    table.add_column("단계", style="cyan")
+    table.add_column("시간", justify="right")
+    table.add_column("비율", justify="right")
+    for name, label in PHASES.items():
+        seconds = getattr(timings, name)
+        share = f"{seconds / total:.1%}" if total else "-"
+        table.add_row(label, f"{seconds:.3f}초", share)
+    table.add_row("[bold]합계[/bold]", f"[bold]{total:.3f}초[/bold]", "")
+    console.print(table)
+
+
+def _print_report(report, metrics_json: str | None) -> None:
+    """배치 요약 + 요청 지표 출력, 필요하면 JSON 저장"""
+    console.print(f"\n[bold]{report.summary()}[/bold]")
+    if report.metrics_summary():
+        console.print(f"[dim]{report.metrics_summary()}[/dim]")
+    if metrics_json:
+        Path(metrics_json).write_text(report.to_json(indent=2), encoding="utf-8")
+        console.print(f"[dim]지표 저장: {metrics_json}[/dim]")
+
+
 # ------------------------------------------------------------------ #
 # CLI 그룹
 # ------------------------------------------------------------------ #
@@ -64,7 +228,18 @@ def main() -> None:
     default=False,
     help="한국어 최적화 비활성화.",
 )
-def push(md_file: str, page_id: str | None, title: str | None, no_korean_opt: bool) -> None:
+@_sync_option
+@_state_option
+@_profile_options
+def push(
+    md_file: str,
+    page_id: str | None,
+    title: str | None,
+    no_korean_opt: bool,
+    sync: bool,
+    state_file: str | None,
+    profile: bool,
+) -> None:
     """마크다운 파일을 Notion 페이지로 업로드합니다.
     
     \b
@@ -72,6 +247,8 @@ def push(md_file: str, page_id: str | None, title: str | None, no_korean_opt: bo
         md-notion push README.md
         md-notion push docs/guide.md --page-id https://notion.so/...
         md-notion push report.md --title "월간 리포트"
+        md-notion push notes.md --sync
+        md-notion push big.md --profile --profile-out push.prof
     """
     client = _get_client()
     parent_id = page_id or config.default_page_id
@@ -86,16 +263,15 @@ def push(md_file: str, page_id: str | None, title: str | None, no_korean_opt: bo
     # page_id 정규화
     parent_id = NotionClient.extract_page_id(parent_id)
     
-    # 파일명에서 기본 제목 추출
     file_path = Path(md_file)
-    if not title:
-        # 파일 내 첫 번째 H1 탐색
-        content = file_path.read_text(encoding="utf-8")
-        for line in content.splitlines():
-            if line.startswith("# "):
-                title = line[2:].strip()
-                break
-        title = title or file_path.stem
+    if sync:
+        _push_sync(client, file_path, parent_id, title, not no_korean_opt, state_file, profile)
+        return
+
+    timings = PhaseTimings()
+    # 제목 미지정 시 파일 내 첫 번째 H1 또는 파일명
+    with timings.phase("read"):
+        title = title or _extract_title(file_path)
     
     with Progress(
         SpinnerColumn(),
@@ -103,16 +279,28 @@ def push(md_file: str, page_id: str | None, title: str | None, no_korean_opt: bo
         console=console,
     ) as progress:
         task = progress.add_task("📄 마크다운 파싱 중...", total=None)
-        blocks = convert_file(md_file, korean_optimize=not no_korean_opt)
+        # 파일을 읽는 대로 블록을 만들어 올림 (전체 블록 리스트를 만들지 않음)
+        blocks = iter_blocks(
+            md_file, korean_optimize=not no_korean_opt, timings=timings if profile else None
+        )
+        first = list(islice(blocks, config.chunk_size))
         
         progress.update(task, description="☁️  Notion 페이지 생성 중...")
-        page = client.create_page(parent_id, title, children=blocks[:100])
+        # 첫 청크는 생성 요청에 포함, 나머지는 파싱되는 대로 이어서 추가
+        with timings.phase("api"):
+            page = client.create_page(parent_id, title, children=first)
         page_id_created = page["id"]
         
-        # 100블록 초과 시 나머지 추가
-        if len(blocks) > 100:
-            progress.update(task, description="📦 추가 블록 업로드 중...")
-            client.append_blocks(page_id_created, blocks[100:])
+        def on_progress(count: int) -> None:
+            progress.update(
+                task, description=f"☁️  블록 추가 중... ({len(first) + count}개)"
+            )
+        
+        # 스트림에서 다음 블록을 파싱하는 시간은 api 가 아니라 읽기·정규화·파싱에 기록
+        with timings.phase("api"):
+            block_count = len(first) + client.append_block_stream(
+                page_id_created, blocks, on_progress=on_progress
+            )
         
         progress.update(task, description="✅ 완료!")
     
@@ -121,12 +309,54 @@ def push(md_file: str, page_id: str | None, title: str | None, no_korean_opt: bo
         Panel(
             f"[bold green]✅ 업로드 완료![/bold green]\n\n"
             f"[bold]제목:[/bold] {title}\n"
-            f"[bold]블록 수:[/bold] {len(blocks)}\n"
+            f"[bold]블록 수:[/bold] {block_count}\n"
             f"[bold]URL:[/bold] [link={page_url}]{page_url}[/link]",
             title="md-notion push",
             border_style="green",
         )
     )
+    if profile:
+        _print_timings(timings)
+
+
+def _push_sync(
+    client: NotionClient,
+    file_path: Path,
+    parent_id: str,
+    title: str | None,
+    korean_optimize: bool,
+    state_file: str | None,
+    profile: bool = False,
+) -> None:
+    """push --sync: 상태 파일 기준으로 바뀐 블록만 반영"""
+    state = SyncState(state_file or file_path.parent / STATE_FILENAME)
+    with console.status("🔄 Notion 페이지 동기화 중..."):
+        result, file_state = sync_file(
+            file_path, client, parent_id, state.get(file_path),
+            korean_optimize=korean_optimize, title=title,
+        )
+    if file_state:
+        state.set(file_path, file_state)
+        state.save()
+
+    if not result.success:
+        err_console.print(f"❌ {result.error}")
+        sys.exit(1)
+
+    status = "변경 없음" if result.skipped else result.changes
+    console.print(
+        Panel(
+            f"[bold green]✅ 동기화 완료![/bold green]\n\n"
+            f"[bold]제목:[/bold] {file_state.title}\n"
+            f"[bold]블록 수:[/bold] {result.block_count}\n"
+            f"[bold]변경:[/bold] {status}\n"
+            f"[bold]URL:[/bold] [link={result.page_url}]{result.page_url}[/link]",
+            title="md-notion push --sync",
+            border_style="green",
+        )
+    )
+    if profile:
+        _print_timings(result.timings)
 
 
 # ------------------------------------------------------------------ #
@@ -146,7 +376,24 @@ def push(md_file: str, page_id: str | None, title: str | None, no_korean_opt: bo
     default=False,
     help="파일 저장 대신 표준 출력으로 출력.",
 )
-def pull(page_id: str, output: str | None, stdout: bool) -> None:
+@click.option(
+    "--workers", "-w",
+    default=None,
+    type=click.IntRange(min=1),
+    help="블록 트리 조회 시 동시 요청 수. 미입력 시 설정값 사용.",
+)
+@_block_cache_options
+@_profile_options
+def pull(
+    page_id: str,
+    output: str | None,
+    stdout: bool,
+    workers: int | None,
+    cache_dir: str | None,
+    no_cache: bool,
+    clear_cache: bool,
+    profile: bool,
+) -> None:
     """Notion 페이지를 마크다운 파일로 추출합니다.
 
     \b
@@ -154,9 +401,14 @@ def pull(page_id: str, output: str | None, stdout: bool) -> None:
         md-notion pull https://notion.so/...
         md-notion pull abc123 --output result.md
         md-notion pull abc123 --stdout
+        md-notion pull abc123 --workers 3
+        md-notion pull abc123 --cache-dir ~/.cache/md-notion
+        md-notion pull abc123 --no-cache
+        md-notion pull abc123 --profile
     """
-    client = _get_client()
+    client = _get_client(cache_dir=None if no_cache else cache_dir, clear_cache=clear_cache)
     clean_id = NotionClient.extract_page_id(page_id)
+    timings = PhaseTimings()
 
     with Progress(
         SpinnerColumn(),
@@ -164,17 +416,25 @@ def pull(page_id: str, output: str | None, stdout: bool) -> None:
         console=console,
     ) as progress:
         task = progress.add_task("🔍 페이지 조회 중...", total=None)
-        page = client.get_page(clean_id)
-
-        progress.update(task, description="📦 블록 수집 중...")
-        blocks = client.get_block_children(clean_id)
-
-        progress.update(task, description="✍️  마크다운 변환 중...")
-        markdown = convert_page(page, blocks)
+        with timings.phase("api"):
+            page = client.get_page(clean_id)
 
         if stdout:
+            progress.update(task, description="📦 블록 수집 중...")
+            with timings.phase("api"):
+                blocks = client.get_block_children(
+                    clean_id,
+                    workers=workers,
+                    last_edited_time=page.get("last_edited_time"),
+                    compact=True,
+                )
             progress.stop()
-            console.print(markdown)
+            with timings.phase("convert"):
+                markdown = convert_page(page, blocks)
+            with timings.phase("write"):
+                console.print(markdown)
+            if profile:
+                _print_timings(timings)
             return
 
         # 출력 파일명 결정
@@ -185,19 +445,46 @@ def pull(page_id: str, output: str | None, stdout: bool) -> None:
             ).strip() or "notion_export"
             output = f"{safe_title}.md"
 
-        progress.update(task, description=f"💾 저장 중: {output}")
-        Path(output).write_text(markdown, encoding="utf-8")
+        # 블록을 받는 대로 변환해서 파일에 씀 (트리 전체를 메모리에 두지 않음)
+        progress.update(task, description=f"📦 블록 수집·저장 중: {output}")
+        blocks = client.iter_block_children(
+            clean_id,
+            workers=workers,
+            last_edited_time=page.get("last_edited_time"),
+            compact=True,
+        )
+        # 같은 디렉토리의 임시 파일에 쓰고, 끝까지 성공했을 때만 교체
+        # (도중에 API 가 실패해도 기존 파일이 잘리지 않음)
+        target = Path(output)
+        tmp = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=target.parent, suffix=".tmp", delete=False
+        )
+        try:
+            with tmp as f, timings.phase("convert"):
+                # 블록 조회는 api, 파일 쓰기는 write, 나머지는 convert 로 기록
+                block_count = write_page(
+                    page,
+                    timings.timed("api", blocks),
+                    SimpleNamespace(write=timings.wrap("write", f.write)),
+                )
+            os.chmod(tmp.name, 0o666 & ~_umask())     # 임시 파일은 0600 으로 만들어짐
+            os.replace(tmp.name, target)
+        except BaseException:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
         progress.update(task, description="✅ 완료!")
 
     console.print(
         Panel(
             f"[bold green]✅ 추출 완료![/bold green]\n\n"
-            f"[bold]블록 수:[/bold] {len(blocks)}\n"
+            f"[bold]블록 수:[/bold] {block_count}\n"
             f"[bold]저장 위치:[/bold] {Path(output).resolve()}",
             title="md-notion pull",
             border_style="green",
         )
     )
+    if profile:
+        _print_timings(timings)
 
 
 # ------------------------------------------------------------------ #
@@ -208,14 +495,45 @@ def pull(page_id: str, output: str | None, stdout: bool) -> None:
 @click.argument("directory", type=click.Path(exists=True, file_okay=False))
 @click.option("--page-id", "-p", default=None, help="업로드할 Notion 부모 페이지 ID.")
 @click.option("--pattern", default="*.md", show_default=True, help="파일 글로브 패턴.")
-def push_all(directory: str, page_id: str | None, pattern: str) -> None:
+@click.option(
+    "--workers", "-w",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="동시에 처리할 파일 수 (속도 제한은 공유).",
+)
+@_sync_option
+@_state_option
+@_conversion_cache_options
+@_metrics_json_option
+@_profile_options
+def push_all(
+    directory: str,
+    page_id: str | None,
+    pattern: str,
+    workers: int,
+    sync: bool,
+    state_file: str | None,
+    cache_dir: str | None,
+    no_cache: bool,
+    metrics_json: str | None,
+    profile: bool,
+) -> None:
     """디렉토리 내 마크다운 파일을 일괄 업로드합니다.
 
     \b
     예시:
       md-notion push-all ./docs --page-id abc123
       md-notion push-all ./posts --pattern "**/*.md"
+      md-notion push-all ./docs --workers 4
+      md-notion push-all ./docs --sync
+      md-notion push-all ./docs --no-cache
+      md-notion push-all ./docs --metrics-json metrics.json
+      md-notion push-all ./docs --profile
     """
+    from .batch import PushResult, batch_push
+    from .sync import batch_sync
+
     client = _get_client()
     parent_id = page_id or config.default_page_id
 
@@ -230,6 +548,28 @@ def push_all(directory: str, page_id: str | None, pattern: str) -> None:
         console.print(f"⚠️  [{directory}] 에서 [{pattern}] 파일을 찾을 수 없습니다.")
         return
 
+    def on_progress(current, total, result):
+        icon = "✅" if result.success else "❌"
+        note = " (변경 없음)" if result.skipped else ""
+        console.print(f"  {icon} [{current}/{total}] {result.file}{note}")
+
+    cache = _open_conversion_cache(cache_dir, no_cache)
+    try:
+        if sync:
+            state = SyncState(state_file or Path(directory) / STATE_FILENAME)
+            report = batch_sync(
+                files, client, parent_id, state,
+                on_progress=on_progress, workers=workers, cache=cache,
+            )
+        else:
+            report = batch_push(
+                files, client, parent_id,
+                on_progress=on_progress, workers=workers, cache=cache,
+            )
+    finally:
+        if cache:
+            cache.close()
+
     # 결과 테이블
     table = Table(title="📤 배치 업로드 결과", show_lines=True)
     table.add_column("파일", style="cyan")
@@ -237,32 +577,21 @@ def push_all(directory: str, page_id: str | None, pattern: str) -> None:
     table.add_column("블록 수", justify="right")
     table.add_column("URL", style="dim")
 
-    success = 0
-    for file in files:
-        try:
-            blocks = convert_file(str(file))
-            title = file.stem
-
-            # 첫 H1 탐색
-            content = file.read_text(encoding="utf-8")
-            for line in content.splitlines():
-                if line.startswith("# "):
-                    title = line[2:].strip()
-                    break
-
-            page = client.create_page(parent_id, title, children=blocks[:100])
-            if len(blocks) > 100:
-                client.append_blocks(page["id"], blocks[100:])
-
-            url = f"https://www.notion.so/{page['id'].replace('-', '')}"
-            table.add_row(file.name, "[green]✅ 성공[/green]", str(len(blocks)), url)
-            success += 1
-
-        except Exception as e:
-            table.add_row(file.name, "[red]❌ 실패[/red]", "-", str(e))
+    for r in report.results:
+        if isinstance(r, PushResult):
+            if r.skipped:
+                table.add_row(r.file, "[dim]⏭ 변경 없음[/dim]", str(r.block_count), r.page_url)
+            elif r.success:
+                table.add_row(r.file, "[green]✅ 성공[/green]", str(r.block_count), r.page_url)
+            else:
+                table.add_row(r.file, "[red]❌ 실패[/red]", "-", r.error)
 
     console.print(table)
-    console.print(f"\n[bold]총 {len(files)}개 중 {success}개 성공[/bold]")
+    _print_report(report, metrics_json)
+    if cache:
+        console.print(f"[dim]변환 캐시: 적중 {cache.hits}회 / 미적중 {cache.misses}회[/dim]")
+    if profile:
+        _print_timings(report.timings)
 
 
 @main.command("pull-all")
@@ -273,18 +602,50 @@ def push_all(directory: str, page_id: str | None, pattern: str) -> None:
     show_default=True,
     help="저장할 디렉토리 경로.",
 )
-def pull_all(page_ids: tuple[str, ...], output_dir: str) -> None:
+@click.option(
+    "--workers", "-w",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="동시에 조회할 페이지 수 (속도 제한은 공유).",
+)
+@_block_cache_options
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help=f"수정되지 않은 페이지도 다시 받기 (기본: 출력 디렉토리의 {MANIFEST_FILENAME} 기준으로 건너뜀).",
+)
+@_metrics_json_option
+@_profile_options
+def pull_all(
+    page_ids: tuple[str, ...],
+    output_dir: str,
+    workers: int,
+    cache_dir: str | None,
+    no_cache: bool,
+    clear_cache: bool,
+    force: bool,
+    metrics_json: str | None,
+    profile: bool,
+) -> None:
     """여러 Notion 페이지를 마크다운 파일로 일괄 추출합니다.
 
+    이전에 받은 뒤 수정되지 않은 페이지는 건너뛰고 파일도 건드리지 않습니다.
+
     \b
     예시:
         md-notion pull-all abc123 def456 ghi789
         md-notion pull-all abc123 --output-dir ./exported
+        md-notion pull-all abc123 def456 --workers 4
+        md-notion pull-all abc123 def456 --force
+        md-notion pull-all abc123 def456 --metrics-json metrics.json
+        md-notion pull-all abc123 def456 --profile
     """
     from .batch import batch_pull
     from rich.table import Table
 
-    client = _get_client()
+    client = _get_client(cache_dir=None if no_cache else cache_dir, clear_cache=clear_cache)
     out = Path(output_dir)
 
     console.print(f"📥 {len(page_ids)}개 페이지 추출 시작 → [cyan]{out}[/cyan]")
@@ -292,9 +653,13 @@ def pull_all(page_ids: tuple[str, ...], output_dir: str) -> None:
     def on_progress(current, total, result):
         icon = "✅" if result.success else "❌"
         msg = result.output_path if result.success else result.error
-        console.print(f"  {icon} [{current}/{total}] {msg}")
+        note = " (변경 없음)" if result.skipped else ""
+        console.print(f"  {icon} [{current}/{total}] {msg}{note}")
 
-    report = batch_pull(list(page_ids), client, out, on_progress=on_progress)
+    report = batch_pull(
+        list(page_ids), client, out, on_progress=on_progress, workers=workers,
+        manifest=PullManifest(out), force=force,
+    )
 
     table = Table(title="📥 배치 추출 결과", show_lines=True)
     table.add_column("페이지 ID", style="cyan")
@@ -305,9 +670,129 @@ def pull_all(page_ids: tuple[str, ...], output_dir: str) -> None:
     for r in report.results:
         from .batch import PullResult
         if isinstance(r, PullResult):
-            status = "[green]✅ 성공[/green]" if r.success else "[red]❌ 실패[/red]"
+            if r.skipped:
+                status = "[dim]⏭ 변경 없음[/dim]"
+            else:
+                status = "[green]✅ 성공[/green]" if r.success else "[red]❌ 실패[/red]"
             detail = r.output_path if r.success else r.error
             table.add_row(r.page_id[:8] + "...", status, str(r.block_count), detail)
 
     console.print(table)
-    console.print(f"\n[bold]{report.summary()}[/bold]")
\ No newline at end of file
+    _print_report(report, metrics_json)
+    if client.block_cache:
+        cache = client.block_cache
+        console.print(f"[dim]블록 캐시: 적중 {cache.hits}회 / 미적중 {cache.misses}회[/dim]")
+    if profile:
+        _print_timings(report.timings)
+
+# ------------------------------------------------------------------ #
+# 오프라인 컴파일 (md → 블록 JSON)
+# ------------------------------------------------------------------ #
+
+@main.command("compile")
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--out", "-o", "out_dir",
+    required=True,
+    type=click.Path(file_okay=False),
+    help="블록 JSON 을 저장할 디렉토리 (입력 디렉토리 구조 유지).",
+)
+@click.option("--pattern", default="**/*.md", show_default=True, help="파일 글로브 패턴.")
+@click.option(
+    "--jobs", "-j",
+    default=None,
+    type=click.IntRange(min=1),
+    help="변환 프로세스 수 (기본값: CPU 코어 수).",
+)
+@click.option(
+    "--no-korean-opt",
+    is_flag=True,
+    default=False,
+    help="한국어 최적화 비활성화.",
+)
+@_conversion_cache_options
+@click.option(
+    "--report-json",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="파일별 블록 수·단계별 소요 시간을 JSON으로 저장.",
+)
+@click.option("--quiet", "-q", is_flag=True, default=False, help="파일별 진행 상황 출력 생략.")
+def compile_(
+    directory: str,
+    out_dir: str,
+    pattern: str,
+    jobs: int | None,
+    no_korean_opt: bool,
+    cache_dir: str | None,
+    no_cache: bool,
+    report_json: str | None,
+    quiet: bool,
+) -> None:
+    """마크다운 파일을 Notion 블록 JSON 으로 변환합니다 (API 호출 없음).
+
+    변환은 여러 프로세스에 나눠 실행하며, 파일별 소요 시간을 출력합니다.
+    결과 JSON 의 children 은 create_page 에 그대로 넘길 수 있습니다.
+    변환에 실패한 파일이 있으면 종료 코드 1을 반환합니다.
+
+    \b
+    예시:
+      md-notion compile ./docs --out ./build/blocks
+      md-notion compile ./docs --out ./build/blocks --jobs 8
+      md-notion compile ./docs --out ./build/blocks --report-json compile.json
+    """
+    from .batch import compile_tree
+
+    if not no_cache:
+        cache_dir = str(cache_dir or default_cache_dir())
+        try:
+            # 워커가 열기 전에 한 번 열어 디렉토리·테이블을 만들어 둠
+            ConversionCache(cache_dir).close()
+        except (OSError, sqlite3.Error) as e:
+            console.print(f"[yellow]⚠️  변환 캐시를 열 수 없어 사용하지 않습니다: {e}[/yellow]")
+            cache_dir = None
+
+    def on_progress(current, total, result):
+        if quiet and result.success:
+            return
+        icon = "✅" if result.success else "❌"
+        detail = (
+            f"{result.block_count}블록 · {result.timings.total * 1000:.1f}ms"
+            if result.success else result.error
+        )
+        console.print(f"  {icon} [{current}/{total}] {result.file} ({detail})")
+
+    start = time.perf_counter()
+    report = compile_tree(
+        directory,
+        out_dir,
+        pattern=pattern,
+        korean_optimize=not no_korean_opt,
+        on_progress=on_progress,
+        jobs=jobs,
+        cache_dir=None if no_cache else cache_dir,
+    )
+    elapsed = time.perf_counter() - start
+
+    if not report.total:
+        console.print(f"⚠️  [{directory}] 에서 [{pattern}] 파일을 찾을 수 없습니다.")
+        return
+
+    # 가장 오래 걸린 파일
+    slowest = sorted(report.results, key=lambda r: r.timings.total, reverse=True)[:10]
+    table = Table(title="🐢 오래 걸린 파일")
+    table.add_column("파일", style="cyan")
+    table.add_column("블록 수", justify="right")
+    table.add_column("시간", justify="right")
+    for r in slowest:
+        table.add_row(r.file, str(r.block_count), f"{r.timings.total * 1000:.1f}ms")
+    console.print(table)
+
+    _print_report(report, report_json)
+    timings = report.timings
+    console.print(
+        f"[dim]경과 {elapsed:.2f}초 · 파일별 처리 시간 합계 {timings.total:.2f}초 "
+        f"({timings.breakdown()})[/dim]"
+    )
+    if report.failed:
+        sys.exit(1)
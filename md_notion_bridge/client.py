@@ -1,20 +1,231 @@
 from __future__ import annotations
 
-from notion_client import Client
+import asyncio
+import re
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from itertools import islice
+
+import httpx
+from notion_client import AsyncClient, Client
+from notion_client.client import ClientOptions
 from notion_client.errors import APIResponseError
 
+from .blocks.compact import compact_block
+from .cache import BlockCache
+from .chunking import inline_prefix, plan_chunks
 from .config import config
 from .exceptions import NotionAPIError
+from .metrics import RequestEvent, RequestHook, RequestMetrics, endpoint_name
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, RetryStats, _status
+
+
+def _sdk_options(api_key: str | None, base_url: str | None = None) -> dict:
+    """notion_client Client / AsyncClient 생성 옵션"""
+    key = api_key or config.api_key
+    if not key:
+        raise ValueError("NOTION_API_KEY가 없습니다.")
+    options: dict = {"auth": key, "timeout_ms": 60_000}
+    base_url = base_url or config.base_url
+    if base_url:
+        options["base_url"] = base_url.rstrip("/")
+    # notion-client 3.x 는 자체 재시도가 있음 → RetryPolicy 와 중복되지 않도록 끔
+    if "retry" in getattr(ClientOptions, "__dataclass_fields__", {}):
+        options["retry"] = False
+    return options
+
+
+# ------------------------------------------------------------------ #
+# 페이로드 크기 측정 (httpx 이벤트 훅)
+# ------------------------------------------------------------------ #
+
+# 현재 스레드 / 태스크에서 마지막으로 보낸 요청과 받은 응답
+_sent: ContextVar[httpx.Request | None] = ContextVar("_sent", default=None)
+_received: ContextVar[httpx.Response | None] = ContextVar("_received", default=None)
+
+
+def _record_request(request: httpx.Request) -> None:
+    _sent.set(request)
+
+
+def _record_response(response: httpx.Response) -> None:
+    _received.set(response)
+
+
+async def _record_request_async(request: httpx.Request) -> None:
+    _sent.set(request)
+
+
+async def _record_response_async(response: httpx.Response) -> None:
+    _received.set(response)
+
+
+def _reset_exchange() -> None:
+    _sent.set(None)
+    _received.set(None)
+
+
+def _exchange_sizes() -> tuple[int, int]:
+    """이번 시도에서 주고받은 본문 크기 (요청, 응답)
+
+    httpx 가 이미 만들어 둔 본문 바이트의 길이만 재므로 JSON 을 다시 직렬화하지
+    않습니다. 본문을 읽지 못한 경우(타임아웃 등)는 0 입니다.
+    """
+    request, response = _sent.get(), _received.get()
+    try:
+        request_bytes = len(request.content) if request is not None else 0
+    except httpx.RequestNotRead:
+        request_bytes = 0
+    try:
+        response_bytes = len(response.content) if response is not None else 0
+    except httpx.ResponseNotRead:
+        response_bytes = 0
+    return request_bytes, response_bytes
+
+
+_RE_UUID = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+
+
+def _title_property(title: str) -> dict:
+    return {"title": {"title": [{"type": "text", "text": {"content": title}}]}}
+
+
+def _page_payload(parent_id: str, title: str, children: list[dict] | None = None) -> dict:
+    """pages.create 요청 본문 생성"""
+    payload: dict = {
+        "parent": {"page_id": parent_id},
+        "properties": _title_property(title),
+    }
+    if children:
+        payload["children"] = children
+    return payload
+
+
+class _BaseNotionClient:
+    """동기 / 비동기 클라이언트 공용 유틸"""
+    
+    def _init_instrumentation(self, hooks: list[RequestHook] | None) -> None:
+        self.retry_stats = RetryStats()
+        self.metrics = RequestMetrics()
+        self.hooks: list[RequestHook] = [self.metrics, *(hooks or [])]
+    
+    def add_hook(self, hook: RequestHook) -> None:
+        """요청 시도마다 ``RequestEvent`` 를 받을 훅 추가"""
+        self.hooks.append(hook)
+    
+    def _emit(self, event: RequestEvent) -> None:
+        for hook in self.hooks:
+            hook(event)
+    
+    def _failed(
+        self,
+        error: Exception,
+        event: RequestEvent,
+        idempotent: bool,
+    ) -> float | None:
+        """실패한 시도 기록 - 재시도하면 대기 시간, 아니면 None 반환"""
+        policy = self.retry_policy
+        retry = event.attempt < policy.max_retries and policy.is_retryable(error, idempotent)
+        wait = policy.delay(event.attempt, error) if retry else 0.0
+        event.status = _status(error)
+        event.error = type(error).__name__
+        event.retried = retry
+        event.retry_wait = wait
+        self._emit(event)
+        if not retry:
+            return None
+        self.retry_stats.record(error, wait)
+        return wait
+    
+    def get_page_title(self, page: dict) -> str:
+        """페이지 딕셔너리에서 제목 추출"""
+        try:
+            title_prop = page["properties"]["title"]["title"]
+            return "".join(t["plain_text"] for t in title_prop)
+        except (KeyError, IndexError):
+            return "Untitled"
+    
+    @staticmethod
+    def extract_page_id(url_or_id: str) -> str:
+        """Notion URL 또는 ID 문자열에서 순수 page_id 추출"""
+        # URL 형식: https://www.notion.so/Title-xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+        cleaned = url_or_id.strip().split("?")[0].split("#")[0]
+        # 이미 하이픈이 들어간 UUID 형식 (API 응답의 id)
+        uuid = _RE_UUID.search(cleaned)
+        if uuid:
+            return uuid.group(0).lower()
+        raw_id = cleaned.split("-")[-1].split("/")[-1]
+        # 하이픈 없는 32자리 ID → 하이픈 포함 형식으로 변환
+        if len(raw_id) == 32 and "-" not in raw_id:
+            return (
+                f"{raw_id[:8]}-{raw_id[8:12]}-"
+                f"{raw_id[12:16]}-{raw_id[16:20]}-{raw_id[20:]}"
+            )
+        return raw_id
 
 
-class NotionClient:
-    """Notion API 클라이언트 래퍼"""
+class NotionClient(_BaseNotionClient):
+    """Notion API 클라이언트 래퍼
+    
+    모든 요청은 ``RateLimiter`` 를 거칩니다. 여러 스레드가 같은 클라이언트를
+    쓰거나 같은 limiter 를 넘겨받으면 하나의 속도 제한 예산을 공유합니다.
+    실패한 요청은 ``RetryPolicy`` 에 따라 재시도되고 ``retry_stats`` 에 기록됩니다.
+    ``block_cache`` 를 주면 수정되지 않은 블록의 자식 목록을 디스크에서 읽습니다.
+    ``base_url`` 로 API 주소를 바꿀 수 있습니다 (예: ``fake_server.FakeNotionServer``).
     
-    def __init__(self, api_key: str | None = None) -> None:
-        key = api_key or config.api_key
-        if not key:
-            raise ValueError("NOTION_API_KEY가 없습니다.")
-        self._client = Client(auth=key, timeout_ms=60_000)
+    요청 시도마다 엔드포인트·소요 시간·상태·페이로드 크기·대기 시간을 담은
+    ``RequestEvent`` 가 ``hooks`` 로 전달되며, 기본으로 ``metrics`` 에 집계됩니다.
+    """
+    
+    def __init__(
+        self,
+        api_key: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        block_cache: BlockCache | None = None,
+        base_url: str | None = None,
+        hooks: list[RequestHook] | None = None,
+    ) -> None:
+        http = httpx.Client(
+            event_hooks={"request": [_record_request], "response": [_record_response]}
+        )
+        self._client = Client(client=http, **_sdk_options(api_key, base_url))
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.block_cache = block_cache
+        self._init_instrumentation(hooks)
+    
+    def _request(self, func, idempotent: bool = True, **kwargs) -> dict:
+        endpoint = endpoint_name(func)
+        attempt = 0
+        while True:
+            event = RequestEvent(
+                endpoint, 0.0, attempt=attempt,
+                limiter_wait=self.rate_limiter.acquire(),
+            )
+            _reset_exchange()
+            start = time.perf_counter()
+            try:
+                response = func(**kwargs)
+            except Exception as e:
+                event.seconds = time.perf_counter() - start
+                event.request_bytes, event.response_bytes = _exchange_sizes()
+                wait = self._failed(e, event, idempotent)
+                if wait is None:
+                    raise
+                time.sleep(wait)
+                attempt += 1
+                continue
+            event.seconds = time.perf_counter() - start
+            event.status = 200
+            event.request_bytes, event.response_bytes = _exchange_sizes()
+            self._emit(event)
+            return response
     
     # ------------------------------------------------------------------ #
     # 페이지 조회
@@ -22,36 +233,145 @@ class NotionClient:
     
     def get_page(self, page_id: str) -> dict:
         """페이지 메타데이터 조회"""
-        return self._client.pages.retrieve(page_id=page_id)
+        return self._request(self._client.pages.retrieve, page_id=page_id)
     
-    def get_blocks(self, block_id: str) -> list[dict]:
-        """블록 목록 전체 조회 (페이지네이션 자동 처리)"""
+    def get_blocks(
+        self,
+        block_id: str,
+        last_edited_time: str | None = None,
+    ) -> list[dict]:
+        """블록 목록 전체 조회 (페이지네이션 자동 처리)
+        
+        ``last_edited_time`` (부모 블록의 수정 시각)이 주어지고 캐시에 같은 시각의
+        목록이 있으면 API를 호출하지 않습니다.
+        """
+        cache = self.block_cache if last_edited_time else None
+        if cache:
+            cached = cache.get(block_id, last_edited_time)
+            if cached is not None:
+                return cached
+        
         blocks: list[dict] = []
-        cursor = None
+        for results in self._iter_block_pages(block_id):
+            blocks.extend(results)
         
+        if cache:
+            cache.put(block_id, last_edited_time, blocks)
+        return blocks
+    
+    def _iter_block_pages(self, block_id: str) -> Iterator[list[dict]]:
+        """``blocks.children.list`` 응답 페이지(최대 100블록)를 받는 대로 yield"""
+        cursor = None
         while True:
             kwargs: dict = {"block_id": block_id, "page_size": 100}
             if cursor:
                 kwargs["start_cursor"] = cursor
             
-            response = self._client.blocks.children.list(**kwargs)
-            blocks.extend(response.get("results", []))
+            response = self._request(self._client.blocks.children.list, **kwargs)
+            yield response.get("results", [])
             
             if not response.get("has_more"):
                 break
             cursor = response.get("next_cursor")
+    
+    def get_block_children(
+        self,
+        block_id: str,
+        workers: int | None = None,
+        last_edited_time: str | None = None,
+        compact: bool = False,
+    ) -> list[dict]:
+        """자식 블록 트리 전체 조회 (깊이별 너비 우선)
+        
+        같은 깊이의 ``has_children`` 블록들을 워커 풀에서 동시에 조회한 뒤
+        각 블록의 ``children`` 에 붙입니다. 결과 트리는 순차 재귀 조회와 동일하며,
+        워커들의 요청은 모두 클라이언트의 속도 제한기를 함께 거칩니다.
+        ``last_edited_time`` 은 루트(페이지)의 수정 시각으로, 블록 캐시 조회에 쓰입니다.
+        하위 블록의 자식 목록도 같은 루트 시각으로 조회합니다 (``_fill_children`` 참고).
+        ``compact=True`` 면 원본 딕셔너리 대신 ``CompactBlock`` 트리를 반환합니다
+        (마크다운 변환 결과는 같고 메모리는 훨씬 적게 씀).
+        """
+        workers = workers or config.fetch_workers
+        blocks = self.get_blocks(block_id, last_edited_time)
+        if compact:
+            blocks = [compact_block(b) for b in blocks]
+        
+        if workers <= 1:
+            self._fill_children(blocks, map, compact, last_edited_time)
+            return blocks
         
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            self._fill_children(blocks, pool.map, compact, last_edited_time)
         return blocks
     
-    def get_block_children(self, block_id: str) -> list[dict]:
-        """자식 블록 재귀 조회"""
-        blocks = self.get_blocks(block_id)
-        for block in blocks:
-            if block.get("has_children"):
-                block["children"] = self.get_block_children(block["id"])
-            else:
+    def iter_block_children(
+        self,
+        block_id: str,
+        workers: int | None = None,
+        last_edited_time: str | None = None,
+        compact: bool = False,
+    ) -> Iterator[dict]:
+        """최상위 블록을 하위 트리를 채운 채로 응답 페이지 단위로 yield
+        
+        ``get_block_children`` 과 같은 트리를 만들지만, 최상위 블록 100개씩
+        하위 트리를 조회해 내보내므로 페이지 전체 트리를 메모리에 두지 않습니다.
+        블록 캐시를 쓰는 경우 캐시에 넣을 최상위 블록 목록(하위 트리 제외)만 모아 둡니다.
+        """
+        workers = workers or config.fetch_workers
+        cache = self.block_cache if last_edited_time else None
+        cached = cache.get(block_id, last_edited_time) if cache else None
+        if cached is not None:
+            pages = (cached[i:i + 100] for i in range(0, len(cached), 100))
+        else:
+            pages = self._iter_block_pages(block_id)
+        collected: list[dict] | None = [] if cache and cached is None else None
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            mapper = pool.map if workers > 1 else map
+            for blocks in pages:
+                if collected is not None:
+                    collected.extend(dict(b) for b in blocks)
+                if compact:
+                    blocks = [compact_block(b) for b in blocks]
+                self._fill_children(blocks, mapper, compact, last_edited_time)
+                yield from blocks
+        
+        if collected is not None:
+            cache.put(block_id, last_edited_time, collected)
+    
+    def _fill_children(
+        self,
+        level: list[dict],
+        mapper,
+        compact: bool = False,
+        root_time: str | None = None,
+    ) -> None:
+        """한 깊이씩 내려가며 자식 블록을 채움 (mapper: map 또는 pool.map)
+
+        하위 블록의 자식 목록은 그 블록이 아니라 루트(페이지)의 수정 시각으로 캐시합니다.
+        Notion 은 손자 블록만 바뀌면 중간 부모 블록의 ``last_edited_time`` 을 바꾸지 않지만
+        페이지의 수정 시각은 갱신하므로, 페이지 시각이 그대로일 때만 하위 트리를 재사용합니다.
+        """
+        def fetch(block: dict) -> list[dict]:
+            children = self.get_blocks(block["id"], root_time)
+            return [compact_block(c) for c in children] if compact else children
+        
+        while level:
+            parents: list[dict] = []
+            for block in level:
                 block["children"] = []
-        return blocks
+                if block.get("has_children"):
+                    parents.append(block)
+            
+            next_level: list[dict] = []
+            # mapper 결과는 입력 순서를 유지하므로 부모-자식 매칭이 보장됨
+            for parent, children in zip(
+                parents,
+                mapper(fetch, parents),
+            ):
+                parent["children"] = children
+                next_level.extend(children)
+            level = next_level
     
     # ------------------------------------------------------------------ #
     # 페이지 생성 / 수정
@@ -63,58 +383,295 @@ class NotionClient:
         title: str,
         children: list[dict] | None = None,
     ) -> dict:
-        """새 페이지 생성"""
-        payload: dict = {
-            "parent": {"page_id": parent_id},
-            "properties": {
-                "title": {
-                    "title": [{"type": "text", "text": {"content": title}}]
-                }
-            },
-        }
-        page = self._client.pages.create(**payload)
-        
-        # 블록은 생성 후 청크 단위로 별도 추가
-        if children:
-            self.append_blocks(page["id"], children)
+        """새 페이지 생성
+        
+        첫 청크는 ``pages.create`` 요청에 함께 담아 보내고,
+        나머지 블록만 ``append_blocks`` 로 이어서 추가합니다.
+        미룬 자식이 있는 블록은 생성된 ID가 필요하므로 append 쪽으로 보냅니다.
+        """
+        children = children or []
+        first = inline_prefix(plan_chunks(children))
+        page = self._request(
+            self._client.pages.create,
+            idempotent=False,
+            **_page_payload(parent_id, title, first),
+        )
+        
+        if len(first) < len(children):
+            self.append_blocks(page["id"], children[len(first):])
         
         return page
     
-    def append_blocks(self, block_id: str, children: list[dict]) -> None:
-        """블록을 청크 단위로 나눠서 추가"""
-        for i in range(0, len(children), config.chunk_size):
-            chunk = children[i : i + config.chunk_size]
-            self._client.blocks.children.append(
-                block_id=block_id, children=chunk
+    def append_blocks(
+        self,
+        block_id: str,
+        children: list[dict],
+        after: str | None = None,
+    ) -> list[dict]:
+        """블록을 요청 제한에 맞는 청크로 나눠서 추가
+        
+        중첩·크기 제한을 넘는 자식은 부모 블록이 생성된 뒤 반환된 블록 ID에
+        이어서 추가합니다. ``after`` 를 주면 해당 블록 뒤에 순서대로 끼워 넣습니다.
+        새로 생성된 최상위 블록 목록을 반환합니다.
+        """
+        created: list[dict] = []
+        for chunk in plan_chunks(children):
+            kwargs: dict = {"block_id": block_id, "children": chunk.blocks}
+            if after:
+                kwargs["after"] = after
+            response = self._request(
+                self._client.blocks.children.append, idempotent=False, **kwargs
             )
+            results = response.get("results", [])
+            for index, deferred in chunk.deferred.items():
+                self.append_blocks(results[index]["id"], deferred)
+            created.extend(results)
+            # 다음 청크는 방금 추가한 마지막 블록 뒤에
+            if after and results:
+                after = results[-1]["id"]
+        return created
+    
+    def append_block_stream(
+        self,
+        block_id: str,
+        blocks: Iterable[dict],
+        on_progress=None,   # 콜백: (추가한 블록 수) → None
+    ) -> int:
+        """블록 이터레이터를 청크 크기만큼 모아 순서대로 추가
+        
+        ``iter_blocks`` 제너레이터와 함께 쓰면 파싱과 업로드가 번갈아 진행되어
+        전체 블록 리스트 없이 앞쪽 블록부터 바로 올라갑니다. 추가한 최상위 블록 수를 반환합니다.
+        """
+        blocks = iter(blocks)
+        count = 0
+        while batch := list(islice(blocks, config.chunk_size)):
+            self.append_blocks(block_id, batch)
+            count += len(batch)
+            if on_progress:
+                on_progress(count)
+        return count
+    
+    def update_block(self, block_id: str, block: dict) -> dict:
+        """기존 블록 내용 수정 (자식 블록은 수정 대상이 아님)"""
+        block_type = block["type"]
+        data = {k: v for k, v in block[block_type].items() if k != "children"}
+        return self._request(
+            self._client.blocks.update, block_id=block_id, **{block_type: data}
+        )
+    
+    def delete_block(self, block_id: str) -> None:
+        """블록 삭제 (Notion 휴지통으로 이동)"""
+        self._request(self._client.blocks.delete, block_id=block_id)
+    
+    def update_page_title(self, page_id: str, title: str) -> dict:
+        """페이지 제목 수정"""
+        return self._request(
+            self._client.pages.update,
+            page_id=page_id,
+            properties=_title_property(title),
+        )
     
     # ------------------------------------------------------------------ #
     # 유틸
     # ------------------------------------------------------------------ #
     
-    def get_page_title(self, page: dict) -> str:
-        """페이지 딕셔너리에서 제목 추출"""
-        try:
-            title_prop = page["properties"]["title"]["title"]
-            return "".join(t["plain_text"] for t in title_prop)
-        except (KeyError, IndexError):
-            return "Untitled"
+    def safe_get_blocks(self, block_id: str) -> tuple[list[dict], list[str]]:
+        """블록 조회 - 실패한 블록 ID도 함께 반환"""
+        blocks: list[dict] = []
+        errors: list[str] = []
+        cursor = None
+        
+        while True:
+            try:
+                kwargs: dict = {"block_id": block_id, "page_size": 100}
+                if cursor:
+                    kwargs["start_cursor"] = cursor
+                
+                response = self._request(
+                    self._client.blocks.children.list, **kwargs
+                )
+                blocks.extend(response.get("results", []))
+                
+                if not response.get("has_more"):
+                    break
+                cursor = response.get("next_cursor")
+            
+            except APIResponseError as e:
+                errors.append(f"블록 조회 실패 [{block_id}]: {e}")
+                break
+        
+        return blocks, errors
+
+
+class AsyncNotionClient(_BaseNotionClient):
+    """Notion API 비동기 클라이언트 래퍼
     
-    @staticmethod
-    def extract_page_id(url_or_id: str) -> str:
-        """Notion URL 또는 ID 문자열에서 순수 page_id 추출"""
-        # URL 형식: https://www.notion.so/Title-xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
-        cleaned = url_or_id.strip().split("?")[0].split("#")[0]
-        raw_id = cleaned.split("-")[-1].split("/")[-1]
-        # 하이픈 없는 32자리 ID → 하이픈 포함 형식으로 변환
-        if len(raw_id) == 32 and "-" not in raw_id:
-            return (
-                f"{raw_id[:8]}-{raw_id[8:12]}-"
-                f"{raw_id[12:16]}-{raw_id[16:20]}-{raw_id[20:]}"
+    ``NotionClient`` 와 같은 메서드를 코루틴으로 제공합니다.
+    모든 요청은 하나의 ``RateLimiter`` 를 거치므로 여러 페이지를 동시에
+    처리해도 API 속도 제한 예산을 함께 나눠 씁니다.
+    """
+    
+    def __init__(
+        self,
+        api_key: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        base_url: str | None = None,
+        hooks: list[RequestHook] | None = None,
+    ) -> None:
+        http = httpx.AsyncClient(
+            event_hooks={
+                "request": [_record_request_async],
+                "response": [_record_response_async],
+            }
+        )
+        self._client = AsyncClient(client=http, **_sdk_options(api_key, base_url))
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._init_instrumentation(hooks)
+    
+    async def _request(self, func, idempotent: bool = True, **kwargs) -> dict:
+        endpoint = endpoint_name(func)
+        attempt = 0
+        while True:
+            event = RequestEvent(
+                endpoint, 0.0, attempt=attempt,
+                limiter_wait=await self.rate_limiter.acquire_async(),
             )
-        return raw_id
+            _reset_exchange()
+            start = time.perf_counter()
+            try:
+                response = await func(**kwargs)
+            except Exception as e:
+                event.seconds = time.perf_counter() - start
+                event.request_bytes, event.response_bytes = _exchange_sizes()
+                wait = self._failed(e, event, idempotent)
+                if wait is None:
+                    raise
+                await asyncio.sleep(wait)
+                attempt += 1
+                continue
+            event.seconds = time.perf_counter() - start
+            event.status = 200
+            event.request_bytes, event.response_bytes = _exchange_sizes()
+            self._emit(event)
+            return response
     
-    def safe_get_blocks(self, block_id: str) -> tuple[list[dict], list[str]]:
+    async def aclose(self) -> None:
+        await self._client.aclose()
+    
+    async def __aenter__(self) -> AsyncNotionClient:
+        return self
+    
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+    
+    # ------------------------------------------------------------------ #
+    # 페이지 조회
+    # ------------------------------------------------------------------ #
+    
+    async def get_page(self, page_id: str) -> dict:
+        """페이지 메타데이터 조회"""
+        return await self._request(self._client.pages.retrieve, page_id=page_id)
+    
+    async def get_blocks(self, block_id: str) -> list[dict]:
+        """블록 목록 전체 조회 (페이지네이션 자동 처리)"""
+        blocks: list[dict] = []
+        cursor = None
+        
+        while True:
+            kwargs: dict = {"block_id": block_id, "page_size": 100}
+            if cursor:
+                kwargs["start_cursor"] = cursor
+            
+            response = await self._request(self._client.blocks.children.list, **kwargs)
+            blocks.extend(response.get("results", []))
+            
+            if not response.get("has_more"):
+                break
+            cursor = response.get("next_cursor")
+        
+        return blocks
+    
+    async def get_block_children(
+        self,
+        block_id: str,
+        workers: int | None = None,
+        compact: bool = False,
+    ) -> list[dict]:
+        """자식 블록 트리 전체 조회 (깊이별 너비 우선, 동시 요청 수 제한)"""
+        semaphore = asyncio.Semaphore(workers or config.fetch_workers)
+        
+        async def fetch(block: dict) -> list[dict]:
+            async with semaphore:
+                children = await self.get_blocks(block["id"])
+            return [compact_block(c) for c in children] if compact else children
+        
+        blocks = await self.get_blocks(block_id)
+        if compact:
+            blocks = [compact_block(b) for b in blocks]
+        level = blocks
+        while level:
+            parents: list[dict] = []
+            for block in level:
+                block["children"] = []
+                if block.get("has_children"):
+                    parents.append(block)
+            
+            results = await asyncio.gather(*(fetch(p) for p in parents))
+            next_level: list[dict] = []
+            for parent, children in zip(parents, results):
+                parent["children"] = children
+                next_level.extend(children)
+            level = next_level
+        
+        return blocks
+    
+    # ------------------------------------------------------------------ #
+    # 페이지 생성 / 수정
+    # ------------------------------------------------------------------ #
+    
+    async def create_page(
+        self,
+        parent_id: str,
+        title: str,
+        children: list[dict] | None = None,
+    ) -> dict:
+        """새 페이지 생성 (첫 청크는 생성 요청에 포함)"""
+        children = children or []
+        first = inline_prefix(plan_chunks(children))
+        page = await self._request(
+            self._client.pages.create,
+            idempotent=False,
+            **_page_payload(parent_id, title, first),
+        )
+        
+        if len(first) < len(children):
+            await self.append_blocks(page["id"], children[len(first):])
+        
+        return page
+    
+    async def append_blocks(self, block_id: str, children: list[dict]) -> list[dict]:
+        """블록을 요청 제한에 맞는 청크로 나눠서 추가 (같은 부모에는 순서대로)"""
+        created: list[dict] = []
+        for chunk in plan_chunks(children):
+            response = await self._request(
+                self._client.blocks.children.append,
+                idempotent=False,
+                block_id=block_id,
+                children=chunk.blocks,
+            )
+            results = response.get("results", [])
+            for index, deferred in chunk.deferred.items():
+                await self.append_blocks(results[index]["id"], deferred)
+            created.extend(results)
+        return created
+    
+    # ------------------------------------------------------------------ #
+    # 유틸
+    # ------------------------------------------------------------------ #
+    
+    async def safe_get_blocks(self, block_id: str) -> tuple[list[dict], list[str]]:
         """블록 조회 - 실패한 블록 ID도 함께 반환"""
         blocks: list[dict] = []
         errors: list[str] = []
@@ -126,7 +683,9 @@ class NotionClient:
                 if cursor:
                     kwargs["start_cursor"] = cursor
                 
-                response = self._client.blocks.children.list(**kwargs)
+                response = await self._request(
+                    self._client.blocks.children.list, **kwargs
+                )
                 blocks.extend(response.get("results", []))
                 
                 if not response.get("has_more"):
@@ -137,4 +696,4 @@ class NotionClient:
                 errors.append(f"블록 조회 실패 [{block_id}]: {e}")
                 break
         
-        return blocks, errors
\ No newline at end of file
+        return blocks, errors
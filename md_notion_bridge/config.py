@@ -19,11 +19,28 @@ class Config:
     default_page_id: str = field(
         default_factory=lambda: os.getenv("NOTION_DEFAULT_PAGE_ID", "")
     )
+    # API 주소 (비어 있으면 https://api.notion.com - 가짜 서버 등으로 바꿀 때 사용)
+    base_url: str = field(default_factory=lambda: os.getenv("NOTION_BASE_URL", ""))
     
     # 변환 옵션
     notion_version: str = "2022-06-28"
     max_block_depth: int = 3           # Notion 블록 중첩 최대 깊이
     chunk_size: int = 100              # 배치 처리 시 한 번에 업로드할 블록 수
+    fetch_workers: int = 1             # 블록 트리 조회 시 동시 요청 워커 수
+    
+    # 속도 제한 (Notion API: 평균 초당 3회)
+    rate_limit: float = 3.0            # 초당 허용 요청 수
+    rate_burst: int = 3                # 순간적으로 몰아서 보낼 수 있는 요청 수
+    
+    # 재시도 (429 / 5xx / 타임아웃 / 연결 끊김)
+    max_retries: int = 3               # 요청당 최대 재시도 횟수
+    retry_base_delay: float = 1.0      # 지수 백오프 시작 대기 시간 (초)
+    retry_max_delay: float = 30.0      # 재시도 1회당 최대 대기 시간 (초)
+    
+    # 블록 캐시 (비어 있으면 사용 안 함)
+    cache_dir: str = field(
+        default_factory=lambda: os.getenv("MD_NOTION_CACHE_DIR", "")
+    )
     
     # 한국어 옵션
     normalize_korean: bool = True      # 한국어 유니코드 정규화 여부
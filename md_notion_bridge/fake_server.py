@@ -0,0 +1,427 @@
+"""로컬 가짜 Notion API 서버 (부하 테스트·벤치마크용)
+
+실제 워크스페이스 대신 localhost에서 Notion API 일부를 메모리로 흉내 냅니다.
+``NotionClient(base_url=server.url)`` 로 연결하면 클라이언트·배치 코드를 그대로
+실제 HTTP 요청으로 돌려 볼 수 있습니다.
+
+지원 엔드포인트:
+    POST   /v1/pages                   pages.create (children 포함)
+    GET    /v1/pages/{id}              pages.retrieve
+    PATCH  /v1/pages/{id}              pages.update (제목)
+    GET    /v1/blocks/{id}/children    blocks.children.list (page_size / start_cursor)
+    PATCH  /v1/blocks/{id}/children    blocks.children.append (after 지원)
+    PATCH  /v1/blocks/{id}             blocks.update
+    DELETE /v1/blocks/{id}             blocks.delete
+
+부하 조건:
+    latency            응답마다 기다릴 시간 (초)
+    rate_limit         초당 허용 요청 수 (초과 시 Retry-After 헤더와 함께 429)
+    rate_limit_every   N번째 요청마다 429 (결정적 주입)
+    error_rate         무작위 5xx(500 / 502 / 503) 비율 (``seed`` 로 재현 가능)
+
+    with FakeNotionServer(latency=0.05, rate_limit=3) as server:
+        client = NotionClient(api_key="fake", base_url=server.url)
+
+명령줄에서 띄울 수도 있습니다 (CLI 는 ``NOTION_BASE_URL`` 로 연결)::
+
+    python -m md_notion_bridge.fake_server --port 8787 --latency 0.05 --rate-limit 3
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import math
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+SERVER_ERRORS = (
+    (500, "internal_server_error", "Unexpected error"),
+    (502, "bad_gateway", "Bad gateway"),
+    (503, "service_unavailable", "Service unavailable"),
+)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _with_plain_text(rich_texts: list[dict]) -> list[dict]:
+    """요청의 rich_text 에 응답 필드(plain_text, annotations, href) 채우기"""
+    result = []
+    for rt in rich_texts:
+        text = rt.get("text", {})
+        result.append({
+            **rt,
+            "annotations": {
+                "bold": False, "italic": False, "strikethrough": False,
+                "underline": False, "code": False, "color": "default",
+                **rt.get("annotations", {}),
+            },
+            "plain_text": text.get("content", ""),
+            "href": (text.get("link") or {}).get("url"),
+        })
+    return result
+
+
+def _block_data(block_type: str, data: dict) -> dict:
+    data = dict(data)
+    data.pop("children", None)
+    for key in ("rich_text", "caption"):
+        if key in data:
+            data[key] = _with_plain_text(data[key])
+    if "cells" in data:
+        data["cells"] = [_with_plain_text(cell) for cell in data["cells"]]
+    return data
+
+
+class FakeNotionServer:
+    """스레드에서 도는 가짜 Notion API 서버"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_limit: float = 0.0,
+        rate_limit_every: int = 0,
+        retry_after: float = 1.0,
+        error_rate: float = 0.0,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.pages: dict[str, dict] = {}
+        self.blocks: dict[str, dict] = {}
+        self.children: dict[str, list[dict]] = {}
+        # 요청 통계
+        self.requests = 0
+        self.rate_limited = 0
+        self.server_errors = 0
+        self._random = random.Random(seed)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._httpd = ThreadingHTTPServer((host, port), _handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> FakeNotionServer:
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> FakeNotionServer:
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------ #
+    # 부하 조건
+    # ------------------------------------------------------------------ #
+
+    def _admit(self) -> tuple[int, str, str, dict] | None:
+        """요청을 받을지 판단 - 거절할 때는 (상태, 코드, 메시지, 헤더) 반환"""
+        with self._lock:
+            self.requests += 1
+            retry_after = None
+            if self.rate_limit_every and self.requests % self.rate_limit_every == 0:
+                retry_after = self.retry_after
+            elif self.rate_limit:
+                # 1초 고정 창: 창 안에서 rate_limit 개를 넘으면 창이 끝날 때까지 거절
+                now = time.monotonic()
+                if now - self._window_start >= 1.0:
+                    self._window_start, self._window_count = now, 0
+                self._window_count += 1
+                if self._window_count > self.rate_limit:
+                    retry_after = 1.0 - (now - self._window_start)
+            if retry_after is not None:
+                self.rate_limited += 1
+                return 429, "rate_limited", "Rate limited", {
+                    "Retry-After": str(math.ceil(retry_after * 1000) / 1000),
+                }
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.server_errors += 1
+                status, code, message = self._random.choice(SERVER_ERRORS)
+                return status, code, message, {}
+        return None
+
+    # ------------------------------------------------------------------ #
+    # 저장소
+    # ------------------------------------------------------------------ #
+
+    def _new_id(self) -> str:
+        return f"00000000-0000-4000-8000-{next(self._ids):012d}"
+
+    def _page_of(self, block_id: str) -> dict | None:
+        """블록(또는 페이지)이 속한 페이지"""
+        while block_id in self.blocks:
+            parent = self.blocks[block_id]["parent"]
+            block_id = parent.get("block_id") or parent.get("page_id", "")
+        return self.pages.get(block_id)
+
+    def _touch(self, block_id: str) -> None:
+        """수정된 블록과, 블록이 속한 페이지의 수정 시각 갱신
+
+        실제 API 처럼 중간 부모 블록의 수정 시각은 바꾸지 않습니다
+        (손자 블록만 바뀌면 부모 블록의 ``last_edited_time`` 은 그대로).
+        """
+        now = _now()
+        if block_id in self.blocks:
+            self.blocks[block_id]["last_edited_time"] = now
+        page = self._page_of(block_id)
+        if page is not None:
+            page["last_edited_time"] = now
+
+    def _touch_page(self, block_id: str) -> None:
+        """자식 추가/삭제 - 부모 블록은 그대로 두고 페이지 수정 시각만 갱신"""
+        page = self._page_of(block_id)
+        if page is not None:
+            page["last_edited_time"] = _now()
+
+    def _store_blocks(
+        self, parent_id: str, blocks: list[dict], after: str | None = None
+    ) -> list[dict]:
+        """요청 블록을 응답 모양으로 저장 (중첩 children 은 재귀 저장)"""
+        siblings = self.children[parent_id]
+        index = len(siblings)
+        if after:
+            ids = [b["id"] for b in siblings]
+            if after not in ids:
+                raise KeyError(after)
+            index = ids.index(after) + 1
+
+        parent_key = "page_id" if parent_id in self.pages else "block_id"
+        stored = []
+        for block in blocks:
+            block_type = block.get("type", "")
+            raw = block.get(block_type, {})
+            nested = raw.get("children") or block.get("children") or []
+            block_id = self._new_id()
+            stored_block = {
+                "object": "block",
+                "id": block_id,
+                "parent": {"type": parent_key, parent_key: parent_id},
+                "created_time": _now(),
+                "last_edited_time": _now(),
+                "has_children": bool(nested),
+                "archived": False,
+                "type": block_type,
+                block_type: _block_data(block_type, raw),
+            }
+            self.blocks[block_id] = stored_block
+            self.children[block_id] = []
+            stored.append(stored_block)
+            if nested:
+                self._store_blocks(block_id, nested)
+
+        siblings[index:index] = stored
+        return stored
+
+    def create_page(self, body: dict) -> dict:
+        with self._lock:
+            page_id = self._new_id()
+            page = {
+                "object": "page",
+                "id": page_id,
+                "created_time": _now(),
+                "last_edited_time": _now(),
+                "parent": body.get("parent", {}),
+                "archived": False,
+                "properties": {"title": {"id": "title", "type": "title", "title": []}},
+                "url": f"https://www.notion.so/{page_id.replace('-', '')}",
+            }
+            self.pages[page_id] = page
+            self.children[page_id] = []
+            self._set_title(page, body)
+            self._store_blocks(page_id, body.get("children", []))
+        return page
+
+    def _set_title(self, page: dict, body: dict) -> None:
+        title = body.get("properties", {}).get("title", {}).get("title")
+        if title is not None:
+            page["properties"]["title"]["title"] = _with_plain_text(title)
+
+    def update_page(self, page_id: str, body: dict) -> dict:
+        with self._lock:
+            page = self.pages[page_id]
+            self._set_title(page, body)
+            page["last_edited_time"] = _now()
+        return page
+
+    def list_children(self, block_id: str, query: dict) -> dict:
+        size = min(int(query.get("page_size", ["100"])[0]), 100)
+        start = int(query.get("start_cursor", ["0"])[0])
+        with self._lock:
+            blocks = self.children[block_id]
+            results = blocks[start:start + size]
+            has_more = start + size < len(blocks)
+        return {
+            "object": "list",
+            "results": results,
+            "has_more": has_more,
+            "next_cursor": str(start + size) if has_more else None,
+        }
+
+    def append_children(self, block_id: str, body: dict) -> dict:
+        with self._lock:
+            if block_id not in self.children:
+                raise KeyError(block_id)
+            results = self._store_blocks(block_id, body.get("children", []), body.get("after"))
+            if block_id in self.blocks:
+                self.blocks[block_id]["has_children"] = True
+            self._touch_page(block_id)
+        return {"object": "list", "results": results, "has_more": False, "next_cursor": None}
+
+    def update_block(self, block_id: str, body: dict) -> dict:
+        with self._lock:
+            block = self.blocks[block_id]
+            block_type = block["type"]
+            if block_type in body:
+                block[block_type] = _block_data(block_type, body[block_type])
+            self._touch(block_id)
+        return block
+
+    def delete_block(self, block_id: str) -> dict:
+        with self._lock:
+            block = self.blocks.pop(block_id)
+            parent_id = block["parent"].get("block_id") or block["parent"].get("page_id")
+            self.children[parent_id] = [
+                b for b in self.children[parent_id] if b["id"] != block_id
+            ]
+            self._touch_page(parent_id)
+            block["archived"] = True
+        return block
+
+    def _route(self, method: str, parts: list[str], query: dict, body: dict) -> dict:
+        if parts == ["pages"] and method == "POST":
+            return self.create_page(body)
+        if len(parts) == 2 and parts[0] == "pages":
+            if method == "GET":
+                with self._lock:
+                    return self.pages[parts[1]]
+            if method == "PATCH":
+                return self.update_page(parts[1], body)
+        if len(parts) == 3 and parts[0] == "blocks" and parts[2] == "children":
+            if method == "GET":
+                return self.list_children(parts[1], query)
+            if method == "PATCH":
+                return self.append_children(parts[1], body)
+        if len(parts) == 2 and parts[0] == "blocks":
+            if method == "PATCH":
+                return self.update_block(parts[1], body)
+            if method == "DELETE":
+                return self.delete_block(parts[1])
+        raise LookupError(f"{method} /{'/'.join(parts)}")
+
+
+def _handler(server: FakeNotionServer) -> type[BaseHTTPRequestHandler]:
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True      # 헤더·본문 분할 전송 시 지연(ACK 대기) 방지
+
+        def log_message(self, format, *args) -> None:   # 요청 로그 끔
+            pass
+
+        def _send(self, status: int, body: dict, headers: dict | None = None) -> None:
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _error(self, status: int, code: str, message: str, headers: dict | None = None) -> None:
+            self._send(
+                status,
+                {"object": "error", "status": status, "code": code, "message": message},
+                headers,
+            )
+
+        def _handle(self, method: str) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length)) if length else {}
+            url = urlsplit(self.path)
+            parts = url.path.strip("/").split("/")[1:]     # "v1" 제외
+            if server.latency:
+                time.sleep(server.latency)
+            rejected = server._admit()
+            if rejected:
+                self._error(*rejected)
+                return
+            try:
+                self._send(200, server._route(method, parts, parse_qs(url.query), body))
+            except KeyError as e:
+                self._error(404, "object_not_found", f"Could not find block with ID: {e.args[0]}")
+            except LookupError as e:
+                self._error(400, "invalid_request_url", f"Invalid request URL: {e}")
+
+        def do_GET(self) -> None:
+            self._handle("GET")
+
+        def do_POST(self) -> None:
+            self._handle("POST")
+
+        def do_PATCH(self) -> None:
+            self._handle("PATCH")
+
+        def do_DELETE(self) -> None:
+            self._handle("DELETE")
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="가짜 Notion API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="초당 허용 요청 수")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="N번째 요청마다 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="무작위 5xx 비율")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    server = FakeNotionServer(
+        latency=args.latency,
+        rate_limit=args.rate_limit,
+        rate_limit_every=args.rate_limit_every,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        host=args.host,
+        port=args.port,
+    )
+    print(f"가짜 Notion API: {server.url}  (NOTION_BASE_URL={server.url})")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
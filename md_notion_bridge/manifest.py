@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+MANIFEST_FILENAME = ".md-notion-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _file_hash(path: Path) -> str | None:
+    try:
+        return content_hash(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+@dataclass
+class ManifestEntry:
+    """페이지 하나의 마지막 pull 기록"""
+    last_edited_time: str
+    path: str           # 출력 디렉토리 기준 상대 경로
+    hash: str           # 마지막으로 쓴 마크다운 내용 해시
+    title: str = ""
+    block_count: int = 0
+
+
+class PullManifest:
+    """pull 결과 매니페스트 (출력 디렉토리의 JSON 파일)
+
+    페이지 ID별로 ``last_edited_time``, 출력 파일 경로, 내용 해시를 기록합니다.
+    페이지가 수정되지 않았고 출력 파일도 그대로면 블록 트리를 다시 받지 않습니다.
+    """
+
+    def __init__(self, output_dir: str | Path) -> None:
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / MANIFEST_FILENAME
+        self.pages: dict[str, ManifestEntry] = {}
+        if self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION:
+                self.pages = {
+                    page_id: ManifestEntry(**entry)
+                    for page_id, entry in data.get("pages", {}).items()
+                }
+
+    def get(self, page_id: str) -> ManifestEntry | None:
+        return self.pages.get(page_id)
+
+    def set(self, page_id: str, entry: ManifestEntry) -> None:
+        self.pages[page_id] = entry
+
+    def output_path(self, entry: ManifestEntry) -> Path:
+        return self.output_dir / entry.path
+
+    def relative(self, path: Path) -> str:
+        try:
+            return path.resolve().relative_to(self.output_dir.resolve()).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+    def is_current(self, page_id: str, page: dict) -> bool:
+        """페이지가 마지막 pull 이후 수정되지 않았고 출력 파일도 그대로인지"""
+        entry = self.get(page_id)
+        return bool(
+            entry
+            and entry.last_edited_time
+            and entry.last_edited_time == page.get("last_edited_time")
+            and _file_hash(self.output_path(entry)) == entry.hash
+        )
+
+    def save(self) -> None:
+        data = {
+            "version": MANIFEST_VERSION,
+            "pages": {k: asdict(v) for k, v in sorted(self.pages.items())},
+        }
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+        tmp.replace(self.path)
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """내용이 다를 때만 파일 쓰기 (같으면 mtime 유지) - 썼으면 True"""
+    if _file_hash(path) == content_hash(text):
+        return False
+    path.write_text(text, encoding="utf-8")
+    return True
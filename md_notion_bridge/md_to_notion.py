@@ -1,60 +1,108 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .blocks import build_code_block, build_image_block, build_table_blocks
-from .utils.korean import normalize, normalize_markdown_korean, rich_text_with_limit
+from .utils.korean import (
+    NOTION_TEXT_LIMIT,
+    normalize,
+    normalize_markdown_korean,
+    split_long_text,
+)
+
+if TYPE_CHECKING:
+    from .metrics import PhaseTimings
+
+# 같은 입력의 변환 결과(블록 JSON)가 달라지는 수정을 하면 올림 - 변환 캐시 키에 포함
+CONVERTER_VERSION = 1
 
 
 # ------------------------------------------------------------------ #
 # 인라인 rich_text 변환
 # ------------------------------------------------------------------ #
 
-def parse_inline(text: str) -> list[dict]:
+_INLINE_PATTERN = re.compile(
+    r"(\*\*(.+?)\*\*)"
+    r"|(\*(.+?)\*)"
+    r"|(~~(.+?)~~)"
+    r"|(`(.+?)`)"
+    r"|(\[(.+?)\]\((.+?)\))"
+)
+
+# 매치된 바깥 그룹 번호(m.lastindex) → 서식
+_INLINE_STYLES = {1: "bold", 3: "italic", 5: "strikethrough", 7: "code"}
+_INLINE_LINK = 9
+
+
+def _tokenize_inline(text: str) -> list[dict]:
+    """인라인 마크다운 → rich_text (정규화된 입력 전제, 한 번 스캔)"""
     result: list[dict] = []
-    pattern = re.compile(
-        r"(\*\*(.+?)\*\*)"
-        r"|(\*(.+?)\*)"
-        r"|(~~(.+?)~~)"
-        r"|(`(.+?)`)"
-        r"|(\[(.+?)\]\((.+?)\))"
-    )
     last = 0
-    for m in pattern.finditer(text):
-        if m.start() > last:
-            result.extend(rich_text_with_limit(text[last:m.start()]))
-        if m.group(1):
-            result.append(_annotated(m.group(2), bold=True))
-        elif m.group(3):
-            result.append(_annotated(m.group(4), italic=True))
-        elif m.group(5):
-            result.append(_annotated(m.group(6), strikethrough=True))
-        elif m.group(7):
-            result.append(_annotated(m.group(8), code=True))
-        elif m.group(9):
+    for m in _INLINE_PATTERN.finditer(text):
+        start = m.start()
+        if start > last:
+            result.extend(_plain_chunks(text[last:start]))
+        kind = m.lastindex
+        if kind == _INLINE_LINK:
             result.append(_link(m.group(10), m.group(11)))
+        else:
+            result.append(_styled(m.group(kind + 1), _INLINE_STYLES[kind]))
         last = m.end()
     if last < len(text):
-        result.extend(rich_text_with_limit(text[last:]))
+        result.extend(_plain_chunks(text[last:]))
     return result if result else [_plain("")]
 
 
+def parse_inline(text: str) -> list[dict]:
+    """인라인 마크다운(굵게, 기울임, 취소선, 코드, 링크) → rich_text
+
+    입력은 조각마다가 아니라 한 번만 NFC 정규화합니다.
+    """
+    return _tokenize_inline(normalize(text))
+
+
+def _cell_parser(inline, memoize: bool):
+    """표 셀 파서 (memoize 면 같은 내용의 셀은 첫 결과를 재사용)"""
+    if not memoize:
+        return inline
+    cache: dict[str, list[dict]] = {}
+
+    def parse(text: str) -> list[dict]:
+        rich_text = cache.get(text)
+        if rich_text is None:
+            rich_text = cache[text] = inline(text)
+        return rich_text
+
+    return parse
+
+
 def _plain(text: str) -> dict:
-    return {"type": "text", "text": {"content": normalize(text)}}
+    return {"type": "text", "text": {"content": text}}
 
 
-def _annotated(text: str, **kwargs) -> dict:
+def _plain_chunks(text: str) -> list[dict]:
+    """2000자(UTF-16) 제한에 맞춰 나눈 일반 텍스트 rich_text"""
+    if len(text) * 2 <= NOTION_TEXT_LIMIT:   # BMP 밖 문자만이어도 제한 이내
+        return [_plain(text)]
+    return [_plain(chunk) for chunk in split_long_text(text)]
+
+
+def _styled(text: str, style: str) -> dict:
     return {
         "type": "text",
-        "text": {"content": normalize(text)},
-        "annotations": kwargs,
+        "text": {"content": text},
+        "annotations": {style: True},
     }
 
 
 def _link(text: str, url: str) -> dict:
     return {
         "type": "text",
-        "text": {"content": normalize(text), "link": {"url": url}},
+        "text": {"content": text, "link": {"url": url}},
     }
 
 
@@ -62,32 +110,32 @@ def _link(text: str, url: str) -> dict:
 # 블록 빌더 헬퍼
 # ------------------------------------------------------------------ #
 
-def _heading(level: int, text: str) -> dict:
+def _heading(level: int, rich_text: list[dict]) -> dict:
     clamped = min(level, 3)
     tag = f"heading_{clamped}"
-    return {"type": tag, tag: {"rich_text": parse_inline(text)}}
+    return {"type": tag, tag: {"rich_text": rich_text}}
 
 
-def _paragraph(text: str) -> dict:
-    return {"type": "paragraph", "paragraph": {"rich_text": parse_inline(text)}}
+def _paragraph(rich_text: list[dict]) -> dict:
+    return {"type": "paragraph", "paragraph": {"rich_text": rich_text}}
 
 
-def _bulleted(text: str) -> dict:
+def _bulleted(rich_text: list[dict]) -> dict:
     return {
         "type": "bulleted_list_item",
-        "bulleted_list_item": {"rich_text": parse_inline(text)},
+        "bulleted_list_item": {"rich_text": rich_text},
     }
 
 
-def _numbered(text: str) -> dict:
+def _numbered(rich_text: list[dict]) -> dict:
     return {
         "type": "numbered_list_item",
-        "numbered_list_item": {"rich_text": parse_inline(text)},
+        "numbered_list_item": {"rich_text": rich_text},
     }
 
 
-def _quote(text: str) -> dict:
-    return {"type": "quote", "quote": {"rich_text": parse_inline(text)}}
+def _quote(rich_text: list[dict]) -> dict:
+    return {"type": "quote", "quote": {"rich_text": rich_text}}
 
 
 def _divider() -> dict:
@@ -98,158 +146,330 @@ def _divider() -> dict:
 # 표 파싱 헬퍼
 # ------------------------------------------------------------------ #
 
+_RE_SEPARATOR_ROW = re.compile(r"\|[\s\-:|]+\|")
+
+
 def _is_separator_row(line: str) -> bool:
-    return bool(re.match(r"^\|[\s\-:|]+\|$", line.strip()))
+    return bool(_RE_SEPARATOR_ROW.fullmatch(line.strip()))
 
 
 def _parse_table_row(line: str) -> list[str]:
     return [cell.strip() for cell in line.strip().strip("|").split("|")]
 
 
+# ------------------------------------------------------------------ #
+# 줄 분류기
+# ------------------------------------------------------------------ #
+
+# 줄 종류
+_BLANK, _CODE, _TABLE, _HEADING, _DIVIDER, _QUOTE, _UL, _OL, _IMAGE, _TEXT = range(10)
+
+_RE_HEADING = re.compile(r"(#{1,6})\s+(.*)")
+_RE_DIVIDER = re.compile(r"-{3,}|\*{3,}|_{3,}")
+_RE_UL = re.compile(r"( *)[-*+] (.*)")
+_RE_OL = re.compile(r"( *)\d+\. (.*)")
+_RE_OL_MARKER = re.compile(r"\d+\. ")
+_RE_TODO = re.compile(r"\[(x| )\] (.*)", re.IGNORECASE)
+_RE_IMAGE = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+
+# 첫 글자로 바로 판별되는 줄 (그 외 글자는 문단 또는 공백 들여쓰기)
+_DIVIDER_CHARS = frozenset("-*_")
+_UL_CHARS = frozenset("-*+")
+
+
+def _classify(line: str) -> tuple[int, re.Match | None]:
+    """줄 하나를 첫 글자 기준으로 한 번만 검사해 종류와 매치 결과 반환
+
+    검사 순서는 코드블록 → 표 → 제목 → 수평선 → 인용문 → 목록 → 이미지이며,
+    첫 글자로 해당될 수 없는 패턴은 실행하지 않습니다.
+    """
+    rest = line.lstrip()
+    if not rest:
+        return _BLANK, None
+
+    first = line[0]
+    if first == "`":
+        return (_CODE, None) if line.startswith("```") else (_TEXT, None)
+    if first == "|":
+        return (_TABLE, None) if "|" in line[1:] else (_TEXT, None)
+    if first == "#":
+        m = _RE_HEADING.match(line)
+        return (_HEADING, m) if m else (_TEXT, None)
+    if rest[0] in _DIVIDER_CHARS and _RE_DIVIDER.fullmatch(rest.rstrip()):
+        return _DIVIDER, None
+    if first == ">":
+        return (_QUOTE, None) if line.startswith("> ") else (_TEXT, None)
+    if first == "!":
+        m = _RE_IMAGE.match(line)
+        return (_IMAGE, m) if m else (_TEXT, None)
+
+    if first == " " or first in _UL_CHARS:
+        m = _RE_UL.match(line)
+        if m:
+            return _UL, m
+    if first == " " or first.isdecimal():
+        m = _RE_OL.match(line)
+        if m:
+            return _OL, m
+    return _TEXT, None
+
+
+def _ends_paragraph(line: str) -> bool:
+    """문단 연속 줄 병합을 끝내는 줄인지 (들여쓴 목록·수평선 포함)"""
+    rest = line.lstrip()
+    if not rest or line[0] in "#>|" or line.startswith("```"):
+        return True
+    first = rest[0]
+    if first in _UL_CHARS and rest[1:2] == " ":
+        return True
+    if first in _DIVIDER_CHARS and _RE_DIVIDER.fullmatch(rest.rstrip()):
+        return True
+    return first.isdecimal() and bool(_RE_OL_MARKER.match(rest))
+
+
 # ------------------------------------------------------------------ #
 # 메인 변환 함수
 # ------------------------------------------------------------------ #
 
-def convert(markdown: str, korean_optimize: bool = True) -> list[dict]:
-    """마크다운 문자열 → Notion 블록 리스트"""
-    if korean_optimize:
-        markdown = normalize_markdown_korean(markdown)
+def _iter_converted(lines: Iterable[str], inline, parse_cell) -> Iterator[dict]:
+    """줄 이터레이터 → 완성된 최상위 블록을 순서대로 yield
 
-    blocks: list[dict] = []
-    lines = markdown.splitlines()
-    i = 0
+    들여쓴 목록 줄은 직전 최상위 목록 블록의 자식이 되므로, 최상위 블록은
+    다음 최상위 블록이 나오거나 입력이 끝날 때 완성된 것으로 보고 내보냅니다.
+    """
+    lines = iter(lines)
+    last: dict | None = None    # 아직 자식이 붙을 수 있는 마지막 최상위 블록
+    line = next(lines, None)
 
-    while i < len(lines):
-        line = lines[i]
+    while line is not None:
+        kind, m = _classify(line)
+        block: dict | None = None   # 새 최상위 블록
+        following: str | None = None  # 분기에서 미리 읽은 다음 줄
+
+        # ── 빈 줄 ─────────────────────────────────────────────────
+        if kind == _BLANK:
+            pass
 
         # ── 코드블록 ──────────────────────────────────────────────
-        if line.startswith("```"):
+        elif kind == _CODE:
             lang = line[3:].strip()
             code_lines: list[str] = []
-            i += 1
-            while i < len(lines) and not lines[i].startswith("```"):
-                code_lines.append(lines[i])
-                i += 1
-            blocks.append(build_code_block("\n".join(code_lines), lang))
-            i += 1
-            continue
+            for code_line in lines:
+                if code_line.startswith("```"):
+                    break
+                code_lines.append(code_line)
+            block = build_code_block("\n".join(code_lines), lang)
 
         # ── 표 ────────────────────────────────────────────────────
-        if line.startswith("|") and "|" in line[1:]:
-            table_lines = []
-            while i < len(lines) and lines[i].startswith("|"):
-                table_lines.append(lines[i])
-                i += 1
+        elif kind == _TABLE:
+            table_lines = [line]
+            for following in lines:
+                if not following.startswith("|"):
+                    break
+                table_lines.append(following)
+            else:
+                following = None
+            separators = [_is_separator_row(l) for l in table_lines]
             rows = [
                 _parse_table_row(l)
-                for l in table_lines
-                if not _is_separator_row(l)
+                for l, is_sep in zip(table_lines, separators)
+                if not is_sep
             ]
             if rows:
-                has_header = any(_is_separator_row(l) for l in table_lines)
-                blocks.append(build_table_blocks(rows, has_header))
-            continue
+                block = build_table_blocks(rows, any(separators), parse_cell)
 
         # ── 제목 (H1~H6) ──────────────────────────────────────────
-        heading_match = re.match(r"^(#{1,6})\s+(.*)", line)
-        if heading_match:
-            level = len(heading_match.group(1))
-            blocks.append(_heading(level, heading_match.group(2)))
-            i += 1
-            continue
+        elif kind == _HEADING:
+            block = _heading(len(m.group(1)), inline(m.group(2)))
 
         # ── 수평선 ────────────────────────────────────────────────
-        if re.match(r"^(-{3,}|\*{3,}|_{3,})$", line.strip()):
-            blocks.append(_divider())
-            i += 1
-            continue
+        elif kind == _DIVIDER:
+            block = _divider()
 
         # ── 인용문 ────────────────────────────────────────────────
-        if line.startswith("> "):
-            blocks.append(_quote(line[2:]))
-            i += 1
-            continue
+        elif kind == _QUOTE:
+            block = _quote(inline(line[2:]))
 
         # ── 순서 없는 목록 (중첩 지원) ────────────────────────────
-        ul_match = re.match(r"^( *)[-*+] (.*)", line)
-        if ul_match:
-            spaces = ul_match.group(1)
-            text = ul_match.group(2)
+        elif kind == _UL:
+            spaces, text = m.group(1), m.group(2)
             # 할일 목록 체크
-            todo_match = re.match(r"^\[(x| )\] (.*)", text, re.IGNORECASE)
+            todo_match = _RE_TODO.match(text)
             if todo_match:
                 checked = todo_match.group(1).lower() == "x"
-                todo_block = {
+                block = {
                     "type": "to_do",
                     "to_do": {
-                        "rich_text": parse_inline(todo_match.group(2)),
+                        "rich_text": inline(todo_match.group(2)),
                         "checked": checked,
                     },
                 }
-                blocks.append(todo_block)
             else:
-                block = _bulleted(text)
-                if len(spaces) >= 2 and blocks and blocks[-1]["type"] == "bulleted_list_item":
-                    inner = blocks[-1]["bulleted_list_item"]
-                    inner.setdefault("children", [])
-                    inner["children"].append(block)
+                item = _bulleted(inline(text))
+                if len(spaces) >= 2 and last and last["type"] == "bulleted_list_item":
+                    last["bulleted_list_item"].setdefault("children", []).append(item)
                 else:
-                    blocks.append(block)
-            i += 1
-            continue
+                    block = item
 
         # ── 순서 있는 목록 (중첩 지원) ────────────────────────────
-        ol_match = re.match(r"^( *)\d+\. (.*)", line)
-        if ol_match:
-            spaces = ol_match.group(1)
-            text = ol_match.group(2)
-            block = _numbered(text)
-            if len(spaces) >= 2 and blocks and blocks[-1]["type"] == "numbered_list_item":
-                inner = blocks[-1]["numbered_list_item"]
-                inner.setdefault("children", [])
-                inner["children"].append(block)
+        elif kind == _OL:
+            spaces, text = m.group(1), m.group(2)
+            item = _numbered(inline(text))
+            if len(spaces) >= 2 and last and last["type"] == "numbered_list_item":
+                last["numbered_list_item"].setdefault("children", []).append(item)
             else:
-                blocks.append(block)
-            i += 1
-            continue
+                block = item
 
         # ── 이미지 ────────────────────────────────────────────────
-        img_match = re.match(r"^!\[([^\]]*)\]\(([^)]+)\)", line)
-        if img_match:
-            caption, url = img_match.group(1), img_match.group(2)
-            blocks.append(build_image_block(url, caption))
-            i += 1
-            continue
-
-        # ── 빈 줄 ─────────────────────────────────────────────────
-        if line.strip() == "":
-            i += 1
-            continue
+        elif kind == _IMAGE:
+            caption, url = m.group(1), m.group(2)
+            block = build_image_block(url, caption)
 
         # ── 일반 문단 (연속 줄 병합) ──────────────────────────────
-        para_lines = [line]
-        i += 1
-        while i < len(lines):
-            next_line = lines[i]
-            if (
-                not next_line.strip()
-                or next_line.startswith("#")
-                or next_line.startswith(">")
-                or next_line.startswith("```")
-                or next_line.startswith("|")
-                or re.match(r"^\s*[-*+] ", next_line)
-                or re.match(r"^\s*\d+\. ", next_line)
-                or re.match(r"^(-{3,}|\*{3,}|_{3,})$", next_line.strip())
-            ):
-                break
-            para_lines.append(next_line)
-            i += 1
-        blocks.append(_paragraph(" ".join(para_lines)))
-
-    return blocks
-
-
-def convert_file(path: str, korean_optimize: bool = True) -> list[dict]:
-    """마크다운 파일 → Notion 블록 리스트"""
+        else:
+            para_lines = [line]
+            for following in lines:
+                if _ends_paragraph(following):
+                    break
+                para_lines.append(following)
+            else:
+                following = None
+            block = _paragraph(inline(" ".join(para_lines)))
+
+        if block is not None:
+            if last is not None:
+                yield last
+            last = block
+        line = following if following is not None else next(lines, None)
+
+    if last is not None:
+        yield last
+
+
+def _phase(timings: PhaseTimings | None, name: str):
+    """단계 시간 기록 컨텍스트 (``timings`` 가 없으면 아무것도 하지 않음)"""
+    return nullcontext() if timings is None else timings.phase(name)
+
+
+# ------------------------------------------------------------------ #
+# 파서 엔진
+# ------------------------------------------------------------------ #
+
+# 엔진: (정규화된 마크다운, 인라인 파서, 표 셀 파서) → 최상위 블록 이터레이터
+Engine = Callable[[str, Callable, Callable], Iterator[dict]]
+
+
+def _line_engine(markdown: str, inline, parse_cell) -> Iterator[dict]:
+    return _iter_converted(markdown.splitlines(), inline, parse_cell)
+
+
+_ENGINES: dict[str, Engine] = {"line": _line_engine}
+
+
+def register_engine(name: str, engine: Engine) -> None:
+    """``convert(..., engine=name)`` 으로 선택할 파서 엔진 등록"""
+    _ENGINES[name] = engine
+
+
+def _get_engine(name: str) -> Engine:
+    if name == "mistune" and name not in _ENGINES:
+        # mistune 은 처음 선택될 때만 불러옴
+        from .mistune_engine import iter_mistune_blocks
+        register_engine("mistune", iter_mistune_blocks)
+    try:
+        return _ENGINES[name]
+    except KeyError:
+        raise ValueError(
+            f"알 수 없는 파서 엔진: {name} (사용 가능: {', '.join(sorted({*_ENGINES, 'mistune'}))})"
+        ) from None
+
+
+def _inline_parsers(korean_optimize: bool, memoize_cells: bool):
+    """(인라인 파서, 표 셀 파서) - 한국어 최적화 시 입력이 이미 정규화되어 있음"""
+    inline = _tokenize_inline if korean_optimize else parse_inline
+    return inline, _cell_parser(inline, memoize_cells)
+
+
+def convert(
+    markdown: str,
+    korean_optimize: bool = True,
+    memoize_cells: bool = False,
+    timings: PhaseTimings | None = None,
+    engine: str = "line",
+) -> list[dict]:
+    """마크다운 문자열 → Notion 블록 리스트
+
+    ``memoize_cells`` 를 켜면 내용이 같은 표 셀은 한 번만 파싱하고
+    같은 rich_text 객체를 공유합니다 (반복 셀이 많은 큰 표용).
+    ``timings`` 를 주면 정규화·파싱 시간을 기록합니다.
+    이미 정규화된 문서(``utils.korean.NormalizedText``)는 다시 정규화하지 않습니다.
+    ``engine`` 은 블록 구조 파서입니다 - ``"line"`` (기본, 줄 단위) 또는
+    ``"mistune"`` (CommonMark 블록 AST, 목록 중첩 깊이 제한 없음).
+    """
+    parse = _get_engine(engine)
+    if korean_optimize:
+        # 문서 전체를 한 번에 정규화 → 인라인 조각은 다시 정규화하지 않음
+        with _phase(timings, "normalize"):
+            markdown = normalize_markdown_korean(markdown)
+    inline, parse_cell = _inline_parsers(korean_optimize, memoize_cells)
+    with _phase(timings, "parse"):
+        return list(parse(markdown, inline, parse_cell))
+
+
+def _read_lines(
+    f: Iterable[str],
+    korean_optimize: bool,
+    timings: PhaseTimings | None = None,
+) -> Iterator[str]:
+    """파일을 한 줄씩 읽어 ``convert`` 가 보는 것과 같은 줄 단위로 yield"""
+    held = False    # 보류 중인 마지막 빈 줄
+    for raw in f:
+        if held:
+            yield ""
+            held = False
+        # 파일 줄바꿈(\n) 외에 splitlines 가 인식하는 구분자(\x0b, \u2028 …)도 분리
+        lines = raw.splitlines()
+        if korean_optimize:
+            # 문서 전체 정규화는 맨 끝 빈 줄 하나를 없애므로 다음 줄이 올 때까지 보류
+            if lines and lines[-1] == "":
+                lines.pop()
+                held = True
+            if timings is None:
+                lines = [normalize_markdown_korean(line) for line in lines]
+            else:
+                with timings.phase("normalize"):
+                    lines = [normalize_markdown_korean(line) for line in lines]
+        yield from lines
+
+
+def iter_blocks(
+    path: str | Path,
+    korean_optimize: bool = True,
+    memoize_cells: bool = False,
+    timings: PhaseTimings | None = None,
+) -> Iterator[dict]:
+    """마크다운 파일 → Notion 최상위 블록 제너레이터
+
+    파일을 한 줄씩 읽으며 완성된 블록부터 바로 내보내므로, 파일 전체나
+    블록 리스트 전체를 메모리에 두지 않습니다. 결과는 ``convert_file`` 과 같습니다.
+    ``timings`` 를 주면 읽기·정규화·파싱 시간을 나눠 기록합니다.
+    """
+    inline, parse_cell = _inline_parsers(korean_optimize, memoize_cells)
     with open(path, encoding="utf-8") as f:
-        return convert(f.read(), korean_optimize=korean_optimize)
\ No newline at end of file
+        if timings is None:
+            yield from _iter_converted(_read_lines(f, korean_optimize), inline, parse_cell)
+            return
+        lines = _read_lines(timings.timed("read", f), korean_optimize, timings)
+        yield from timings.timed("parse", _iter_converted(lines, inline, parse_cell))
+
+
+def convert_file(
+    path: str,
+    korean_optimize: bool = True,
+    timings: PhaseTimings | None = None,
+    engine: str = "line",
+) -> list[dict]:
+    """마크다운 파일 → Notion 블록 리스트"""
+    with _phase(timings, "read"), open(path, encoding="utf-8") as f:
+        markdown = f.read()
+    return convert(markdown, korean_optimize=korean_optimize, timings=timings, engine=engine)
@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+# ------------------------------------------------------------------ #
+# API 요청 지표
+# ------------------------------------------------------------------ #
+
+# 지연 시간 히스토그램 구간 상한 (밀리초) - 마지막 구간은 그 이상 전부
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000)
+
+
+@dataclass
+class RequestEvent:
+    """API 요청 시도 1회의 기록 (재시도마다 따로 발생)"""
+    endpoint: str               # 예: "blocks.children.list"
+    seconds: float              # 요청을 보내고 응답(또는 에러)을 받기까지 걸린 시간
+    status: int | None = None   # HTTP 상태 (네트워크 오류·타임아웃은 None)
+    error: str = ""             # 실패 시 예외 클래스 이름
+    attempt: int = 0            # 0 = 첫 시도
+    request_bytes: int = 0      # 보낸 HTTP 본문 크기 (바이트)
+    response_bytes: int = 0     # 받은 HTTP 본문 크기 (바이트, 본문을 못 받으면 0)
+    limiter_wait: float = 0.0   # 보내기 전 속도 제한기에서 기다린 시간
+    retried: bool = False       # 이 시도가 실패해 재시도하는지
+    retry_wait: float = 0.0     # 다음 재시도까지 기다릴 시간
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+# 요청 훅: 요청 시도마다 RequestEvent 를 받는 호출 가능 객체
+RequestHook = Callable[[RequestEvent], None]
+
+
+@dataclass
+class Histogram:
+    """고정 구간 지연 시간 히스토그램"""
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    count: int = 0
+    total: float = 0.0          # 합계 (초)
+    max: float = 0.0            # 최댓값 (초)
+
+    def observe(self, seconds: float) -> None:
+        ms = seconds * 1000
+        index = next(
+            (i for i, bound in enumerate(LATENCY_BUCKETS_MS) if ms <= bound),
+            len(LATENCY_BUCKETS_MS),
+        )
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """q (0~1) 분위수 근사값(초) - 해당 구간의 상한, 마지막 구간이면 최댓값"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                if i < len(LATENCY_BUCKETS_MS):
+                    return min(LATENCY_BUCKETS_MS[i] / 1000, self.max)
+                break
+        return self.max
+
+    def combine(self, other: Histogram, sign: int = 1) -> Histogram:
+        """합(sign=1) 또는 차(sign=-1) - 최댓값은 구간별로 알 수 없으므로 큰 쪽 사용"""
+        return Histogram(
+            [a + sign * b for a, b in zip(self.counts, other.counts)],
+            self.count + sign * other.count,
+            self.total + sign * other.total,
+            max(self.max, other.max),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean * 1000, 2),
+            "p50_ms": round(self.percentile(0.5) * 1000, 2),
+            "p90_ms": round(self.percentile(0.9) * 1000, 2),
+            "p99_ms": round(self.percentile(0.99) * 1000, 2),
+            "max_ms": round(self.max * 1000, 2),
+            "buckets_ms": {
+                **{str(b): n for b, n in zip(LATENCY_BUCKETS_MS, self.counts)},
+                "inf": self.counts[-1],
+            },
+        }
+
+
+@dataclass
+class EndpointStats:
+    """엔드포인트 하나의 누적 통계"""
+    requests: int = 0           # 시도 횟수 (재시도 포함)
+    errors: int = 0             # 실패한 시도
+    rate_limited: int = 0       # 그중 429 응답
+    retries: int = 0            # 실패 후 재시도한 횟수
+    retry_wait: float = 0.0     # 재시도 대기 시간 합계 (초)
+    limiter_wait: float = 0.0   # 속도 제한기 대기 시간 합계 (초)
+    request_bytes: int = 0
+    response_bytes: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+
+    def record(self, event: RequestEvent) -> None:
+        self.requests += 1
+        if not event.ok:
+            self.errors += 1
+            if event.status == 429:
+                self.rate_limited += 1
+        if event.retried:
+            self.retries += 1
+            self.retry_wait += event.retry_wait
+        self.limiter_wait += event.limiter_wait
+        self.request_bytes += event.request_bytes
+        self.response_bytes += event.response_bytes
+        self.latency.observe(event.seconds)
+
+    def combine(self, other: EndpointStats, sign: int = 1) -> EndpointStats:
+        """합(sign=1) 또는 차(sign=-1)"""
+        return EndpointStats(
+            self.requests + sign * other.requests,
+            self.errors + sign * other.errors,
+            self.rate_limited + sign * other.rate_limited,
+            self.retries + sign * other.retries,
+            self.retry_wait + sign * other.retry_wait,
+            self.limiter_wait + sign * other.limiter_wait,
+            self.request_bytes + sign * other.request_bytes,
+            self.response_bytes + sign * other.response_bytes,
+            self.latency.combine(other.latency, sign),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "retries": self.retries,
+            "retry_wait_seconds": round(self.retry_wait, 3),
+            "limiter_wait_seconds": round(self.limiter_wait, 3),
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "latency": self.latency.to_dict(),
+        }
+
+
+@dataclass
+class RequestMetrics:
+    """엔드포인트별 요청 지표 수집기 (스레드 안전)
+
+    ``NotionClient`` 가 요청 시도마다 ``record`` 를 호출합니다 (요청 훅으로도 쓸 수 있음).
+    ``RetryStats`` 처럼 ``snapshot()`` / ``since()`` 로 구간별 증가분을 구할 수 있습니다.
+    """
+
+    endpoints: dict[str, EndpointStats] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(self, event: RequestEvent) -> None:
+        with self._lock:
+            stats = self.endpoints.get(event.endpoint)
+            if stats is None:
+                stats = self.endpoints[event.endpoint] = EndpointStats()
+            stats.record(event)
+
+    __call__ = record
+
+    def snapshot(self) -> RequestMetrics:
+        with self._lock:
+            return RequestMetrics({
+                name: EndpointStats().combine(stats) for name, stats in self.endpoints.items()
+            })
+
+    def since(self, before: RequestMetrics) -> RequestMetrics:
+        """before 스냅샷 이후 증가분 (요청이 없었던 엔드포인트는 제외)"""
+        now = self.snapshot()
+        result = RequestMetrics()
+        for name, stats in now.endpoints.items():
+            delta = stats.combine(before.endpoints.get(name, EndpointStats()), -1)
+            if delta.requests:
+                result.endpoints[name] = delta
+        return result
+
+    @property
+    def total(self) -> EndpointStats:
+        """모든 엔드포인트 합계"""
+        total = EndpointStats()
+        for stats in self.endpoints.values():
+            total = total.combine(stats)
+        return total
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total.to_dict(),
+            "endpoints": {
+                name: stats.to_dict() for name, stats in sorted(self.endpoints.items())
+            },
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, **kwargs)
+
+    def summary(self) -> str:
+        """한 줄 요약 (요청이 없으면 빈 문자열)"""
+        total = self.total
+        if not total.requests:
+            return ""
+        latency = total.latency
+        text = (
+            f"API 요청 {total.requests}회 | "
+            f"평균 {latency.mean * 1000:.0f}ms · p90 {latency.percentile(0.9) * 1000:.0f}ms · "
+            f"최대 {latency.max * 1000:.0f}ms | "
+            f"송신 {_size(total.request_bytes)} · 수신 {_size(total.response_bytes)}"
+        )
+        if total.rate_limited:
+            text += f" | 429 {total.rate_limited}회"
+        if total.retry_wait:
+            text += f" · 재시도 대기 {total.retry_wait:.1f}초"
+        if total.limiter_wait:
+            text += f" | 속도 제한 대기 {total.limiter_wait:.1f}초"
+        return text
+
+
+# ------------------------------------------------------------------ #
+# 단계별 소요 시간
+# ------------------------------------------------------------------ #
+
+# 단계 이름 → 출력용 이름 (처리 순서)
+PHASES = {
+    "read": "읽기",
+    "normalize": "한국어 정규화",
+    "parse": "파싱",
+    "api": "API 호출",
+    "convert": "변환",
+    "write": "쓰기",
+}
+
+
+@dataclass
+class PhaseTimings:
+    """파일 / 페이지 하나를 처리하며 단계별로 쓴 시간 (초)
+
+    ``phase`` 는 중첩될 수 있으며 안쪽 단계 시간은 바깥 단계에서 빠집니다.
+    예를 들어 스트리밍 업로드에서 API 호출 중 다음 블록을 파싱한 시간은
+    ``api`` 가 아니라 ``parse`` 에 들어갑니다.
+    """
+    read: float = 0.0
+    normalize: float = 0.0
+    parse: float = 0.0
+    api: float = 0.0
+    convert: float = 0.0
+    write: float = 0.0
+    _stack: list = field(default_factory=list, repr=False, compare=False)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        now = time.perf_counter()
+        stack = self._stack
+        if stack:
+            # 바깥 단계는 여기까지 누적하고 일시 정지
+            outer = stack[-1]
+            setattr(self, outer[0], getattr(self, outer[0]) + now - outer[1])
+        stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            _, start = stack.pop()
+            setattr(self, name, getattr(self, name) + now - start)
+            if stack:
+                stack[-1][1] = now
+
+    def timed(self, name: str, items: Iterable) -> Iterator:
+        """이터레이터의 다음 항목을 만드는 시간을 ``name`` 단계로 기록"""
+        it = iter(items)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(it)
+                except StopIteration:
+                    return
+            yield item
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """호출 시간을 ``name`` 단계로 기록하는 함수 반환"""
+        def timed_call(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return timed_call
+
+    @property
+    def total(self) -> float:
+        return sum(getattr(self, name) for name in PHASES)
+
+    def combine(self, other: PhaseTimings) -> PhaseTimings:
+        return PhaseTimings(*(getattr(self, n) + getattr(other, n) for n in PHASES))
+
+    def to_dict(self) -> dict:
+        return {name: round(getattr(self, name), 6) for name in PHASES}
+
+    def breakdown(self) -> str:
+        """한 줄 요약 - 시간이 기록된 단계만 (예: ``파싱 1.20초 (60%) · API 호출 0.80초 (40%)``)"""
+        total = self.total
+        return " · ".join(
+            f"{label} {getattr(self, name):.2f}초 ({getattr(self, name) / total:.0%})"
+            for name, label in PHASES.items()
+            if getattr(self, name)
+        )
+
+
+# ------------------------------------------------------------------ #
+# 유틸
+# ------------------------------------------------------------------ #
+
+def _size(n: int) -> str:
+    if n >= 1_048_576:
+        return f"{n / 1_048_576:.1f}MB"
+    if n >= 1024:
+        return f"{n / 1024:.1f}KB"
+    return f"{n}B"
+
+
+def endpoint_name(func) -> str:
+    """SDK 메서드 → 엔드포인트 이름 (``BlocksChildrenEndpoint.list`` → ``blocks.children.list``)"""
+    owner = getattr(func, "__self__", None)
+    name = getattr(func, "__name__", "request")
+    if owner is None:
+        return name
+    cls = type(owner).__name__.removesuffix("Endpoint")
+    words = "".join(f".{c.lower()}" if c.isupper() else c for c in cls).lstrip(".")
+    return f"{words}.{name}" if words else name
@@ -0,0 +1,160 @@
+"""mistune 블록 AST 기반 파서 엔진 (``convert(..., engine="mistune")``)
+
+블록 구조(목록 중첩, 인용문, 표, 코드블록 등)는 mistune 의 CommonMark 블록 파서로
+나누고, 인라인 서식은 줄 단위 엔진과 같은 인라인 파서로 변환합니다.
+그래서 두 엔진의 결과는 블록 구조가 같은 문서에서 동일하며, mistune 엔진은
+목록을 깊이 제한 없이 중첩하고 목록 항목 안의 코드블록·문단도 자식으로 붙입니다.
+
+줄 단위 엔진과 다르게 처리되는 입력 (CommonMark 규칙을 따름):
+
+- 연속된 ``> `` 줄은 인용문 하나 (줄 단위 엔진은 줄마다 인용문)
+- 목록 항목 바로 다음 줄의 들여쓰지 않은 텍스트는 항목에 이어짐
+- 열 수가 맞지 않는 표·구분선 없는 표는 문단, ``\\|`` 는 셀 구분자가 아님
+- setext 제목(``===`` / ``---`` 밑줄), 4칸 들여쓴 코드블록 인식
+- 문단 끝의 공백은 제거
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+
+import mistune
+
+from .blocks import build_code_block, build_image_block, build_table_blocks
+from .md_to_notion import (
+    _RE_IMAGE,
+    _bulleted,
+    _divider,
+    _heading,
+    _numbered,
+    _paragraph,
+    _quote,
+)
+
+# 인라인 파싱은 하지 않으므로 블록 규칙과 블록 단계 플러그인만 사용
+_MARKDOWN = mistune.create_markdown(renderer=None, plugins=["table", "task_lists"])
+
+
+def parse_tokens(markdown: str) -> list[dict]:
+    """마크다운 → mistune 블록 토큰 (인라인 텍스트는 ``text`` 에 원문 그대로)"""
+    markdown = markdown.replace("\r\n", "\n").replace("\r", "\n")
+    state = _MARKDOWN.block.state_cls()
+    state.process(markdown if markdown.endswith("\n") else markdown + "\n")
+    _MARKDOWN.block.parse(state)
+    for hook in _MARKDOWN.before_render_hooks:
+        hook(_MARKDOWN, state)
+    return state.tokens
+
+
+def _text(token: dict) -> str:
+    """블록 토큰의 인라인 원문 - 줄바꿈은 줄 단위 엔진처럼 공백으로 이어 붙임"""
+    return token["text"].strip(" \r\n\t\f").replace("\n", " ")
+
+
+class _BlockBuilder:
+    """mistune 블록 토큰 → Notion 블록 (토큰 트리를 한 번만 순회)"""
+
+    def __init__(self, inline: Callable[[str], list[dict]], parse_cell) -> None:
+        self.inline = inline
+        self.parse_cell = parse_cell
+        self._handlers = {
+            "paragraph": self._paragraph,
+            "block_text": self._paragraph,
+            "heading": self._heading,
+            "thematic_break": self._divider,
+            "block_code": self._code,
+            "block_quote": self._quote,
+            "list": self._list,
+            "table": self._table,
+            "block_html": self._html,
+        }
+
+    def blocks(self, tokens: Iterable[dict]) -> Iterator[dict]:
+        for token in tokens:
+            handler = self._handlers.get(token["type"])
+            if handler is not None:
+                yield from handler(token)
+            elif "text" in token:
+                yield _paragraph(self.inline(_text(token)))
+            elif "children" in token:
+                yield from self.blocks(token["children"])
+            # blank_line 등 내용 없는 토큰은 건너뜀
+
+    def _paragraph(self, token: dict) -> Iterator[dict]:
+        text = token["text"].strip(" \r\n\t\f")
+        first, _, rest = text.partition("\n")
+        # 줄 단위 엔진처럼 이미지로 시작하는 줄은 이미지 블록
+        m = _RE_IMAGE.match(first)
+        if m:
+            yield build_image_block(m.group(2), m.group(1))
+            if not rest:
+                return
+            text = rest
+        yield _paragraph(self.inline(text.replace("\n", " ")))
+
+    def _heading(self, token: dict) -> Iterator[dict]:
+        yield _heading(token["attrs"]["level"], self.inline(_text(token)))
+
+    def _divider(self, token: dict) -> Iterator[dict]:
+        yield _divider()
+
+    def _code(self, token: dict) -> Iterator[dict]:
+        code = token["raw"]
+        if code.endswith("\n"):
+            code = code[:-1]
+        yield build_code_block(code, token.get("attrs", {}).get("info", ""))
+
+    def _quote(self, token: dict) -> Iterator[dict]:
+        children = list(self.blocks(token["children"]))
+        if children and children[0]["type"] == "paragraph":
+            block = _quote(children.pop(0)["paragraph"]["rich_text"])
+        else:
+            block = _quote(self.inline(""))
+        if children:
+            block["quote"]["children"] = children
+        yield block
+
+    def _list(self, token: dict) -> Iterator[dict]:
+        ordered = token["attrs"]["ordered"]
+        for item in token["children"]:
+            children = item["children"]
+            head = None
+            if children and children[0]["type"] in ("block_text", "paragraph"):
+                head, children = children[0], children[1:]
+            rich_text = self.inline(_text(head) if head else "")
+
+            if item["type"] == "task_list_item":
+                block = {
+                    "type": "to_do",
+                    "to_do": {"rich_text": rich_text, "checked": item["attrs"]["checked"]},
+                }
+            else:
+                block = _numbered(rich_text) if ordered else _bulleted(rich_text)
+
+            nested = list(self.blocks(children))
+            if nested:
+                block[block["type"]]["children"] = nested
+            yield block
+
+    def _table(self, token: dict) -> Iterator[dict]:
+        rows = []
+        for section in token["children"]:
+            # table_head 는 셀 목록, table_body 는 table_row 목록
+            section_rows = (
+                [section["children"]] if section["type"] == "table_head"
+                else [row["children"] for row in section["children"]]
+            )
+            rows.extend(
+                [cell["text"].replace("\\|", "|") for cell in cells]
+                for cells in section_rows
+            )
+        yield build_table_blocks(rows, True, self.parse_cell)
+
+    def _html(self, token: dict) -> Iterator[dict]:
+        text = token.get("raw", "").strip(" \r\n\t\f")
+        if text:
+            yield _paragraph(self.inline(text.replace("\n", " ")))
+
+
+def iter_mistune_blocks(markdown: str, inline, parse_cell) -> Iterator[dict]:
+    """(정규화된) 마크다운 → Notion 최상위 블록 제너레이터"""
+    return _BlockBuilder(inline, parse_cell).blocks(parse_tokens(markdown))
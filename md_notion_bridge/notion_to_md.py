@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import io
+from collections.abc import Callable, Iterable
+from typing import Any, TextIO
+
 from .blocks import parse_code_block, parse_image_block_with_warning, parse_table_block
 from .utils.korean import normalize
 
@@ -19,7 +23,7 @@ def rich_text_to_md(rich_texts: list[dict]) -> str:
         # 링크 처리 (어노테이션보다 먼저)
         if href:
             text = f"[{text}]({href})"
-        else:
+        elif annotations:
             # 어노테이션 적용 (순서 중요)
             if annotations.get("code"):
                 text = f"`{text}`"
@@ -39,149 +43,215 @@ def rich_text_to_md(rich_texts: list[dict]) -> str:
 
 
 # ------------------------------------------------------------------ #
-# 블록 타입별 변환
+# 블록 타입별 변환 (타입 → 변환 함수 등록표)
 # ------------------------------------------------------------------ #
 
+# 변환 함수: (블록, 블록 데이터(block[type]), 들여쓰기 깊이) → 마크다운 문자열
+Converter = Callable[[Any, dict, int], str]
+
+_CONVERTERS: dict[str, Converter] = {}
+
+
+def register_converter(block_type: str, func: Converter | None = None):
+    """블록 타입별 변환 함수 등록 (데코레이터로도 사용 가능)
+
+    같은 타입을 다시 등록하면 기존 변환 함수를 대체합니다.
+
+        @register_converter("bookmark")
+        def _bookmark(block, data, depth):
+            return f"<{data.get('url', '')}>"
+    """
+    def decorator(f: Converter) -> Converter:
+        _CONVERTERS[block_type] = f
+        return f
+    return decorator(func) if func is not None else decorator
+
+
+def _convert_typed(block: dict, block_type: str, depth: int) -> str:
+    converter = _CONVERTERS.get(block_type)
+    if converter is None:
+        # 지원하지 않는 블록 타입
+        return f"<!-- unsupported block: {block_type} -->"
+    return converter(block, block.get(block_type, {}), depth)
+
+
 def _convert_block(block: dict, depth: int = 0) -> str:
     """단일 Notion 블록 → 마크다운 문자열"""
-    block_type = block.get("type", "")
-    data = block.get(block_type, {})
-    children = block.get("children", [])
-    indent = " " * depth    # 중첩 목록용 들여쓰기
-    
-    # ── 제목 ──────────────────────────────────────────────────────
-    if block_type == "heading_1":
-        return f"# {rich_text_to_md(data.get('rich_text', []))}"
-    if block_type == "heading_2":
-        return f"## {rich_text_to_md(data.get('rich_text', []))}"
-    if block_type == "heading_3":
-        return f"### {rich_text_to_md(data.get('rich_text', []))}"
-    
-    # ── 문단 ──────────────────────────────────────────────────────
-    if block_type == "paragraph":
-        text = rich_text_to_md(data.get("rich_text", []))
-        if not text.strip():
-            return ""
-        return text
-    
-    # ── 목록 ──────────────────────────────────────────────────────
-    if block_type == "bulleted_list_item":
-        text = rich_text_to_md(data.get("rich_text", []))
-        result = f"{indent}- {text}"
-        if children:
-            child_lines = _convert_blocks(children, depth + 1)
-            result += "\n" + child_lines
-        return result
-    
-    if block_type == "numbered_list_item":
-        text = rich_text_to_md(data.get("rich_text", []))
-        result = f"{indent}1. {text}"
-        if children:
-            child_lines = _convert_blocks(children, depth + 1)
-            result += "\n" + child_lines
-        return result
-    
-    # ── 인용문 ────────────────────────────────────────────────────
-    if block_type == "quote":
-        text = rich_text_to_md(data.get("rich_text", []))
-        return f"> {text}"
-    
-    # ── 콜아웃 (Notion 전용 → 인용문으로 변환) ───────────────────
-    if block_type == "callout":
-        text = rich_text_to_md(data.get("rich_text", []))
-        icon = data.get("icon", {})
-        emoji = icon.get("emoji", "💡") if icon.get("type") == "emoji" else "💡"
-        return f"> {emoji} {text}"
-    
-    # ── 토글 (Notion 전용 → 일반 문단 + 자식 블록) ───────────────
-    if block_type == "toggle":
+    return _convert_typed(block, block.get("type", ""), depth)
+
+
+# ── 제목 ──────────────────────────────────────────────────────────
+def _heading_converter(marker: str) -> Converter:
+    def convert_heading(block, data: dict, depth: int) -> str:
+        return f"{marker} {rich_text_to_md(data.get('rich_text', []))}"
+    return convert_heading
+
+
+for _level in (1, 2, 3):
+    register_converter(f"heading_{_level}", _heading_converter("#" * _level))
+
+
+# ── 문단 ──────────────────────────────────────────────────────────
+@register_converter("paragraph")
+def _paragraph(block, data: dict, depth: int) -> str:
+    text = rich_text_to_md(data.get("rich_text", []))
+    if not text.strip():
+        return ""
+    return text
+
+
+# ── 목록 ──────────────────────────────────────────────────────────
+def _list_converter(marker: str) -> Converter:
+    def convert_item(block, data: dict, depth: int) -> str:
         text = rich_text_to_md(data.get("rich_text", []))
-        result = f"**{text}**"
+        result = f"{' ' * depth}{marker} {text}"    # 중첩 목록용 들여쓰기
+        children = block.get("children", [])
         if children:
-            child_lines = _convert_blocks(children, depth)
-            result += "\n" + child_lines
+            result += "\n" + _convert_blocks(children, depth + 1)
         return result
-    
-    # ── 코드블록 ──────────────────────────────────────────────────
-    if block_type == "code":
-        return parse_code_block(block)
-    
-    # ── 이미지 ────────────────────────────────────────────────────
-    if block_type == "image":
-        return parse_image_block_with_warning(block)
-    
-    # ── 표 ────────────────────────────────────────────────────────
-    if block_type == "table":
-        return parse_table_block(block, children)
-    
-    if block_type == "table_row":
-        # table 블록 안에서 처리되므로 단독 호출 시 스킵
-        return ""
-    
-    # ── 수평선 ────────────────────────────────────────────────────
-    if block_type == "divider":
-        return "---"
-    
-    # ── 할일 목록 ─────────────────────────────────────────────────
-    if block_type == "to_do":
-        text = rich_text_to_md(data.get("rich_text", []))
-        checked = "x" if data.get("checked") else " "
-        return f"{indent}- [{checked}] {text}"
-    
-    # ── 수식 ──────────────────────────────────────────────────────
-    if block_type == "equation":
-        expr = data.get("expression", "")
-        return f"$$\n{expr}\n$$"
-    
-    # ── 지원하지 않는 블록 타입 ───────────────────────────────────
-    return f"<!-- unsupported block: {block_type} -->"
+    return convert_item
 
 
-def _convert_blocks(blocks: list[dict], depth: int = 0) -> str:
-    """블록 리스트 → 마크다운 문자열 (빈 줄 처리 포함)"""
-    lines: list[str] = []
-    prev_type = ""
-    
-    for block in blocks:
+register_converter("bulleted_list_item", _list_converter("-"))
+register_converter("numbered_list_item", _list_converter("1."))
+
+
+@register_converter("to_do")
+def _to_do(block, data: dict, depth: int) -> str:
+    text = rich_text_to_md(data.get("rich_text", []))
+    checked = "x" if data.get("checked") else " "
+    return f"{' ' * depth}- [{checked}] {text}"
+
+
+# ── 인용문 ────────────────────────────────────────────────────────
+@register_converter("quote")
+def _quote(block, data: dict, depth: int) -> str:
+    return f"> {rich_text_to_md(data.get('rich_text', []))}"
+
+
+# ── 콜아웃 (Notion 전용 → 인용문으로 변환) ───────────────────────
+@register_converter("callout")
+def _callout(block, data: dict, depth: int) -> str:
+    text = rich_text_to_md(data.get("rich_text", []))
+    icon = data.get("icon", {})
+    emoji = icon.get("emoji", "💡") if icon.get("type") == "emoji" else "💡"
+    return f"> {emoji} {text}"
+
+
+# ── 토글 (Notion 전용 → 일반 문단 + 자식 블록) ───────────────────
+@register_converter("toggle")
+def _toggle(block, data: dict, depth: int) -> str:
+    result = f"**{rich_text_to_md(data.get('rich_text', []))}**"
+    children = block.get("children", [])
+    if children:
+        result += "\n" + _convert_blocks(children, depth)
+    return result
+
+
+# ── 코드블록 / 이미지 / 표 ────────────────────────────────────────
+register_converter("code", lambda block, data, depth: parse_code_block(block))
+register_converter("image", lambda block, data, depth: parse_image_block_with_warning(block))
+register_converter(
+    "table", lambda block, data, depth: parse_table_block(block, block.get("children", []))
+)
+# table 블록 안에서 처리되므로 단독 호출 시 스킵
+register_converter("table_row", lambda block, data, depth: "")
+
+
+# ── 수평선 ────────────────────────────────────────────────────────
+register_converter("divider", lambda block, data, depth: "---")
+
+
+# ── 수식 ──────────────────────────────────────────────────────────
+@register_converter("equation")
+def _equation(block, data: dict, depth: int) -> str:
+    return f"$$\n{data.get('expression', '')}\n$$"
+
+
+_LIST_TYPES = ("bulleted_list_item", "numbered_list_item", "to_do")
+
+
+class MarkdownWriter:
+    """블록을 받는 대로 마크다운으로 변환해 파일 핸들에 바로 쓰는 writer
+
+    블록 사이 빈 줄 규칙(목록 연속 시 빈 줄 없음, 구분선 앞뒤 빈 줄, 맨 끝 빈 줄 제거)을
+    줄 리스트 없이 적용합니다. 빈 줄은 다음 내용이 나올 때까지 보류했다가 쓰므로
+    ``close()`` 시점에 남은 빈 줄은 버려집니다.
+    """
+
+    def __init__(self, f: TextIO, depth: int = 0, prefix: str = "") -> None:
+        self._f = f
+        self._depth = depth
+        self._prefix = prefix       # 첫 줄 앞에 쓸 문자열 (없으면 아무것도 쓰지 않음)
+        self._prev_type = ""
+        self._started = False       # 한 줄이라도 썼는지
+        self._any = False           # 빈 줄 포함 한 줄이라도 추가했는지
+        self._blanks = 0            # 보류 중인 빈 줄 수
+        self.blocks = 0             # 받은 최상위 블록 수
+
+    def _blank(self) -> None:
+        self._any = True
+        self._blanks += 1
+
+    def _line(self, text: str) -> None:
+        f = self._f
+        for _ in range(self._blanks):
+            f.write("\n" if self._started else self._prefix)
+            self._started = True
+        self._blanks = 0
+        f.write("\n" if self._started else self._prefix)
+        f.write(text)
+        self._started = True
+        self._any = True
+
+    def write(self, block: dict) -> None:
         block_type = block.get("type", "")
-        
+        self.blocks += 1
+
         # 표 블록은 자식(table_row)을 직접 받아서 처리
         if block_type == "table_row":
-            continue
-        
-        converted = _convert_block(block, depth)
+            return
+
+        converted = _convert_typed(block, block_type, self._depth)
         if converted == "":
-            if prev_type not in ("", "paragraph"):
-                lines.append("")
-            prev_type = ""
-            continue
-        
+            if self._prev_type not in ("", "paragraph"):
+                self._blank()
+            self._prev_type = ""
+            return
+
         # 목록 연속 시 빈 줄 삽입 안 함, 그 외엔 블록 사이 빈 줄 추가
-        needs_blank = (
-            prev_type != ""
-            and not (
-                block_type in ("bulleted_list_item", "numbered_list_item", "to_do")
-                and prev_type in ("bulleted_list_item", "numbered_list_item", "to_do")
-            )
-        )
-        if needs_blank:
-            lines.append("")
-        
+        if self._prev_type != "" and not (
+            block_type in _LIST_TYPES and self._prev_type in _LIST_TYPES
+        ):
+            self._blank()
+
         # 구분선은 앞뒤 빈 줄 강제
         if block_type == "divider":
-            if lines and lines[-1] != "":
-                lines.append("")
-            lines.append(converted)
-            lines.append("")
+            if self._any and not self._blanks:
+                self._blank()
+            self._line(converted)
+            self._blank()
         else:
-            lines.append(converted)
-        
-        prev_type = block_type
-    
-    # 맨 끝 빈 줄 제거
-    while lines and lines[-1] == "":
-        lines.pop()
-    return "\n".join(lines)
+            self._line(converted)
+
+        self._prev_type = block_type
+
+    def write_all(self, blocks: Iterable[dict]) -> None:
+        for block in blocks:
+            self.write(block)
+
+    def close(self) -> None:
+        """맨 끝 빈 줄 제거 (보류 중인 빈 줄을 버림)"""
+        self._blanks = 0
+
+
+def _convert_blocks(blocks: list[dict], depth: int = 0) -> str:
+    """블록 리스트 → 마크다운 문자열 (빈 줄 처리 포함)"""
+    buffer = io.StringIO()
+    writer = MarkdownWriter(buffer, depth)
+    writer.write_all(blocks)
+    writer.close()
+    return buffer.getvalue()
 
 
 # ------------------------------------------------------------------ #
@@ -192,22 +262,42 @@ def convert(blocks: list[dict]) -> str:
     """Notion 블록 리스트 → 마크다운 문자열"""
     return _convert_blocks(blocks)
 
+
+def _page_title(page: dict) -> str:
+    try:
+        title_prop = page["properties"]["title"]["title"]
+        return "".join(normalize(t["plain_text"]) for t in title_prop)
+    except (KeyError, IndexError):
+        return "Untitled"
+
+
 def convert_page(page: dict, blocks: list[dict]) -> str:
     """Notion 페이지 메타 + 블록 → 마크다운 문자열
     
     페이지 제목을 H1으로 삽입한 뒤 본문 블록을 변환합니다.
     """
-    try:
-        title_prop = page["properties"]["title"]["title"]
-        title = "".join(normalize(t["plain_text"]) for t in title_prop)
-    except (KeyError, IndexError):
-        title = "Untitled"
-    
+    title = _page_title(page)
     body = convert(blocks)
     return f"# {title}\n\n{body}" if body else f"# {title}"
 
+
+def write_page(page: dict, blocks: Iterable[dict], f: TextIO) -> int:
+    """페이지를 ``convert_page`` 와 같은 형식으로 파일 핸들에 바로 씀
+
+    ``blocks`` 는 이터레이터여도 되며(``NotionClient.iter_block_children``),
+    블록 트리 전체나 마크다운 문자열 전체를 메모리에 두지 않습니다.
+    받은 최상위 블록 수를 반환합니다.
+    """
+    f.write(f"# {_page_title(page)}")
+    writer = MarkdownWriter(f, prefix="\n\n")
+    writer.write_all(blocks)
+    writer.close()
+    return writer.blocks
+
+
 def convert_to_file(blocks: list[dict], path: str) -> None:
     """변환 결과를 파일로 저장"""
-    content = convert(blocks)
     with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
\ No newline at end of file
+        writer = MarkdownWriter(f)
+        writer.write_all(blocks)
+        writer.close()
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from .config import config
+
+
+class RateLimiter:
+    """토큰 버킷 속도 제한기 (스레드 / 코루틴 공용)
+
+    초당 ``rate`` 개의 토큰이 채워지고 최대 ``burst`` 개까지 쌓입니다.
+    토큰을 미리 예약하는 방식이라 여러 워커가 하나의 예산을 공정하게 나눠 씁니다.
+    """
+
+    def __init__(self, rate: float | None = None, burst: int | None = None) -> None:
+        self.rate = rate or config.rate_limit
+        self.burst = burst or config.rate_burst
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """토큰 1개 예약 후 대기해야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """토큰 획득 (동기) - 실제로 대기한 시간 반환"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """토큰 획득 (비동기) - 실제로 대기한 시간 반환"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import random
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+
+from .config import config
+
+
+# 서버가 요청을 처리하지 않았음이 확실한 상태 코드
+RATE_LIMITED = 429
+
+
+def _status(error: Exception) -> int | None:
+    if isinstance(error, HTTPResponseError):
+        return error.status
+    return None
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP 날짜) → 대기 시간(초)"""
+    headers = getattr(error, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RetryPolicy:
+    """API 호출 재시도 정책
+
+    429 / 5xx 응답, 타임아웃, 연결 끊김을 재시도합니다 (멱등하지 않은 요청은 429 만).
+    대기 시간은 ``Retry-After`` 헤더가 있으면 그 값을, 없으면 지수 백오프 + 지터를 사용합니다.
+    """
+
+    max_retries: int = field(default_factory=lambda: config.max_retries)
+    base_delay: float = field(default_factory=lambda: config.retry_base_delay)
+    max_delay: float = field(default_factory=lambda: config.retry_max_delay)
+    jitter: float = 0.5     # 백오프 시간에 곱해지는 무작위 비율 (0 ~ jitter)
+
+    def is_retryable(self, error: Exception, idempotent: bool = True) -> bool:
+        """재시도 대상 에러인지 판단
+
+        생성/추가처럼 멱등하지 않은 요청은 429 만 재시도합니다. 5xx·타임아웃·연결 끊김은
+        서버가 요청을 이미 반영했을 수 있어, 다시 보내면 페이지·블록이 중복될 수 있습니다.
+        """
+        status = _status(error)
+        if status is not None:
+            return status == RATE_LIMITED or (idempotent and status >= 500)
+        if isinstance(error, (RequestTimeoutError, httpx.TransportError, ConnectionError)):
+            return idempotent
+        return False
+
+    def delay(self, attempt: int, error: Exception) -> float:
+        """attempt 번째(0부터) 재시도 전 대기 시간(초)"""
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        backoff = min(self.base_delay * (2 ** attempt), self.max_delay)
+        return backoff * (1 + random.uniform(0, self.jitter))
+
+
+@dataclass
+class RetryStats:
+    """재시도 누적 통계 (스레드 안전)"""
+
+    retries: int = 0
+    rate_limited: int = 0           # 그중 429 응답 횟수
+    wait_seconds: float = 0.0       # 재시도 대기에 쓴 총 시간
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(self, error: Exception, wait: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.wait_seconds += wait
+            if _status(error) == RATE_LIMITED:
+                self.rate_limited += 1
+
+    def snapshot(self) -> RetryStats:
+        with self._lock:
+            return RetryStats(self.retries, self.rate_limited, self.wait_seconds)
+
+    def since(self, before: RetryStats) -> RetryStats:
+        """before 스냅샷 이후 증가분"""
+        now = self.snapshot()
+        return RetryStats(
+            now.retries - before.retries,
+            now.rate_limited - before.rate_limited,
+            now.wait_seconds - before.wait_seconds,
+        )
@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from difflib import SequenceMatcher
+from pathlib import Path
+
+from notion_client.errors import HTTPResponseError
+
+from . import __version__
+from .batch import (
+    BatchReport,
+    PushResult,
+    _client_snapshot,
+    _page_url,
+    _prepare_push,
+    _push_error,
+)
+from .cache import ConversionCache
+from .client import NotionClient
+from .exceptions import NotionAPIError
+from .md_to_notion import CONVERTER_VERSION
+
+STATE_FILENAME = ".md-notion-sync.json"
+STATE_VERSION = 1
+
+
+# ------------------------------------------------------------------ #
+# 동기화 상태 (파일 → 페이지, 블록 해시 → 블록 ID)
+# ------------------------------------------------------------------ #
+
+def block_hash(block: dict) -> str:
+    """블록 내용 해시 (자식 포함, 키 순서 무관)"""
+    data = json.dumps(block, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def _source_hash(file: Path, korean_optimize: bool) -> str:
+    """원본 바이트 + 변환 옵션 + 변환기 버전 해시 (변환기가 바뀌면 다시 동기화)"""
+    digest = hashlib.sha256(file.read_bytes())
+    digest.update(
+        f"\0{int(korean_optimize)}\0{__version__}\0{CONVERTER_VERSION}".encode()
+    )
+    return digest.hexdigest()
+
+
+def _has_children(block: dict) -> bool:
+    data = block.get(block["type"])
+    return bool(isinstance(data, dict) and data.get("children"))
+
+
+@dataclass
+class SyncedBlock:
+    """페이지에 올라가 있는 최상위 블록 하나"""
+    hash: str
+    block_id: str
+    type: str
+    has_children: bool = False
+
+
+@dataclass
+class FileState:
+    """파일 하나의 마지막 동기화 상태
+
+    ``dirty`` 는 지난 동기화가 중간에 실패해 ``blocks`` 를 믿을 수 없다는 표시입니다.
+    다음 동기화 때 같은 페이지의 블록을 모두 다시 씁니다.
+    """
+    page_id: str
+    parent_id: str
+    title: str
+    source_hash: str
+    blocks: list[SyncedBlock] = field(default_factory=list)
+    dirty: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict) -> FileState:
+        blocks = [SyncedBlock(**b) for b in data.get("blocks", [])]
+        return cls(
+            page_id=data["page_id"],
+            parent_id=data["parent_id"],
+            title=data.get("title", ""),
+            source_hash=data.get("source_hash", ""),
+            blocks=blocks,
+            dirty=data.get("dirty", False),
+        )
+
+
+class SyncState:
+    """동기화 상태 파일 (JSON)
+
+    키는 상태 파일이 있는 디렉토리 기준 상대 경로입니다.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.files: dict[str, FileState] = {}
+        if self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == STATE_VERSION:
+                self.files = {
+                    key: FileState.from_dict(value)
+                    for key, value in data.get("files", {}).items()
+                }
+
+    @classmethod
+    def for_directory(cls, directory: str | Path) -> SyncState:
+        return cls(Path(directory) / STATE_FILENAME)
+
+    def key(self, file: Path) -> str:
+        try:
+            return file.resolve().relative_to(self.path.parent.resolve()).as_posix()
+        except ValueError:
+            return file.resolve().as_posix()
+
+    def get(self, file: Path) -> FileState | None:
+        return self.files.get(self.key(file))
+
+    def set(self, file: Path, state: FileState) -> None:
+        self.files[self.key(file)] = state
+
+    def save(self) -> None:
+        data = {
+            "version": STATE_VERSION,
+            "files": {key: asdict(value) for key, value in sorted(self.files.items())},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+        tmp.replace(self.path)
+
+
+# ------------------------------------------------------------------ #
+# 블록 diff 적용
+# ------------------------------------------------------------------ #
+
+@dataclass
+class SyncChanges:
+    """동기화에서 실제로 보낸 변경 수"""
+    appended: int = 0
+    updated: int = 0
+    deleted: int = 0
+
+    def __str__(self) -> str:
+        return f"추가 {self.appended} · 수정 {self.updated} · 삭제 {self.deleted}"
+
+
+def _synced(block: dict, digest: str, created: dict) -> SyncedBlock:
+    return SyncedBlock(digest, created["id"], block["type"], _has_children(block))
+
+
+def _updatable(old: SyncedBlock, new: dict) -> bool:
+    """제자리 수정 가능 여부 (같은 타입, 자식 없음)"""
+    return (
+        old.type == new["type"]
+        and old.type != "table"
+        and not old.has_children
+        and not _has_children(new)
+    )
+
+
+def apply_diff(
+    client: NotionClient,
+    page_id: str,
+    old: list[SyncedBlock],
+    new_blocks: list[dict],
+) -> tuple[list[SyncedBlock], SyncChanges]:
+    """이전 블록 목록 → 새 블록 목록에 필요한 최소 수정/추가/삭제 요청
+
+    해시가 같은 블록은 그대로 두고, 바뀐 구간만 제자리 수정(같은 타입)하거나
+    삭제 후 앞 블록 뒤에 끼워 넣습니다. 페이지 맨 앞에 끼워 넣어야 하는 경우는
+    API로 표현할 수 없어 그 지점부터 끝까지 다시 씁니다.
+    """
+    new_hashes = [block_hash(b) for b in new_blocks]
+    matcher = SequenceMatcher(None, [b.hash for b in old], new_hashes, autojunk=False)
+    result: list[SyncedBlock] = []
+    changes = SyncChanges()
+    anchor: str | None = None
+
+    def insert(j1: int, j2: int) -> None:
+        nonlocal anchor
+        blocks = new_blocks[j1:j2]
+        created = client.append_blocks(page_id, blocks, after=anchor)
+        if len(created) != len(blocks):
+            raise NotionAPIError("추가된 블록 수가 요청과 다릅니다.")
+        result.extend(
+            _synced(b, h, c) for b, h, c in zip(blocks, new_hashes[j1:j2], created)
+        )
+        changes.appended += len(blocks)
+        anchor = created[-1]["id"]
+
+    def delete(blocks: list[SyncedBlock]) -> None:
+        for b in blocks:
+            client.delete_block(b.block_id)
+        changes.deleted += len(blocks)
+
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            result.extend(old[i1:i2])
+            anchor = old[i2 - 1].block_id
+            continue
+
+        # 같은 타입끼리 앞에서부터 제자리 수정
+        updated = 0
+        if tag == "replace":
+            while (
+                i1 + updated < i2
+                and j1 + updated < j2
+                and _updatable(old[i1 + updated], new_blocks[j1 + updated])
+            ):
+                o, j = old[i1 + updated], j1 + updated
+                client.update_block(o.block_id, new_blocks[j])
+                result.append(SyncedBlock(new_hashes[j], o.block_id, o.type))
+                anchor = o.block_id
+                updated += 1
+            changes.updated += updated
+
+        delete(old[i1 + updated:i2])
+        if j1 + updated < j2:
+            if anchor is None and i2 < len(old):
+                # 맨 앞 삽입 → 남은 블록을 지우고 끝까지 다시 추가
+                delete(old[i2:])
+                insert(j1 + updated, len(new_blocks))
+                break
+            insert(j1 + updated, j2)
+
+    return result, changes
+
+
+# ------------------------------------------------------------------ #
+# 파일 / 배치 동기화
+# ------------------------------------------------------------------ #
+
+def _page_exists(client: NotionClient, page_id: str) -> bool:
+    """페이지가 Notion 에 남아 있는지 (삭제·보관·휴지통이면 False)"""
+    try:
+        page = client.get_page(page_id)
+    except HTTPResponseError as e:
+        if e.status != 404:
+            raise
+        return False
+    return not (page.get("archived") or page.get("in_trash"))
+
+
+def _append(client: NotionClient, page_id: str, blocks: list[dict]) -> list[SyncedBlock]:
+    """페이지 끝에 블록 추가 (블록 ID를 받기 위해 append 로 추가)"""
+    created = client.append_blocks(page_id, blocks)
+    if len(created) != len(blocks):
+        raise NotionAPIError("추가된 블록 수가 요청과 다릅니다.")
+    return [_synced(b, block_hash(b), c) for b, c in zip(blocks, created)]
+
+
+def _rewrite(
+    client: NotionClient,
+    page_id: str,
+    blocks: list[dict],
+) -> tuple[list[SyncedBlock], SyncChanges]:
+    """같은 페이지의 최상위 블록을 모두 지우고 새 블록 목록으로 다시 채움
+
+    상태 파일의 블록 ID를 믿을 수 없을 때(Notion 에서 블록이 삭제됨,
+    지난 동기화가 중간에 실패함) 사용합니다.
+    """
+    changes = SyncChanges()
+    for block in client.get_blocks(page_id):
+        try:
+            client.delete_block(block["id"])
+        except HTTPResponseError as e:
+            if e.status != 404:
+                raise
+            continue
+        changes.deleted += 1
+    synced = _append(client, page_id, blocks)
+    changes.appended = len(blocks)
+    return synced, changes
+
+
+def sync_file(
+    file: Path,
+    client: NotionClient,
+    parent_id: str,
+    previous: FileState | None,
+    korean_optimize: bool = True,
+    title: str | None = None,
+    cache: ConversionCache | None = None,
+) -> tuple[PushResult, FileState | None]:
+    """파일 하나를 이전 동기화 상태와 비교해 바뀐 부분만 업로드
+
+    이전 페이지가 삭제(404)·보관된 경우에만 새 페이지를 만들고, 블록 하나가
+    404 이면 같은 페이지를 통째로 다시 씁니다. 페이지에 일부만 반영된 채
+    실패하면 ``dirty`` 상태를 반환해 다음 동기화 때 다시 쓰게 합니다.
+    페이지를 건드리기 전에 실패하면 ``previous`` 를 그대로 반환합니다.
+    """
+    result = PushResult(file=file.name, success=False)
+    page_id: str | None = None
+    reused = False
+
+    try:
+        timings = result.timings
+        with timings.phase("read"):
+            source_hash = _source_hash(file, korean_optimize)
+        if (
+            previous
+            and previous.parent_id == parent_id
+            and not previous.dirty
+            and previous.source_hash == source_hash
+            and (title is None or previous.title == title)
+        ):
+            result.success = True
+            result.skipped = True
+            result.page_url = _page_url(previous.page_id)
+            result.block_count = len(previous.blocks)
+            return result, previous
+
+        h1_title, blocks = _prepare_push(file, korean_optimize, timings, cache)
+        title = title or h1_title
+        changes = SyncChanges()
+
+        with timings.phase("api"):
+            if (
+                previous
+                and previous.parent_id == parent_id
+                and _page_exists(client, previous.page_id)
+            ):
+                page_id, reused = previous.page_id, True
+                if title != previous.title:
+                    client.update_page_title(page_id, title)
+                if previous.dirty:
+                    synced, changes = _rewrite(client, page_id, blocks)
+                else:
+                    try:
+                        synced, changes = apply_diff(client, page_id, previous.blocks, blocks)
+                    except HTTPResponseError as e:
+                        # 상태 파일의 블록이 Notion 에서 삭제됨 → 같은 페이지를 다시 씀
+                        if e.status != 404:
+                            raise
+                        synced, changes = _rewrite(client, page_id, blocks)
+            else:
+                # 처음 올리는 파일이거나 Notion 에서 페이지가 삭제된 경우
+                page_id = client.create_page(parent_id, title)["id"]
+                synced = _append(client, page_id, blocks)
+                changes.appended = len(blocks)
+
+        result.success = True
+        result.page_url = _page_url(page_id)
+        result.block_count = len(blocks)
+        result.changes = str(changes)
+        return result, FileState(page_id, parent_id, title, source_hash, synced)
+
+    except Exception as e:
+        result.error = _push_error(e)
+        if page_id is None:
+            return result, previous
+        # 페이지에 일부만 반영됐을 수 있음 → 다음 동기화 때 같은 페이지를 다시 씀
+        stored_title = previous.title if reused else title
+        return result, FileState(page_id, parent_id, stored_title, "", dirty=True)
+
+
+def batch_sync(
+    files: list[Path],
+    client: NotionClient,
+    parent_id: str,
+    state: SyncState,
+    korean_optimize: bool = True,
+    on_progress=None,  # 콜백: (current, total, result) → None
+    workers: int = 1,
+    cache: ConversionCache | None = None,
+) -> BatchReport:
+    """마크다운 파일 목록을 동기화 모드로 업로드
+
+    처음 보는 파일은 새 페이지를 만들고, 이미 올린 파일은 바뀐 블록만 반영합니다.
+    내용이 그대로인 파일은 파싱도 API 호출도 하지 않습니다.
+    처리가 끝나면 ``state`` 를 저장합니다.
+    """
+    report = BatchReport(total=len(files))
+    before = _client_snapshot(client)
+
+    def sync(file: Path) -> tuple[PushResult, FileState | None]:
+        return sync_file(
+            file, client, parent_id, state.get(file), korean_optimize, cache=cache
+        )
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+            results = pool.map(sync, files) if workers > 1 else map(sync, files)
+
+            for idx, (file, (result, file_state)) in enumerate(zip(files, results)):
+                if file_state:
+                    state.set(file, file_state)
+                if result.skipped:
+                    report.skipped += 1
+                if result.success:
+                    report.success += 1
+                else:
+                    report.failed += 1
+                report.results.append(result)
+
+                if on_progress:
+                    on_progress(idx + 1, len(files), result)
+    finally:
+        state.save()
+
+    report.record_client(client, before)
+    return report
@@ -1,3 +1,3 @@
-from .korean import is_korean, normalize, sanitize_page_title
+from .korean import NormalizedText, is_korean, mark_normalized, normalize, sanitize_page_title
 
-__all__ = ["normalize", "is_korean", "sanitize_page_title"]
\ No newline at end of file
+__all__ = ["normalize", "is_korean", "sanitize_page_title", "mark_normalized", "NormalizedText"]
@@ -4,12 +4,31 @@ import re
 import unicodedata
 
 
+class NormalizedText(str):
+    """``normalize_markdown_korean`` 을 이미 거친 문자열
+
+    ``normalize`` / ``normalize_markdown_korean`` 은 이 타입을 받으면 그대로 반환하므로,
+    한 번 정규화한 문서를 다시 변환할 때 정규화 비용이 들지 않습니다.
+    슬라이싱·분할 등으로 만든 새 문자열은 일반 ``str`` 입니다.
+    """
+    __slots__ = ()
+
+
+def mark_normalized(text: str) -> NormalizedText:
+    """이미 정규화된 문서로 표시 (이후 정규화 단계를 건너뜀)"""
+    return text if isinstance(text, NormalizedText) else NormalizedText(text)
+
+
 def normalize(text: str) -> str:
     """한국어 유니코드 NFC 정규화
     
     macOS에서 작성된 파일은 NFD(자모 분리) 형태로 저장되어
     Windows/Linux에서 깨져 보일 수 있습니다. NFC로 통일합니다.
+    ASCII 문자열과 ``NormalizedText`` 는 검사 없이 그대로 반환합니다.
     """
+    if text.isascii() or isinstance(text, NormalizedText):
+        return text
+    # 이미 NFC 인 문자열은 unicodedata 가 빠른 검사(quick check) 후 그대로 반환
     return unicodedata.normalize("NFC", text)
 
 
@@ -71,78 +90,135 @@ def fix_korean_italic(text: str) -> str:
     return re.sub(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)", replacer, text).strip()
 
 
+# 전각 문장부호 → 반각 (중국어 따옴표「」『』는 한국어 출판 관례대로 유지)
+_FULLWIDTH = {
+    "！": "!",
+    "？": "?",
+    "：": ":",
+    "；": ";",
+    "，": ",",
+    "．": ".",
+    "\u3000": " ",   # 전각 공백 → 반각
+}
+_RE_FULLWIDTH = re.compile(f"[{''.join(_FULLWIDTH)}]")
+
+# str.splitlines 가 줄 경계로 보는 문자 중 \n 이외의 것
+_RE_LINE_BREAKS = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+# 줄 시작 들여쓰기가 아닌 곳의 연속 공백
+_RE_MULTI_SPACE = re.compile(r"(?<=[^ \n])  +")
+
+
 def normalize_punctuation(text: str) -> str:
     """한국어 문서에서 자주 혼용되는 문장부호 정규화
     
     - 전각 문자(！, ？, ：) → 반각
     - 중국어 따옴표(「」『』) → 유지 (한국어 출판 관례 존중)
-    - 연속 공백 → 단일 공백
-    """
-    replacements = {
-        "！": "!",
-        "？": "?",
-        "：": ":",
-        "；": ";",
-        "，": ",",
-        "．": ".",
-        "\u3000": " ",   # 전각 공백 → 반각
-    }
-    for src, dst in replacements.items():
-        text = text.replace(src, dst)
-    
-    # 연속 공백 정리 (줄바꿈 제외, 줄 시작 들여쓰기는 보존)
-    def _clean_line(line: str) -> str:
-        stripped = line.lstrip(" ")
-        indent = line[: len(line) - len(stripped)]
-        return indent + re.sub(r" {2,}", " ", stripped)
+    - 연속 공백 → 단일 공백 (줄 시작 들여쓰기는 보존)
+    - 줄바꿈은 ``\\n`` 으로 통일하고 맨 끝 줄바꿈 하나는 제거
 
-    text = "\n".join(_clean_line(l) for l in text.splitlines())
+    해당하는 문자가 없으면 각 단계를 건너뜁니다.
+    """
+    if not text.isascii() and _RE_FULLWIDTH.search(text):
+        # 문자별 str.replace 가 str.translate 보다 빠름 (translate 는 문자마다 dict 조회)
+        for src, dst in _FULLWIDTH.items():
+            if src in text:
+                text = text.replace(src, dst)
+
+    if _RE_LINE_BREAKS.search(text):
+        text = "\n".join(text.splitlines())
+    elif text.endswith("\n"):
+        text = text[:-1]
+
+    if "  " in text:
+        text = _RE_MULTI_SPACE.sub(" ", text)
     return text
 
 
-def normalize_markdown_korean(text: str) -> str:
-    """마크다운 문자열 전체에 한국어 최적화 적용"""
-    text = normalize(text)          # NFC 정규화
+def normalize_markdown_korean(text: str) -> NormalizedText:
+    """마크다운 문자열 전체에 한국어 최적화 적용
+
+    결과는 ``NormalizedText`` 이므로 같은 문서를 다시 넘기면 바로 반환됩니다.
+    """
+    if isinstance(text, NormalizedText):
+        return text
+    text = normalize(text)              # NFC 정규화
     text = normalize_punctuation(text)  # 문장부호 정규화
-    return text
+    return NormalizedText(text)
 
 
 # ------------------------------------------------------------------ #
 # Notion rich_text 길이 제한 처리
 # ------------------------------------------------------------------ #
 
-NOTION_TEXT_LIMIT = 2000    # Notion rich_text 단일 객체 최대 글자 수
+NOTION_TEXT_LIMIT = 2000    # Notion rich_text 단일 객체 최대 글자 수 (UTF-16 기준)
+
+# 문장 끝(. 。 ! ?) 뒤 공백 - 공백까지 앞 청크에 남기고 다음 문장 앞에서 자름
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.。!?])\s+")
+# 줄 끝 - 코드블록은 줄 단위로 자름
+LINE_BOUNDARY = re.compile(r"\n")
 
 
-def split_long_text(text: str, limit: int = NOTION_TEXT_LIMIT) -> list[str]:
+def utf16_len(text: str) -> int:
+    """Notion API 가 세는 방식(UTF-16 코드 유닛)의 글자 수
+
+    BMP 밖 문자(이모지 등)는 JavaScript 에서 서로게이트 쌍이라 2자로 셉니다.
+    """
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
+
+
+_LAST_BOUNDARY: dict[re.Pattern[str], re.Pattern[str]] = {}
+
+
+def _last_boundary(boundary: re.Pattern[str]) -> re.Pattern[str]:
+    """범위 안의 마지막 경계까지 매치하는 패턴 (탐욕적 ``.*`` 이 끝에서부터 되짚음)"""
+    pattern = _LAST_BOUNDARY.get(boundary)
+    if pattern is None:
+        pattern = re.compile(f"(?s:.*)(?:{boundary.pattern})", boundary.flags)
+        _LAST_BOUNDARY[boundary] = pattern
+    return pattern
+
+
+def split_long_text(
+    text: str,
+    limit: int = NOTION_TEXT_LIMIT,
+    boundary: re.Pattern[str] = SENTENCE_BOUNDARY,
+) -> list[str]:
     """Notion API 제한(2000자)을 초과하는 텍스트를 청크로 분할
-    
-    한국어는 문장 단위(。, .)로 자르고,
-    그래도 초과하면 강제로 limit 단위로 자릅니다.
+
+    제한 안에서 마지막 ``boundary`` (기본: 문장 끝) 뒤에서 자르고,
+    경계가 없으면 limit 위치에서 강제로 자릅니다. 길이는 UTF-16 기준으로 세므로
+    이모지가 많은 텍스트도 API 제한을 넘지 않습니다.
+
+    청크는 원문을 그대로 잘라낸 조각이라 이어 붙이면 원문과 같습니다.
+    청크마다 그 범위만 한 번씩 살피므로 입력 길이에 선형입니다.
     """
-    if len(text) <= limit:
+    if len(text) <= limit and (len(text) * 2 <= limit or utf16_len(text) <= limit):
         return [text]
-    
+
+    last = _last_boundary(boundary)
+    ascii_only = text.isascii()
+    size = len(text)
     chunks: list[str] = []
-    # 문장 단위로 먼저 분할 시도
-    sentences = re.split(r"(?<=[.。!?])\s+", text)
-    current = ""
-    
-    for sentence in sentences:
-        if len(current) + len(sentence) + 1 <= limit:
-            current = f"{current} {sentence}".strip()
-        else:
-            if current:
-                chunks.append(current)
-            # 문장 자체가 limit 초과 → 강제 분할
-            while len(sentence) > limit:
-                chunks.append(sentence[:limit])
-                sentence = sentence[limit:]
-            current = sentence
-    
-    if current:
-        chunks.append(current)
-    
+    start = 0
+
+    while start < size:
+        end = min(start + limit, size)
+        if not ascii_only:
+            # BMP 밖 문자는 2자 - 넘친 만큼의 절반 이상을 덜어내며 줄임
+            while (units := utf16_len(text[start:end])) > limit:
+                end -= (units - limit + 1) // 2
+            end = max(end, start + 1)
+        if end < size:
+            # 범위 안의 마지막 경계, 없으면 강제 분할
+            m = last.match(text, start, end)
+            if m and m.end() > start:
+                end = m.end()
+        chunks.append(text[start:end])
+        start = end
+
     return chunks
 
 
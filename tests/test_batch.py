@@ -0,0 +1,458 @@
+"""배치 처리 테스트"""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+from md_notion_bridge.batch import (
+    BatchReport,
+    async_batch_pull,
+    async_batch_push,
+    batch_pull,
+    batch_push,
+    compile_tree,
+)
+from md_notion_bridge.cache import ConversionCache
+from md_notion_bridge.manifest import MANIFEST_FILENAME, PullManifest
+from md_notion_bridge.md_to_notion import convert_file
+from md_notion_bridge.metrics import PhaseTimings
+from md_notion_bridge.retry import RetryStats
+
+
+# ------------------------------------------------------------------ #
+# 테스트용 가짜 클라이언트
+# ------------------------------------------------------------------ #
+
+def _page(page_id: str, title: str, edited: str = "t0") -> dict:
+    return {
+        "id": page_id,
+        "last_edited_time": edited,
+        "properties": {"title": {"title": [{"plain_text": title}]}},
+    }
+
+
+def _paragraph(text: str) -> dict:
+    return {
+        "type": "paragraph",
+        "paragraph": {"rich_text": [{"plain_text": text}]},
+        "children": [],
+    }
+
+
+class FakeClient:
+    """NotionClient 와 같은 인터페이스의 메모리 클라이언트"""
+
+    def __init__(self, pages: dict[str, str] | None = None) -> None:
+        self.pages = pages or {}
+        self.created: list[tuple[str, int]] = []
+        self.appended: list[tuple[str, int]] = []
+        self.edited: dict[str, str] = {}
+        self.fetched: list[str] = []
+        self.retry_stats = RetryStats()
+
+    def create_page(self, parent_id: str, title: str, children=None) -> dict:
+        self.created.append((title, len(children or [])))
+        return {"id": f"page-{len(self.created)}"}
+
+    def append_blocks(self, block_id: str, children: list[dict]) -> None:
+        self.appended.append((block_id, len(children)))
+
+    def get_page(self, page_id: str) -> dict:
+        if page_id not in self.pages:
+            raise KeyError(page_id)
+        return _page(page_id, self.pages[page_id], self.edited.get(page_id, "t0"))
+
+    def get_block_children(self, block_id: str, **kwargs) -> list[dict]:
+        self.fetched.append(block_id)
+        return [_paragraph(f"{block_id} 본문")]
+
+    def get_page_title(self, page: dict) -> str:
+        return page["properties"]["title"]["title"][0]["plain_text"]
+
+
+class SlowClient(FakeClient):
+    """제목별로 업로드 지연을 주는 클라이언트"""
+
+    def __init__(self, delays: dict[str, float]) -> None:
+        super().__init__()
+        self.delays = delays
+
+    def create_page(self, parent_id: str, title: str, children=None) -> dict:
+        time.sleep(self.delays.get(title, 0))
+        return super().create_page(parent_id, title, children)
+
+
+class SlowPullClient(FakeClient):
+    """페이지별로 조회 지연을 주는 클라이언트"""
+
+    def __init__(self, pages: dict[str, str], delays: dict[str, float]) -> None:
+        super().__init__(pages)
+        self.delays = delays
+
+    def get_page(self, page_id: str) -> dict:
+        time.sleep(self.delays.get(page_id, 0))
+        return super().get_page(page_id)
+
+
+class FakeAsyncClient:
+    """AsyncNotionClient 와 같은 인터페이스의 메모리 클라이언트"""
+
+    def __init__(self, pages: dict[str, str] | None = None) -> None:
+        self.pages = pages or {}
+        self.created: list[tuple[str, int]] = []
+        self.retry_stats = RetryStats()
+
+    async def create_page(self, parent_id: str, title: str, children=None) -> dict:
+        await asyncio.sleep(0)
+        self.created.append((title, len(children or [])))
+        return {"id": f"page-{len(self.created)}"}
+
+    async def get_page(self, page_id: str) -> dict:
+        await asyncio.sleep(0)
+        if page_id not in self.pages:
+            raise KeyError(page_id)
+        return _page(page_id, self.pages[page_id])
+
+    async def get_block_children(self, block_id: str, **kwargs) -> list[dict]:
+        return [_paragraph(f"{block_id} 본문")]
+
+    def get_page_title(self, page: dict) -> str:
+        return page["properties"]["title"]["title"][0]["plain_text"]
+
+
+def _write(tmp_path: Path, name: str, content: str) -> Path:
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+# ------------------------------------------------------------------ #
+# 동기 배치 테스트
+# ------------------------------------------------------------------ #
+
+class TestBatchPush:
+
+    def test_push_files(self, tmp_path):
+        files = [_write(tmp_path, "a.md", "# 가\n\n본문"), _write(tmp_path, "b.md", "본문")]
+        client = FakeClient()
+        report = batch_push(files, client, "parent")
+        assert report.success == 2
+        assert [t for t, _ in client.created] == ["가", "b"]
+
+    def test_workers_keep_input_order(self, tmp_path):
+        files = [_write(tmp_path, f"{i}.md", f"# {i}\n\n본문") for i in range(6)]
+        client = SlowClient(delays={"0": 0.15, "1": 0.05})
+        progress = []
+        report = batch_push(
+            files, client, "parent", workers=4,
+            on_progress=lambda cur, total, r: progress.append((cur, r.file)),
+        )
+        assert report.success == 6
+        assert [r.file for r in report.results] == [f.name for f in files]
+        assert progress == [(i + 1, f"{i}.md") for i in range(6)]
+        # 느린 첫 파일을 기다리는 동안 다른 파일이 먼저 업로드됨
+        assert client.created[0][0] != "0"
+
+    def test_workers_overlap_uploads(self, tmp_path):
+        files = [_write(tmp_path, f"{i}.md", "본문") for i in range(4)]
+        client = SlowClient(delays={str(i): 0.1 for i in range(4)})
+        start = time.monotonic()
+        batch_push(files, client, "parent", workers=4)
+        assert time.monotonic() - start < 0.3
+
+    def test_failures_do_not_sleep(self, tmp_path):
+        """네트워크를 쓰지 않고 실패한 파일은 대기 없이 넘어감"""
+        files = [_write(tmp_path, f"{i}.md", "") for i in range(10)]
+        start = time.monotonic()
+        report = batch_push(files, FakeClient(), "parent")
+        assert report.failed == 10
+        assert time.monotonic() - start < 0.5
+
+    def test_conversion_cache_skips_unchanged_files(self, tmp_path):
+        files = [_write(tmp_path, f"{i}.md", f"# {i}\n\n본문 **굵게**") for i in range(3)]
+        cache = ConversionCache(tmp_path / "cache")
+        first = batch_push(files, FakeClient(), "parent", cache=cache)
+        _write(tmp_path, "2.md", "# 2\n\n바뀐 본문")
+        client = FakeClient()
+        second = batch_push(files, client, "parent", cache=cache)
+        cache.close()
+
+        assert (cache.hits, cache.misses) == (2, 4)
+        assert [r.block_count for r in second.results] == [r.block_count for r in first.results]
+        assert second.results[0].timings.parse == 0 and second.results[2].timings.parse > 0
+        assert [t for t, _ in client.created] == ["0", "1", "2"]
+
+
+class TestBatchPull:
+
+    def test_pull_writes_files(self, tmp_path):
+        client = FakeClient({"p1": "페이지"})
+        report = batch_pull(["p1"], client, tmp_path)
+        assert report.success == 1
+        assert (tmp_path / "페이지.md").exists()
+
+    def test_workers_deterministic_filenames(self, tmp_path):
+        """느린 첫 페이지도 입력 순서대로 파일명을 받음"""
+        client = SlowPullClient(
+            {"p1": "같은 제목", "p2": "같은 제목", "p3": "같은 제목"},
+            delays={"p1": 0.15},
+        )
+        report = batch_pull(["p1", "p2", "p3"], client, tmp_path, workers=3)
+        names = [Path(r.output_path).name for r in report.results]
+        assert names == ["같은 제목.md", "같은 제목_1.md", "같은 제목_2.md"]
+        assert "p1 본문" in (tmp_path / "같은 제목.md").read_text(encoding="utf-8")
+
+    def test_workers_overlap_fetches(self, tmp_path):
+        pages = {f"p{i}": f"페이지 {i}" for i in range(4)}
+        client = SlowPullClient(pages, delays={p: 0.1 for p in pages})
+        start = time.monotonic()
+        report = batch_pull(list(pages), client, tmp_path, workers=4)
+        assert report.success == 4
+        assert time.monotonic() - start < 0.3
+
+    def test_workers_report_failures_in_order(self, tmp_path):
+        client = FakeClient({"p1": "있음"})
+        report = batch_pull(["nope", "p1"], client, tmp_path, workers=2)
+        assert [r.success for r in report.results] == [False, True]
+        assert report.results[0].error.startswith("[알 수 없는 오류]")
+
+    def test_report_counts_retries_during_batch(self, tmp_path):
+        client = FakeClient({"p1": "페이지"})
+        client.retry_stats.record(Exception("이전 배치"), 5.0)
+        original = client.get_page
+
+        def get_page(page_id):
+            client.retry_stats.record(Exception("429"), 1.5)
+            return original(page_id)
+
+        client.get_page = get_page
+        report = batch_pull(["p1"], client, tmp_path)
+        assert report.retries == 1
+        assert report.throttled_seconds == pytest.approx(1.5)
+
+
+class TestIncrementalPull:
+
+    def _pull(self, client, tmp_path, **kwargs):
+        return batch_pull(
+            ["p1", "p2"], client, tmp_path, manifest=PullManifest(tmp_path), **kwargs
+        )
+
+    def test_unchanged_pages_skipped(self, tmp_path):
+        client = FakeClient({"p1": "하나", "p2": "둘"})
+        self._pull(client, tmp_path)
+        mtime = (tmp_path / "하나.md").stat().st_mtime_ns
+        client.fetched.clear()
+
+        report = self._pull(client, tmp_path)
+
+        assert report.skipped == 2 and report.success == 2
+        assert client.fetched == []
+        assert (tmp_path / "하나.md").stat().st_mtime_ns == mtime
+        assert [Path(r.output_path).name for r in report.results] == ["하나.md", "둘.md"]
+
+    def test_edited_page_rewritten_in_place(self, tmp_path):
+        client = FakeClient({"p1": "하나", "p2": "둘"})
+        self._pull(client, tmp_path)
+        client.fetched.clear()
+
+        client.edited["p2"] = "t1"
+        report = self._pull(client, tmp_path)
+
+        assert client.fetched == ["p2"]
+        assert report.skipped == 1
+        # 같은 페이지는 _1 접미사 없이 같은 파일에 씀
+        assert sorted(p.name for p in tmp_path.glob("*.md")) == ["둘.md", "하나.md"]
+
+    def test_locally_modified_file_restored(self, tmp_path):
+        client = FakeClient({"p1": "하나", "p2": "둘"})
+        self._pull(client, tmp_path)
+        (tmp_path / "하나.md").write_text("로컬 수정", encoding="utf-8")
+
+        report = self._pull(client, tmp_path)
+
+        assert report.skipped == 1
+        assert "p1 본문" in (tmp_path / "하나.md").read_text(encoding="utf-8")
+
+    def test_renamed_page_moves_file(self, tmp_path):
+        client = FakeClient({"p1": "하나", "p2": "둘"})
+        self._pull(client, tmp_path)
+
+        client.pages["p1"] = "새 제목"
+        client.edited["p1"] = "t1"
+        self._pull(client, tmp_path)
+
+        assert sorted(p.name for p in tmp_path.glob("*.md")) == ["둘.md", "새 제목.md"]
+
+    def test_force_fetches_everything(self, tmp_path):
+        client = FakeClient({"p1": "하나", "p2": "둘"})
+        self._pull(client, tmp_path)
+        client.fetched.clear()
+
+        report = self._pull(client, tmp_path, force=True)
+
+        assert client.fetched == ["p1", "p2"]
+        assert report.skipped == 0
+
+    def test_manifest_file_written(self, tmp_path):
+        client = FakeClient({"p1": "하나", "p2": "둘"})
+        self._pull(client, tmp_path)
+        data = json.loads((tmp_path / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+        assert data["pages"]["p1"]["path"] == "하나.md"
+        assert data["pages"]["p1"]["last_edited_time"] == "t0"
+
+
+class TestBatchReport:
+
+    def test_summary_without_retries(self):
+        report = BatchReport(total=2, success=1, failed=1)
+        assert report.summary() == "총 2건 | 성공 1건 | 실패 1건 | 성공률 50.0%"
+
+    def test_summary_with_retries(self):
+        report = BatchReport(total=1, success=1, retries=3, throttled_seconds=4.25)
+        assert report.summary().endswith("재시도 3회 (4.2초 대기)")
+
+
+class TestPhaseTimings:
+
+    def test_nested_phase_excluded_from_outer(self):
+        timings = PhaseTimings()
+        with timings.phase("api"):
+            time.sleep(0.02)
+            with timings.phase("parse"):
+                time.sleep(0.05)
+
+        assert 0.02 <= timings.api < 0.05
+        assert timings.parse >= 0.05
+        assert timings.total == pytest.approx(timings.api + timings.parse)
+
+    def test_push_records_phases(self, tmp_path):
+        files = [_write(tmp_path, "a.md", "# 제목\n\n본문 **굵게**\n")]
+        report = batch_push(files, FakeClient(), "parent")
+
+        timings = report.results[0].timings
+        assert timings.read > 0 and timings.normalize > 0 and timings.parse > 0
+        assert timings.api > 0
+        assert timings.convert == timings.write == 0
+
+    def test_pull_records_phases(self, tmp_path):
+        report = batch_pull(["p1", "p2"], FakeClient({"p1": "하나", "p2": "둘"}), tmp_path)
+
+        timings = report.timings
+        assert timings.api > 0 and timings.convert > 0 and timings.write > 0
+        assert timings.parse == 0
+        assert json.loads(report.to_json())["timings"]["write"] > 0
+
+
+# ------------------------------------------------------------------ #
+# 배치 컴파일 테스트
+# ------------------------------------------------------------------ #
+
+class TestCompileTree:
+
+    @pytest.fixture
+    def docs(self, tmp_path):
+        docs = tmp_path / "docs"
+        (docs / "guide").mkdir(parents=True)
+        _write(docs, "index.md", "# 시작\n\n본문 **굵게**\n")
+        _write(docs / "guide", "install.md", "# 설치\n\n```bash\npip install x\n```\n")
+        _write(docs / "guide", "empty.md", "")
+        return docs
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_writes_block_json(self, docs, tmp_path, jobs):
+        report = compile_tree(docs, tmp_path / "out", jobs=jobs)
+
+        assert [r.file for r in report.results] == [
+            "guide/empty.md", "guide/install.md", "index.md",
+        ]
+        assert (report.success, report.failed) == (3, 0)
+
+        data = json.loads((tmp_path / "out" / "guide" / "install.json").read_text(encoding="utf-8"))
+        assert data["source"] == "guide/install.md" and data["title"] == "설치"
+        assert data["children"] == convert_file(str(docs / "guide" / "install.md"))
+
+    def test_empty_file_writes_empty_children(self, docs, tmp_path):
+        """업로드용 빈 문서 검사는 compile 에 적용하지 않음"""
+        report = compile_tree(docs, tmp_path / "out", jobs=1)
+        assert report.results[0].success and report.results[0].block_count == 0
+
+        data = json.loads((tmp_path / "out" / "guide" / "empty.json").read_text(encoding="utf-8"))
+        assert data == {"source": "guide/empty.md", "title": "empty", "children": []}
+
+    def test_unreadable_file_fails(self, docs, tmp_path):
+        (docs / "broken.md").write_bytes(b"\xff\xfe")
+        report = compile_tree(docs, tmp_path / "out", jobs=1)
+        assert report.failed == 1
+        assert not report.results[0].success and report.results[0].file == "broken.md"
+
+    def test_records_per_file_timings(self, docs, tmp_path):
+        report = compile_tree(docs, tmp_path / "out", jobs=2)
+        timings = report.results[2].timings
+        assert timings.parse > 0 and timings.write > 0 and timings.api == 0
+        assert json.loads(report.to_json())["results"][2]["timings"]["parse"] > 0
+
+    def test_unchanged_output_not_rewritten(self, docs, tmp_path):
+        compile_tree(docs, tmp_path / "out", jobs=1)
+        _write(docs, "index.md", "# 시작\n\n바뀐 본문\n")
+        report = compile_tree(docs, tmp_path / "out", jobs=1)
+        assert [r.skipped for r in report.results if r.success] == [True, True, False]
+        assert report.skipped == 2
+
+    def test_workers_share_conversion_cache(self, docs, tmp_path):
+        compile_tree(docs, tmp_path / "out", jobs=2, cache_dir=tmp_path / "cache")
+        report = compile_tree(docs, tmp_path / "out2", jobs=2, cache_dir=tmp_path / "cache")
+        assert report.success == 3
+        assert all(r.timings.parse == 0 for r in report.results if r.success)
+
+
+# ------------------------------------------------------------------ #
+# 비동기 배치 테스트
+# ------------------------------------------------------------------ #
+
+class TestAsyncBatchPush:
+
+    def test_results_in_input_order(self, tmp_path):
+        files = [
+            _write(tmp_path, f"{i}.md", f"# 문서 {i}\n\n본문") for i in range(5)
+        ]
+        client = FakeAsyncClient()
+        report = asyncio.run(async_batch_push(files, client, "parent", concurrency=3))
+        assert report.success == 5
+        assert [r.file for r in report.results] == [f.name for f in files]
+        assert sorted(t for t, _ in client.created) == [f"문서 {i}" for i in range(5)]
+
+    def test_empty_file_fails(self, tmp_path):
+        files = [_write(tmp_path, "empty.md", "")]
+        report = asyncio.run(async_batch_push(files, FakeAsyncClient(), "parent"))
+        assert report.failed == 1
+        assert report.results[0].error.startswith("[변환 실패]")
+
+
+class TestAsyncBatchPull:
+
+    def test_pull_writes_files(self, tmp_path):
+        client = FakeAsyncClient({"p1": "첫 페이지", "p2": "둘째 페이지"})
+        report = asyncio.run(async_batch_pull(["p1", "p2"], client, tmp_path))
+        assert report.success == 2
+        assert (tmp_path / "첫 페이지.md").read_text(encoding="utf-8").startswith("# 첫 페이지")
+
+    def test_duplicate_titles_get_suffix(self, tmp_path):
+        client = FakeAsyncClient({"p1": "같은 제목", "p2": "같은 제목"})
+        report = asyncio.run(async_batch_pull(["p1", "p2"], client, tmp_path))
+        paths = sorted(Path(r.output_path).name for r in report.results)
+        assert paths == ["같은 제목.md", "같은 제목_1.md"]
+
+    def test_missing_page_reported(self, tmp_path):
+        client = FakeAsyncClient({"p1": "있음"})
+        progress = []
+        report = asyncio.run(async_batch_pull(
+            ["p1", "nope"], client, tmp_path,
+            on_progress=lambda cur, total, r: progress.append(cur),
+        ))
+        assert report.success == 1 and report.failed == 1
+        assert report.results[1].error.startswith("[알 수 없는 오류]")
+        assert progress == [1, 2]
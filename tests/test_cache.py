@@ -0,0 +1,154 @@
+"""디스크 캐시 테스트"""
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+from md_notion_bridge import md_to_notion
+from md_notion_bridge.cache import BlockCache, ConversionCache
+from md_notion_bridge.md_to_notion import convert_file
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = BlockCache(tmp_path / "cache")
+    yield c
+    c.close()
+
+
+class TestBlockCache:
+
+    def test_miss(self, cache):
+        assert cache.get("block", "2026-01-01T00:00:00.000Z") is None
+        assert cache.misses == 1
+
+    def test_hit_same_time(self, cache):
+        children = [{"id": "c1", "type": "paragraph", "paragraph": {"rich_text": []}}]
+        cache.put("block", "t1", children)
+        assert cache.get("block", "t1") == children
+        assert cache.hits == 1
+
+    def test_changed_time_is_miss(self, cache):
+        cache.put("block", "t1", [{"id": "old"}])
+        assert cache.get("block", "t2") is None
+
+    def test_replace_previous_version(self, cache):
+        cache.put("block", "t1", [{"id": "old"}])
+        cache.put("block", "t2", [{"id": "new"}])
+        assert cache.get("block", "t1") is None
+        assert cache.get("block", "t2") == [{"id": "new"}]
+
+    def test_persists_across_instances(self, tmp_path):
+        first = BlockCache(tmp_path)
+        first.put("block", "t1", [{"id": "한글 블록"}])
+        first.close()
+        second = BlockCache(tmp_path)
+        assert second.get("block", "t1") == [{"id": "한글 블록"}]
+        second.close()
+
+    def test_returns_fresh_copies(self, cache):
+        cache.put("block", "t1", [{"id": "c1"}])
+        cache.get("block", "t1")[0]["children"] = ["변경"]
+        assert cache.get("block", "t1") == [{"id": "c1"}]
+
+
+@pytest.fixture
+def conversions(tmp_path):
+    c = ConversionCache(tmp_path / "cache")
+    yield c
+    c.close()
+
+
+def _write(tmp_path, name: str, content: str, newline: str | None = None):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8", newline=newline)
+    return path
+
+
+class TestConversionCache:
+
+    @pytest.mark.parametrize("korean_optimize", [True, False])
+    def test_same_result_as_convert_file(self, conversions, tmp_path, korean_optimize):
+        path = _write(tmp_path, "doc.md", "# 제목\r\n\r\n본문！  **굵게**\r\n- 목록\r\n", newline="")
+        expected = convert_file(str(path), korean_optimize)
+        assert conversions.convert_file(path, korean_optimize) == expected   # 미적중
+        assert conversions.convert_file(path, korean_optimize) == expected   # 적중
+        assert (conversions.hits, conversions.misses) == (1, 1)
+
+    def test_hit_skips_parsing(self, conversions, tmp_path, monkeypatch):
+        path = _write(tmp_path, "doc.md", "# 제목\n\n본문")
+        conversions.convert_file(path)
+        monkeypatch.setattr(md_to_notion, "_get_engine", pytest.fail)
+        assert conversions.convert_file(path)[0]["type"] == "heading_1"
+
+    def test_key_covers_content_and_options(self, conversions, tmp_path):
+        path = _write(tmp_path, "doc.md", "본문")
+        conversions.convert_file(path)
+        conversions.convert_file(path, korean_optimize=False)
+        conversions.convert_file(_write(tmp_path, "copy.md", "본문"))   # 경로는 키가 아님
+        _write(tmp_path, "doc.md", "바뀐 본문")
+        assert conversions.convert_file(path)[0]["paragraph"]["rich_text"][0]["text"]["content"] == "바뀐 본문"
+        assert (conversions.hits, conversions.misses) == (1, 3)
+
+    def test_converter_version_in_key(self, monkeypatch):
+        key = ConversionCache.key(b"x", True)
+        monkeypatch.setattr("md_notion_bridge.cache.CONVERTER_VERSION", 999)
+        assert ConversionCache.key(b"x", True) != key
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ConversionCache(tmp_path, max_bytes=250)
+        for name in ("a", "b", "c"):
+            cache.put(name, [{"id": name * 90}])
+        assert cache.size <= 250
+        assert cache.get("a") is None and cache.get("c") is not None
+
+        cache.get("b")                              # b 를 최근 사용으로
+        cache.put("d", [{"id": "d" * 90}])
+        assert cache.get("c") is None and cache.get("b") is not None
+        assert cache.evictions == 2
+        cache.close()
+
+    def test_oversized_entry_not_stored(self, tmp_path):
+        cache = ConversionCache(tmp_path, max_bytes=10)
+        cache.put("big", [{"id": "x" * 100}])
+        assert cache.get("big") is None and cache.size == 0
+        cache.close()
+
+    def test_size_limit_shared_across_instances(self, tmp_path):
+        """compile 워커처럼 같은 디렉토리를 여러 연결이 열어도 제한은 전체에 적용"""
+        first = ConversionCache(tmp_path, max_bytes=250)
+        second = ConversionCache(tmp_path, max_bytes=250)
+        for i, cache in enumerate([first, second] * 2):
+            cache.put(str(i), [{"id": str(i) * 90}])
+        first.close()
+        second.close()
+        reopened = ConversionCache(tmp_path)
+        assert 0 < reopened.size <= 250
+        reopened.close()
+
+    def test_db_errors_fall_back_to_conversion(self, tmp_path):
+        class LockedConnection:
+            def execute(self, *args):
+                raise sqlite3.OperationalError("database is locked")
+
+            def rollback(self):
+                pass
+
+        cache = ConversionCache(tmp_path / "cache")
+        conn, cache._conn = cache._conn, LockedConnection()
+        path = _write(tmp_path, "doc.md", "# 제목\n\n본문")
+
+        assert cache.convert_file(path) == convert_file(str(path))
+        assert cache.errors == 2                    # 조회 + 저장
+        cache._conn = conn
+        cache.close()
+
+    def test_size_persists_across_instances(self, tmp_path):
+        first = ConversionCache(tmp_path)
+        first.put("k", [{"id": "한글"}])
+        size = first.size
+        first.close()
+        second = ConversionCache(tmp_path)
+        assert second.size == size > 0
+        assert second.get("k") == [{"id": "한글"}]
+        second.close()
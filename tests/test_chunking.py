@@ -0,0 +1,99 @@
+"""요청 청크 계획 테스트"""
+from __future__ import annotations
+
+import copy
+
+from md_notion_bridge.chunking import MAX_NESTING, inline_prefix, plan_chunks
+from md_notion_bridge.md_to_notion import convert
+
+
+def _para(text: str = "문단") -> dict:
+    return {
+        "type": "paragraph",
+        "paragraph": {"rich_text": [{"type": "text", "text": {"content": text}}]},
+    }
+
+
+def _item(depth: int, width: int = 1) -> dict:
+    """depth 단계, 단계마다 width 개 자식을 가진 목록 항목"""
+    block = {"type": "bulleted_list_item", "bulleted_list_item": {"rich_text": []}}
+    if depth:
+        block["bulleted_list_item"]["children"] = [
+            _item(depth - 1, width) for _ in range(width)
+        ]
+    return block
+
+
+def _table(rows: int) -> dict:
+    md = "| a | b |\n|---|---|\n" + "\n".join(f"| {i} | {i} |" for i in range(rows - 1))
+    return convert(md)[0]
+
+
+def _depth(block: dict) -> int:
+    children = block[block["type"]].get("children") or []
+    return 1 + max((_depth(c) for c in children), default=-1)
+
+
+class TestPlanChunks:
+
+    def test_flat_blocks_by_chunk_size(self):
+        chunks = plan_chunks([_para() for _ in range(250)])
+        assert [len(c.blocks) for c in chunks] == [100, 100, 50]
+        assert all(not c.deferred for c in chunks)
+
+    def test_empty(self):
+        assert plan_chunks([]) == []
+
+    def test_shallow_nesting_inlined(self):
+        block = _item(depth=MAX_NESTING)
+        chunks = plan_chunks([block])
+        assert chunks[0].blocks[0] is block
+        assert chunks[0].deferred == {}
+
+    def test_deep_nesting_deferred(self):
+        chunks = plan_chunks([_para(), _item(depth=4)])
+        inline = chunks[0].blocks[1]
+        assert _depth(inline) <= MAX_NESTING
+        assert list(chunks[0].deferred) == [1]
+        assert _depth(chunks[0].deferred[1][0]) == 3
+
+    def test_wide_table_keeps_first_rows(self):
+        table = _table(rows=250)
+        chunks = plan_chunks([table])
+        inline_rows = chunks[0].blocks[0]["table"]["children"]
+        assert len(inline_rows) == 100
+        assert len(chunks[0].deferred[0]) == 150
+
+    def test_element_limit(self):
+        # 블록 하나 = 1 + 10 + 100 = 111개 요소
+        blocks = [_item(depth=2, width=10) for _ in range(20)]
+        chunks = plan_chunks(blocks, max_elements=1000)
+        assert all(c.elements <= 1000 for c in chunks)
+        assert sum(len(c.blocks) for c in chunks) == 20
+        assert len(chunks) == 3
+
+    def test_byte_limit(self):
+        blocks = [_para("가" * 1000) for _ in range(50)]
+        chunks = plan_chunks(blocks, max_bytes=20_000)
+        assert len(chunks) > 1
+        assert all(c.size <= 20_000 for c in chunks)
+
+    def test_original_blocks_untouched(self):
+        blocks = [_item(depth=4), _table(rows=150)]
+        snapshot = copy.deepcopy(blocks)
+        plan_chunks(blocks)
+        assert blocks == snapshot
+
+
+class TestInlinePrefix:
+
+    def test_stops_before_deferred(self):
+        chunks = plan_chunks([_para(), _para(), _item(depth=4), _para()])
+        assert len(inline_prefix(chunks)) == 2
+
+    def test_whole_first_chunk(self):
+        chunks = plan_chunks([_para() for _ in range(120)])
+        assert len(inline_prefix(chunks)) == 100
+
+    def test_empty(self):
+        assert inline_prefix([]) == []
@@ -0,0 +1,499 @@
+"""Notion 클라이언트 래퍼 테스트"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+
+from md_notion_bridge.blocks import CompactBlock
+from md_notion_bridge.cache import BlockCache
+from md_notion_bridge.client import AsyncNotionClient, NotionClient
+from md_notion_bridge.ratelimit import RateLimiter
+from md_notion_bridge.retry import RetryPolicy
+
+
+# ------------------------------------------------------------------ #
+# 테스트용 가짜 Notion SDK
+# ------------------------------------------------------------------ #
+
+def _raw(block_id: str, has_children: bool = False, edited: str = "t0") -> dict:
+    """테스트용 원본 블록 (API 응답 형태)"""
+    return {
+        "id": block_id,
+        "type": "paragraph",
+        "paragraph": {"rich_text": []},
+        "has_children": has_children,
+        "last_edited_time": edited,
+    }
+
+
+class FakeChildren:
+    """blocks.children.list 를 흉내 내는 가짜 엔드포인트"""
+
+    def __init__(self, tree: dict[str, list[dict]], page_size: int = 100) -> None:
+        self.tree = tree
+        self.page_size = page_size
+        self.calls: list[str] = []
+        self.appended: list[tuple[str, int]] = []
+        self._lock = threading.Lock()
+
+    def list(self, block_id: str, page_size: int = 100, start_cursor: str | None = None) -> dict:
+        with self._lock:
+            self.calls.append(block_id)
+        children = self.tree.get(block_id, [])
+        start = int(start_cursor or 0)
+        end = start + min(page_size, self.page_size)
+        has_more = end < len(children)
+        return {
+            "results": [dict(b) for b in children[start:end]],
+            "has_more": has_more,
+            "next_cursor": str(end) if has_more else None,
+        }
+
+    def append(self, block_id: str, children: list[dict]) -> dict:
+        with self._lock:
+            self.appended.append((block_id, len(children)))
+            offset = len(self.appended)
+        return {
+            "results": [
+                {"id": f"{block_id}/{offset}-{i}", "type": b["type"]}
+                for i, b in enumerate(children)
+            ]
+        }
+
+
+class FakePages:
+    """pages.create / pages.retrieve 를 흉내 내는 가짜 엔드포인트"""
+
+    def __init__(self) -> None:
+        self.created: list[dict] = []
+
+    def create(self, **payload) -> dict:
+        self.created.append(payload)
+        return {"id": "new-page", **payload}
+
+    def retrieve(self, page_id: str) -> dict:
+        return {"id": page_id}
+
+
+class FakeHTTPError(HTTPResponseError):
+    """notion-client 버전과 무관하게 만들 수 있는 HTTP 에러"""
+
+    def __init__(self, status: int, headers: dict | None = None) -> None:
+        Exception.__init__(self, f"HTTP {status}")
+        self.status = status
+        self.headers = httpx.Headers(headers or {})
+
+
+class Flaky:
+    """처음 몇 번은 에러를 던지고 이후 성공하는 가짜 API 함수"""
+
+    def __init__(self, *errors: Exception) -> None:
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self, **kwargs) -> dict:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"ok": True, **kwargs}
+
+
+class FakeAsyncChildren(FakeChildren):
+    """AsyncClient 용 blocks.children 엔드포인트"""
+
+    async def list(self, **kwargs) -> dict:
+        await asyncio.sleep(0)
+        return FakeChildren.list(self, **kwargs)
+
+    async def append(self, block_id: str, children: list[dict]) -> dict:
+        return FakeChildren.append(self, block_id, children)
+
+
+class FakeAsyncPages(FakePages):
+
+    async def create(self, **payload) -> dict:
+        return FakePages.create(self, **payload)
+
+    async def retrieve(self, page_id: str) -> dict:
+        return FakePages.retrieve(self, page_id)
+
+
+class CountingLimiter(RateLimiter):
+    """대기 없이 획득 횟수만 세는 속도 제한기"""
+
+    def __init__(self) -> None:
+        super().__init__(rate=1000, burst=1000)
+        self.count = 0
+        self._count_lock = threading.Lock()
+
+    def acquire(self) -> float:
+        with self._count_lock:
+            self.count += 1
+        return 0.0
+
+
+def _client(tree: dict[str, list[dict]], page_size: int = 100) -> tuple[NotionClient, FakeChildren]:
+    client = NotionClient(api_key="secret_test", rate_limiter=CountingLimiter())
+    children = FakeChildren(tree, page_size)
+    client._client = SimpleNamespace(
+        blocks=SimpleNamespace(children=children), pages=FakePages()
+    )
+    return client, children
+
+
+def _async_client(tree: dict[str, list[dict]]) -> tuple[AsyncNotionClient, FakeAsyncChildren]:
+    client = AsyncNotionClient(api_key="secret_test", rate_limiter=RateLimiter(1000, 1000))
+    children = FakeAsyncChildren(tree)
+    client._client = SimpleNamespace(
+        blocks=SimpleNamespace(children=children), pages=FakeAsyncPages()
+    )
+    return client, children
+
+
+def _sample_tree() -> dict[str, list[dict]]:
+    return {
+        "page": [_raw("a", True), _raw("b"), _raw("c", True)],
+        "a": [_raw("a1", True), _raw("a2")],
+        "a1": [_raw("a1x")],
+        "c": [_raw("c1"), _raw("c2", True)],
+        "c2": [_raw("c2x")],
+    }
+
+
+def _shape(blocks: list[dict]) -> list:
+    return [(b["id"], _shape(b["children"])) for b in blocks]
+
+
+# ------------------------------------------------------------------ #
+# get_block_children 테스트
+# ------------------------------------------------------------------ #
+
+class TestGetBlockChildren:
+
+    def test_sequential_tree(self):
+        client, _ = _client(_sample_tree())
+        blocks = client.get_block_children("page", workers=1)
+        assert _shape(blocks) == [
+            ("a", [("a1", [("a1x", [])]), ("a2", [])]),
+            ("b", []),
+            ("c", [("c1", []), ("c2", [("c2x", [])])]),
+        ]
+
+    def test_parallel_matches_sequential(self):
+        seq_client, _ = _client(_sample_tree())
+        par_client, _ = _client(_sample_tree())
+        expected = _shape(seq_client.get_block_children("page", workers=1))
+        assert _shape(par_client.get_block_children("page", workers=4)) == expected
+
+    def test_each_parent_fetched_once(self):
+        client, children = _client(_sample_tree())
+        client.get_block_children("page", workers=4)
+        assert sorted(children.calls) == ["a", "a1", "c", "c2", "page"]
+
+    def test_breadth_first_order(self):
+        """같은 깊이의 부모를 모두 조회한 뒤 다음 깊이로 내려감"""
+        client, children = _client(_sample_tree())
+        client.get_block_children("page", workers=1)
+        assert children.calls == ["page", "a", "c", "a1", "c2"]
+
+    def test_leaf_gets_empty_children(self):
+        client, _ = _client({"page": [_raw("x")]})
+        blocks = client.get_block_children("page")
+        assert blocks[0]["children"] == []
+
+    def test_paginated_children(self):
+        tree = {"page": [_raw(f"b{i}") for i in range(5)]}
+        client, children = _client(tree, page_size=2)
+        blocks = client.get_block_children("page", workers=2)
+        assert [b["id"] for b in blocks] == [f"b{i}" for i in range(5)]
+        assert children.calls == ["page"] * 3
+
+    def test_every_request_goes_through_limiter(self):
+        client, children = _client(_sample_tree())
+        client.get_block_children("page", workers=4)
+        assert client.rate_limiter.count == len(children.calls)
+
+    def test_compact_tree(self):
+        expected = _shape(_client(_sample_tree())[0].get_block_children("page"))
+        client, _ = _client(_sample_tree())
+        blocks = client.get_block_children("page", workers=2, compact=True)
+        assert _shape(blocks) == expected
+        assert all(isinstance(b, CompactBlock) for b in blocks[0]["children"])
+
+
+class TestIterBlockChildren:
+
+    def test_same_tree_as_get_block_children(self):
+        expected = _shape(_client(_sample_tree())[0].get_block_children("page"))
+        client, _ = _client(_sample_tree())
+        assert _shape(list(client.iter_block_children("page", workers=2))) == expected
+
+    def test_fetches_one_response_page_at_a_time(self):
+        tree = {"page": [_raw(f"b{i}", True) for i in range(5)]}
+        tree.update({f"b{i}": [_raw(f"b{i}x")] for i in range(5)})
+        client, children = _client(tree, page_size=2)
+        stream = client.iter_block_children("page")
+        assert next(stream)["id"] == "b0"
+        # 첫 응답 페이지(b0, b1)의 하위 트리만 조회된 상태
+        assert children.calls == ["page", "b0", "b1"]
+        assert [b["id"] for b in stream] == ["b1", "b2", "b3", "b4"]
+
+    def test_root_list_cached_without_children(self, tmp_path):
+        client, children = _client(_sample_tree())
+        client.block_cache = BlockCache(tmp_path)
+        list(client.iter_block_children("page", last_edited_time="p1"))
+        children.calls.clear()
+
+        blocks = list(client.iter_block_children("page", last_edited_time="p1"))
+
+        assert children.calls == []
+        assert _shape(blocks)[0] == ("a", [("a1", [("a1x", [])]), ("a2", [])])
+        assert "children" not in client.block_cache.get("page", "p1")[0]
+
+
+def _dividers(count: int) -> list[dict]:
+    return [{"type": "divider", "divider": {}} for _ in range(count)]
+
+
+class TestCreatePage:
+
+    def test_small_page_is_single_request(self):
+        client, children = _client({})
+        client.create_page("parent", "제목", children=_dividers(40))
+        assert len(client._client.pages.created[0]["children"]) == 40
+        assert children.appended == []
+        assert client.rate_limiter.count == 1
+
+    def test_remainder_appended(self):
+        client, children = _client({})
+        client.create_page("parent", "제목", children=_dividers(230))
+        assert len(client._client.pages.created[0]["children"]) == 100
+        assert children.appended == [("new-page", 100), ("new-page", 30)]
+
+    def test_no_children(self):
+        client, children = _client({})
+        client.create_page("parent", "제목")
+        assert "children" not in client._client.pages.created[0]
+        assert children.appended == []
+
+    def test_deferred_children_not_inlined(self):
+        """미룬 자식이 있는 블록부터는 append 로 보내 생성된 ID를 받음"""
+        client, children = _client({})
+        blocks = _dividers(3) + [_nested_item(depth=4)] + _dividers(2)
+        client.create_page("parent", "제목", children=blocks)
+        assert len(client._client.pages.created[0]["children"]) == 3
+        assert children.appended[0] == ("new-page", 3)
+
+
+class TestBlockCacheIntegration:
+
+    def _client(self, tmp_path, tree):
+        client, children = _client(tree)
+        client.block_cache = BlockCache(tmp_path)
+        return client, children
+
+    def test_unchanged_page_served_from_cache(self, tmp_path):
+        client, children = self._client(tmp_path, _sample_tree())
+        first = client.get_block_children("page", last_edited_time="p1")
+        calls = len(children.calls)
+        second = client.get_block_children("page", last_edited_time="p1")
+        assert len(children.calls) == calls
+        assert _shape(second) == _shape(first)
+
+    def test_changed_grandchild_refetched(self, tmp_path):
+        """손자 블록만 바뀌어 중간 부모(c)의 수정 시각이 그대로여도 다시 조회"""
+        tree = _sample_tree()
+        client, children = self._client(tmp_path, tree)
+        client.get_block_children("page", last_edited_time="p1")
+
+        tree["c2"] = [_raw("c2y", edited="t1")]
+        children.calls.clear()
+        blocks = client.get_block_children("page", last_edited_time="p2")
+        assert sorted(children.calls) == ["a", "a1", "c", "c2", "page"]
+        assert _shape(blocks)[2] == ("c", [("c1", []), ("c2", [("c2y", [])])])
+
+    def test_no_root_time_skips_cache(self, tmp_path):
+        client, children = self._client(tmp_path, {"page": [_raw("x")]})
+        client.get_block_children("page")
+        client.get_block_children("page")
+        assert children.calls == ["page", "page"]
+
+
+def _nested_item(depth: int) -> dict:
+    """depth 단계로 중첩된 목록 항목"""
+    block = {"type": "bulleted_list_item", "bulleted_list_item": {"rich_text": []}}
+    if depth:
+        block["bulleted_list_item"]["children"] = [_nested_item(depth - 1)]
+    return block
+
+
+class TestAppendBlocks:
+
+    def test_returns_created_blocks(self):
+        client, _ = _client({})
+        created = client.append_blocks("page", _dividers(150))
+        assert len(created) == 150
+
+    def test_stream_appends_in_chunks(self):
+        client, children = _client({})
+        seen = []
+        count = client.append_block_stream(
+            "page", iter(_dividers(250)), on_progress=seen.append
+        )
+        assert count == 250
+        assert seen == [100, 200, 250]
+        assert [n for _, n in children.appended] == [100, 100, 50]
+
+    def test_deep_children_appended_to_returned_ids(self):
+        client, children = _client({})
+        client.append_blocks("page", [_nested_item(depth=4)])
+        # 최상위 1회 → 반환된 블록 ID에 나머지 하위 트리를 단계적으로 추가
+        assert children.appended == [("page", 1), ("page/1-0", 1), ("page/1-0/2-0", 1)]
+
+
+class TestAsyncNotionClient:
+
+    def test_block_tree_matches_sync(self):
+        sync_client, _ = _client(_sample_tree())
+        async_client, _ = _async_client(_sample_tree())
+        expected = _shape(sync_client.get_block_children("page"))
+        blocks = asyncio.run(async_client.get_block_children("page", workers=3))
+        assert _shape(blocks) == expected
+
+    def test_create_page_inlines_first_chunk(self):
+        client, children = _async_client({})
+        blocks = [{"type": "divider", "divider": {}}] * 250
+        page = asyncio.run(client.create_page("parent", "제목", children=blocks))
+        assert page["id"] == "new-page"
+        assert len(page["children"]) == 100
+        assert children.appended == [("new-page", 100), ("new-page", 50)]
+
+    def test_shared_helpers(self):
+        client, _ = _async_client({})
+        page = {"properties": {"title": {"title": [{"plain_text": "제목"}]}}}
+        assert client.get_page_title(page) == "제목"
+
+
+class TestRateLimiter:
+
+    def test_burst_is_free(self):
+        limiter = RateLimiter(rate=10, burst=3)
+        assert [limiter._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_waits_after_burst(self):
+        limiter = RateLimiter(rate=10, burst=1)
+        limiter._reserve()
+        assert limiter._reserve() == pytest.approx(0.1, abs=0.02)
+        assert limiter._reserve() == pytest.approx(0.2, abs=0.02)
+
+    def test_async_acquire(self):
+        limiter = RateLimiter(rate=50, burst=1)
+
+        async def run():
+            await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+
+        start = time.monotonic()
+        asyncio.run(run())
+        assert time.monotonic() - start >= 0.035
+
+
+class TestRetryPolicy:
+
+    def test_retryable_errors(self):
+        policy = RetryPolicy()
+        assert policy.is_retryable(FakeHTTPError(429))
+        assert policy.is_retryable(FakeHTTPError(502))
+        assert policy.is_retryable(httpx.ConnectError("reset"))
+        assert policy.is_retryable(RequestTimeoutError())
+        assert not policy.is_retryable(FakeHTTPError(400))
+        assert not policy.is_retryable(ValueError("bug"))
+
+    def test_non_idempotent_only_rate_limited(self):
+        """생성/추가 요청은 이미 반영됐을 수 있는 5xx·타임아웃을 재시도하지 않음"""
+        policy = RetryPolicy()
+        assert policy.is_retryable(FakeHTTPError(429), idempotent=False)
+        assert not policy.is_retryable(FakeHTTPError(502), idempotent=False)
+        assert not policy.is_retryable(FakeHTTPError(500), idempotent=False)
+        assert not policy.is_retryable(httpx.ReadTimeout("slow"), idempotent=False)
+
+    def test_retry_after_seconds(self):
+        policy = RetryPolicy(max_delay=60)
+        assert policy.delay(0, FakeHTTPError(429, {"Retry-After": "7"})) == 7.0
+
+    def test_retry_after_capped(self):
+        policy = RetryPolicy(max_delay=5)
+        assert policy.delay(0, FakeHTTPError(429, {"Retry-After": "120"})) == 5
+
+    def test_backoff_with_jitter(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=30, jitter=0.5)
+        for attempt in range(3):
+            wait = policy.delay(attempt, FakeHTTPError(503))
+            assert 2 ** attempt <= wait <= 2 ** attempt * 1.5
+
+
+class TestClientRetry:
+
+    def _client(self, max_retries: int = 3) -> NotionClient:
+        client, _ = _client({})
+        client.retry_policy = RetryPolicy(max_retries=max_retries, base_delay=0, jitter=0)
+        return client
+
+    def test_retries_then_succeeds(self):
+        client = self._client()
+        func = Flaky(FakeHTTPError(429, {"Retry-After": "0"}), FakeHTTPError(500))
+        assert client._request(func, page_id="x") == {"ok": True, "page_id": "x"}
+        assert func.calls == 3
+        assert client.retry_stats.retries == 2
+        assert client.retry_stats.rate_limited == 1
+
+    def test_gives_up_after_max_retries(self):
+        client = self._client(max_retries=2)
+        func = Flaky(*(FakeHTTPError(503) for _ in range(5)))
+        with pytest.raises(HTTPResponseError):
+            client._request(func)
+        assert func.calls == 3
+
+    def test_non_idempotent_502_not_retried(self):
+        client = self._client()
+        func = Flaky(FakeHTTPError(502))
+        with pytest.raises(HTTPResponseError):
+            client._request(func, idempotent=False)
+        assert func.calls == 1
+        assert client.retry_stats.retries == 0
+
+    def test_client_error_not_retried(self):
+        client = self._client()
+        func = Flaky(FakeHTTPError(404))
+        with pytest.raises(HTTPResponseError):
+            client._request(func)
+        assert func.calls == 1
+
+    def test_async_retries(self):
+        client, _ = _async_client({})
+        client.retry_policy = RetryPolicy(base_delay=0, jitter=0)
+        func = Flaky(httpx.ConnectError("reset"))
+
+        async def call(**kwargs):
+            return func(**kwargs)
+
+        assert asyncio.run(client._request(call)) == {"ok": True}
+        assert client.retry_stats.retries == 1
+
+
+class TestExtractPageId:
+
+    def test_url(self):
+        url = "https://www.notion.so/Title-0123456789abcdef0123456789abcdef"
+        assert NotionClient.extract_page_id(url) == "01234567-89ab-cdef-0123-456789abcdef"
+
+    def test_hyphenated_uuid(self):
+        page_id = "01234567-89ab-cdef-0123-456789abcdef"
+        assert NotionClient.extract_page_id(page_id) == page_id
+        assert NotionClient.extract_page_id(f"https://www.notion.so/{page_id}") == page_id
+
@@ -0,0 +1,276 @@
+"""가짜 Notion 서버 + NotionClient(base_url) 테스트 (실제 HTTP 요청)"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+
+import pytest
+from notion_client.errors import APIResponseError, HTTPResponseError
+
+from md_notion_bridge.batch import batch_pull, batch_push
+from md_notion_bridge.cache import BlockCache
+from md_notion_bridge.client import AsyncNotionClient, NotionClient
+from md_notion_bridge.fake_server import FakeNotionServer
+from md_notion_bridge.md_to_notion import convert
+from md_notion_bridge.metrics import RequestEvent
+from md_notion_bridge.ratelimit import RateLimiter
+from md_notion_bridge.retry import RetryPolicy
+from md_notion_bridge.sync import sync_file
+
+
+@pytest.fixture
+def server():
+    with FakeNotionServer(retry_after=0.01, seed=0) as server:
+        yield server
+
+
+@pytest.fixture(autouse=True)
+def _quiet_sdk_logger():
+    logger = logging.getLogger("notion_client")
+    level = logger.level
+    yield
+    logger.setLevel(level)
+
+
+def _client(server: FakeNotionServer, **policy) -> NotionClient:
+    client = NotionClient(
+        api_key="fake",
+        rate_limiter=RateLimiter(rate=1000, burst=1000),
+        retry_policy=RetryPolicy(base_delay=0.01, **policy),
+        base_url=server.url,
+    )
+    logging.getLogger("notion_client").setLevel(logging.CRITICAL)
+    return client
+
+
+def _paragraphs(count: int) -> list[dict]:
+    return convert("\n\n".join(f"문단 {i}" for i in range(count)))
+
+
+def _three_levels() -> list[dict]:
+    """부모 → 자식 → 손자 목록 (줄 단위 엔진은 2단계까지만 중첩)"""
+    return convert("- 부모\n  - 자식\n    - 손자", engine="mistune")
+
+
+class TestFakeServer:
+
+    def test_create_and_read_back_with_pagination(self, server):
+        client = _client(server)
+        page = client.create_page("root", "제목", children=_paragraphs(250))
+
+        assert client.get_page_title(client.get_page(page["id"])) == "제목"
+        blocks = client.get_blocks(page["id"])
+        assert [b["paragraph"]["rich_text"][0]["plain_text"] for b in blocks] == [
+            f"문단 {i}" for i in range(250)
+        ]
+        # create 1 (100블록) + append 2 (100 + 50) + list 3 + retrieve 1
+        assert server.requests == 7
+
+    def test_nested_children_stored_as_tree(self, server):
+        client = _client(server)
+        blocks = convert("- 부모\n  - 자식\n\n| a | b |\n|---|---|\n| 1 | 2 |")
+        page = client.create_page("root", "중첩", children=blocks)
+
+        tree = client.get_block_children(page["id"])
+        assert tree[0]["has_children"]
+        assert tree[0]["children"][0]["bulleted_list_item"]["rich_text"][0]["plain_text"] == "자식"
+        assert [row["type"] for row in tree[1]["children"]] == ["table_row", "table_row"]
+
+    def test_grandchild_edit_keeps_parent_time(self, server):
+        """실제 API 처럼 손자 블록 수정은 페이지 시각만 바꾸고 중간 부모 시각은 그대로"""
+        client = _client(server)
+        page = client.create_page("root", "중첩", children=_three_levels())
+        parent = client.get_block_children(page["id"])[0]
+        child = parent["children"][0]
+        grandchild = child["children"][0]
+        page_time = client.get_page(page["id"])["last_edited_time"]
+
+        time.sleep(0.002)
+        client.update_block(grandchild["id"], convert("- 손자 (수정)")[0])
+
+        tree = client.get_block_children(page["id"])
+        assert tree[0]["last_edited_time"] == parent["last_edited_time"]
+        assert tree[0]["children"][0]["last_edited_time"] == child["last_edited_time"]
+        assert client.get_page(page["id"])["last_edited_time"] != page_time
+
+    def test_block_cache_sees_grandchild_edit(self, server, tmp_path):
+        client = _client(server)
+        client.block_cache = BlockCache(tmp_path)
+        page = client.create_page("root", "중첩", children=_three_levels())
+
+        def pull() -> str:
+            meta = client.get_page(page["id"])
+            tree = client.get_block_children(page["id"], last_edited_time=meta["last_edited_time"])
+            leaf = tree[0]["children"][0]["children"][0]
+            return leaf["bulleted_list_item"]["rich_text"][0]["plain_text"]
+
+        assert pull() == "손자"
+        grandchild_id = client.get_block_children(page["id"])[0]["children"][0]["children"][0]["id"]
+        time.sleep(0.002)
+        client.update_block(grandchild_id, convert("- 손자 (수정)")[0])
+
+        assert pull() == "손자 (수정)"
+        requests = server.requests
+        assert pull() == "손자 (수정)"
+        assert server.requests == requests + 1     # 페이지 조회만, 블록 트리는 캐시
+        client.block_cache.close()
+
+    def test_rate_limited_request_is_retried(self, server):
+        server.rate_limit_every = 2
+        client = _client(server)
+        page = client.create_page("root", "제목")
+
+        client.get_page(page["id"])
+
+        assert server.rate_limited == 1
+        assert client.retry_stats.rate_limited == 1
+
+    def test_server_errors_are_retried(self, server):
+        server.error_rate = 1.0
+        client = _client(server, max_retries=2)
+
+        with pytest.raises(HTTPResponseError) as info:
+            client.get_page("missing")
+
+        assert info.value.status in (500, 502, 503)
+        assert server.server_errors == 3
+        assert client.retry_stats.retries == 2
+
+    def test_unknown_block_is_404(self, server):
+        with pytest.raises(APIResponseError) as info:
+            _client(server).get_blocks("00000000-0000-4000-8000-999999999999")
+        assert info.value.status == 404
+
+    def test_batch_round_trip(self, server, tmp_path):
+        files = []
+        for i in range(3):
+            path = tmp_path / f"doc{i}.md"
+            path.write_text(f"# 문서 {i}\n\n본문 **{i}**\n", encoding="utf-8")
+            files.append(path)
+        client = _client(server)
+
+        push = batch_push(files, client, "root", workers=2)
+        pull = batch_pull(list(server.pages), client, tmp_path / "out", workers=2)
+
+        assert push.failed == 0 and pull.failed == 0
+        assert (tmp_path / "out" / "문서 1.md").read_text(encoding="utf-8") == (
+            "# 문서 1\n\n# 문서 1\n\n본문 **1**"
+        )
+
+    def test_sync_updates_and_deletes(self, server, tmp_path):
+        file = tmp_path / "doc.md"
+        file.write_text("# 제목\n\n하나\n\n둘\n\n셋\n", encoding="utf-8")
+        client = _client(server)
+        _, state = sync_file(file, client, "root", None)
+
+        file.write_text("# 제목\n\n하나 (수정)\n\n셋\n", encoding="utf-8")
+        result, state = sync_file(file, client, "root", state)
+
+        assert result.success
+        texts = [
+            b["paragraph"]["rich_text"][0]["plain_text"]
+            for b in client.get_blocks(state.page_id)
+            if b["type"] == "paragraph"
+        ]
+        assert texts == ["하나 (수정)", "셋"]
+
+    def test_sync_after_block_deleted_in_notion(self, server, tmp_path):
+        file = tmp_path / "doc.md"
+        file.write_text("# 제목\n\n하나\n\n둘\n", encoding="utf-8")
+        client = _client(server)
+        _, first = sync_file(file, client, "root", None)
+        client.delete_block(first.blocks[1].block_id)
+
+        file.write_text("# 제목\n\n하나 (수정)\n\n둘\n", encoding="utf-8")
+        result, state = sync_file(file, client, "root", first)
+
+        assert result.success
+        assert state.page_id == first.page_id
+        assert len(server.pages) == 1
+        texts = [
+            b["paragraph"]["rich_text"][0]["plain_text"]
+            for b in client.get_blocks(state.page_id)
+            if b["type"] == "paragraph"
+        ]
+        assert texts == ["하나 (수정)", "둘"]
+
+
+class TestRequestMetrics:
+
+    def test_per_endpoint_counts_and_payload_sizes(self, server):
+        client = _client(server)
+        page = client.create_page("root", "제목", children=_paragraphs(150))
+        client.get_blocks(page["id"])
+
+        endpoints = client.metrics.endpoints
+        assert endpoints["pages.create"].requests == 1
+        assert endpoints["blocks.children.append"].requests == 1
+        assert endpoints["blocks.children.list"].requests == 2
+        assert endpoints["pages.create"].request_bytes > 0
+        assert endpoints["blocks.children.list"].response_bytes > 0
+        assert client.metrics.total.latency.count == 4
+
+    def test_payload_sizes_are_body_lengths(self, server):
+        """크기는 httpx 가 주고받은 본문 길이 (스레드·태스크별로 섞이지 않음)"""
+        client = _client(server)
+        page = client.create_page("root", "제목", children=_three_levels())
+        body = len(json.dumps(server.pages[page["id"]], ensure_ascii=False).encode("utf-8"))
+        events = []
+        client.add_hook(events.append)
+
+        client.get_page(page["id"])
+        client.get_block_children(page["id"], workers=3)
+
+        assert (events[0].request_bytes, events[0].response_bytes) == (0, body)
+        assert all(e.response_bytes > 0 for e in events[1:])
+
+        async def retrieve_concurrently() -> list[RequestEvent]:
+            async_events: list[RequestEvent] = []
+            async with AsyncNotionClient(
+                api_key="fake",
+                rate_limiter=RateLimiter(rate=1000, burst=1000),
+                base_url=server.url,
+                hooks=[async_events.append],
+            ) as async_client:
+                await asyncio.gather(*(async_client.get_page(page["id"]) for _ in range(3)))
+            return async_events
+
+        assert [e.response_bytes for e in asyncio.run(retrieve_concurrently())] == [body] * 3
+
+    def test_rate_limited_attempts_are_recorded(self, server):
+        server.rate_limit_every = 2
+        client = _client(server)
+        page = client.create_page("root", "제목")
+        client.get_page(page["id"])
+
+        stats = client.metrics.endpoints["pages.retrieve"]
+        assert (stats.requests, stats.errors, stats.rate_limited, stats.retries) == (2, 1, 1, 1)
+        assert stats.retry_wait > 0
+
+    def test_hooks_receive_every_attempt(self, server):
+        server.error_rate = 1.0
+        events = []
+        client = _client(server, max_retries=1)
+        client.add_hook(events.append)
+
+        with pytest.raises(HTTPResponseError):
+            client.get_page("missing")
+
+        assert [(e.attempt, e.retried) for e in events] == [(0, True), (1, False)]
+        assert all(e.status in (500, 502, 503) and e.error for e in events)
+
+    def test_batch_report_exports_metrics_delta(self, server, tmp_path):
+        client = _client(server)
+        client.create_page("root", "이전 요청")
+        path = tmp_path / "doc.md"
+        path.write_text("# 문서\n\n본문\n", encoding="utf-8")
+
+        report = batch_push([path], client, "root")
+
+        assert report.metrics.total.requests == 1   # 배치 이전 요청은 제외
+        assert "API 요청 1회" in report.metrics_summary()
+        exported = json.loads(report.to_json())
+        assert exported["results"][0]["success"]
+        assert exported["metrics"]["endpoints"]["pages.create"]["latency"]["count"] == 1
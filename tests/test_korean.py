@@ -7,9 +7,14 @@ from md_notion_bridge.utils.korean import (
     normalize,
     is_korean,
     has_korean,
+    mark_normalized,
+    normalize_markdown_korean,
     normalize_punctuation,
     split_long_text,
+    utf16_len,
+    LINE_BOUNDARY,
     NOTION_TEXT_LIMIT,
+    NormalizedText,
 )
 
 
@@ -26,6 +31,34 @@ class TestNormalize:
     def test_empty(self):
         assert normalize("") == ""
 
+    def test_marked_text_returned_as_is(self):
+        marked = mark_normalized("이미 정규화됨")
+        assert normalize(marked) is marked
+        assert normalize_markdown_korean(marked) is marked
+
+
+class TestNormalizeMarkdownKorean:
+
+    def test_result_is_marked(self):
+        nfd = unicodedata.normalize("NFD", "안녕！  하세요")
+        result = normalize_markdown_korean(nfd)
+        assert isinstance(result, NormalizedText)
+        assert result == "안녕! 하세요"
+        assert normalize_markdown_korean(result) is result
+
+    def test_indentation_kept(self):
+        text = "- 부모\n    - 자식  항목\n\t  탭 뒤"
+        assert normalize_markdown_korean(text) == "- 부모\n    - 자식 항목\n\t 탭 뒤"
+
+    @pytest.mark.parametrize("text, expected", [
+        ("하나\n둘\n", "하나\n둘"),
+        ("하나\r\n둘\r\n\r\n", "하나\n둘\n"),
+        ("하나\u2028둘", "하나\n둘"),
+        ("끝 빈 줄\n\n", "끝 빈 줄\n"),
+    ])
+    def test_line_breaks_unified(self, text, expected):
+        assert normalize_markdown_korean(text) == expected
+
 
 class TestIsKorean:
 
@@ -81,4 +114,27 @@ class TestSplitLongText:
         chunks = split_long_text(text)
         reassembled = " ".join(chunks)
         # 공백 차이는 허용, 핵심 내용 보존 확인
-        assert "가나다" in reassembled
\ No newline at end of file
+        assert "가나다" in reassembled
+
+    def test_chunks_join_to_original(self):
+        text = "가나다.  라마바! " * 400 + "끝"
+        chunks = split_long_text(text)
+        assert "".join(chunks) == text
+        assert all(chunk.endswith(" ") for chunk in chunks[:-1])   # 문장 경계에서 자름
+
+    def test_forced_split_without_boundary(self):
+        assert [len(c) for c in split_long_text("가" * 4500)] == [2000, 2000, 500]
+
+    def test_emoji_counted_as_two(self):
+        """BMP 밖 문자는 UTF-16 기준 2자 - 코드 포인트 수로는 제한 이내여도 분할"""
+        text = "😀" * 1500
+        assert utf16_len(text) == 3000
+        chunks = split_long_text(text)
+        assert [len(c) for c in chunks] == [1000, 500]
+        assert all(utf16_len(c) <= NOTION_TEXT_LIMIT for c in chunks)
+
+    def test_line_boundary(self):
+        text = "\n".join(f"line {i}" for i in range(1000))
+        chunks = split_long_text(text, boundary=LINE_BOUNDARY)
+        assert "".join(chunks) == text
+        assert all(chunk.endswith("\n") for chunk in chunks[:-1])
@@ -1,8 +1,14 @@
 """마크다운 → Notion 변환기 테스트"""
 from __future__ import annotations
 
+import unicodedata
+from pathlib import Path
+
 import pytest
-from md_notion_bridge.md_to_notion import convert, parse_inline
+from md_notion_bridge.md_to_notion import convert, convert_file, iter_blocks, parse_inline
+from md_notion_bridge.metrics import PhaseTimings
+
+FIXTURES = Path(__file__).parent / "fixtures"
 
 
 # ------------------------------------------------------------------ #
@@ -47,6 +53,17 @@ class TestParseInline:
         assert "굵게" in contents
         assert "일반 " in contents
 
+    def test_nfd_input_normalized(self):
+        """macOS NFD 입력도 서식 조각까지 NFC 로 정규화"""
+        nfd = unicodedata.normalize("NFD", "일반 **굵게**")
+        contents = [r["text"]["content"] for r in parse_inline(nfd)]
+        assert contents == ["일반 ", "굵게"]
+
+    def test_long_plain_text_split(self):
+        result = parse_inline("가" * 4500 + " **끝**")
+        assert [len(r["text"]["content"]) for r in result[:-1]] == [2000, 2000, 501]
+        assert result[-1]["annotations"] == {"bold": True}
+
 
 # ------------------------------------------------------------------ #
 # convert 테스트
@@ -113,6 +130,10 @@ class TestConvert:
         assert blocks[0]["type"] == "table"
         assert blocks[0]["table"]["has_column_header"] is True
 
+    def test_table_memoized_cells_match(self):
+        md = "| a | b |\n|---|---|\n" + "| **같음** | `셀` |\n" * 50
+        assert convert(md, memoize_cells=True) == convert(md)
+
     def test_empty_string(self):
         blocks = convert("")
         assert blocks == []
@@ -151,6 +172,13 @@ class TestConvert:
         assert len(blocks) == 1
         assert blocks[0]["type"] == "paragraph"
 
+    def test_long_code_block_split_by_lines(self):
+        code = "\n".join(f"print({i}) # 😀" for i in range(500))
+        rich_text = convert(f"```python\n{code}\n```")[0]["code"]["rich_text"]
+        contents = [r["text"]["content"] for r in rich_text]
+        assert len(contents) > 1 and "".join(contents) == code
+        assert all(c.endswith("\n") for c in contents[:-1])
+
     def test_empty_code_block(self):
         """빈 코드블록 안전 처리"""
         blocks = convert("```\n```")
@@ -163,4 +191,64 @@ class TestConvert:
         assert blocks[0]["type"] == "bulleted_list_item"
         children = blocks[0]["bulleted_list_item"].get("children", [])
         assert len(children) == 1
-        assert children[0]["type"] == "bulleted_list_item"
\ No newline at end of file
+        assert children[0]["type"] == "bulleted_list_item"
+
+    def test_todo_item(self):
+        blocks = convert("- [x] 완료\n- [ ] 할 일")
+        assert [b["to_do"]["checked"] for b in blocks] == [True, False]
+
+    def test_hash_without_space_is_paragraph(self):
+        """'#' 뒤에 공백이 없거나 7개 이상이면 제목이 아님"""
+        blocks = convert("#태그\n\n####### 일곱")
+        assert [b["type"] for b in blocks] == ["paragraph", "paragraph"]
+
+    def test_indented_divider(self):
+        blocks = convert("  ***  ")
+        assert blocks[0]["type"] == "divider"
+
+    def test_paragraph_ends_at_indented_list(self):
+        """문단 병합은 탭으로 들여쓴 목록 줄에서 끝남"""
+        blocks = convert("문단 첫 줄\n둘째 줄\n\t- 목록\n3. 번호")
+        assert blocks[0]["type"] == "paragraph"
+        assert len(blocks) == 3
+
+
+# ------------------------------------------------------------------ #
+# iter_blocks 테스트
+# ------------------------------------------------------------------ #
+
+class TestIterBlocks:
+
+    @pytest.mark.parametrize("korean_optimize", [True, False])
+    def test_matches_convert_file(self, korean_optimize):
+        path = FIXTURES / "sample.md"
+        expected = convert_file(str(path), korean_optimize=korean_optimize)
+        assert list(iter_blocks(path, korean_optimize=korean_optimize)) == expected
+
+    def test_nested_items_attached_before_yield(self, tmp_path):
+        path = tmp_path / "list.md"
+        path.write_text("- 부모\n\n  - 자식\n\n문단\n", encoding="utf-8")
+        blocks = list(iter_blocks(path))
+        assert [b["type"] for b in blocks] == ["bulleted_list_item", "paragraph"]
+        assert len(blocks[0]["bulleted_list_item"]["children"]) == 1
+
+    def test_yields_before_reading_whole_file(self, tmp_path):
+        path = tmp_path / "big.md"
+        path.write_text("# 제목\n\n" + "문단\n\n" * 10_000, encoding="utf-8")
+        stream = iter_blocks(path)
+        assert next(stream)["type"] == "heading_1"
+        stream.close()
+
+    def test_unterminated_code_block_keeps_trailing_blank(self, tmp_path):
+        path = tmp_path / "code.md"
+        path.write_text("```\na\n\n", encoding="utf-8")
+        assert list(iter_blocks(path)) == convert_file(str(path))
+
+    def test_timings_do_not_change_output(self, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text((FIXTURES / "sample.md").read_text(encoding="utf-8"), encoding="utf-8")
+        timings = PhaseTimings()
+
+        assert list(iter_blocks(path, timings=timings)) == convert_file(str(path))
+        assert timings.read > 0 and timings.normalize > 0 and timings.parse > 0
+        assert timings.api == timings.convert == timings.write == 0
@@ -0,0 +1,121 @@
+"""mistune 파서 엔진 테스트 - 줄 단위 엔진과의 동등성 + CommonMark 차이"""
+from __future__ import annotations
+
+import unicodedata
+from pathlib import Path
+
+import pytest
+from md_notion_bridge.md_to_notion import convert, convert_file
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+SECTION = """\
+## `Client.method_{n}`
+
+메서드 {n} 설명입니다. **필수** 인자와 *선택* 인자를 받으며
+결과는 `dict` 로 반환합니다. 자세한 내용은 [문서](https://example.com/{n}) 참고.
+
+- 인자 `block_id` — 대상 블록 ID
+- 인자 `children` — 추가할 블록 목록
+  - 최대 100개
+- [ ] 비동기 버전 추가
+- [x] 재시도 지원
+
+1. 요청 생성
+2. 응답 확인
+
+| 이름 | 타입 | 설명 |
+|------|------|------|
+| block_id | str | 블록 ID |
+| children | list | ~~자식~~ 블록 |
+
+```python
+client.method_{n}(block_id="abc")
+```
+
+> 참고: 속도 제한이 적용됩니다.
+
+---
+"""
+
+# 두 엔진이 같은 결과를 내야 하는 문서
+EQUIVALENT_DOCUMENTS = {
+    "sections": "# API 레퍼런스\n\n" + "\n".join(SECTION.format(n=n) for n in range(5)),
+    "english": "# Title\n\nSome **bold** and *italic* text\nwrapped over `two` lines.\n\n- one\n- two\n",
+    "headings": "# 하나\n## 둘\n### 셋\n#### 넷\n\n문단",
+    "dividers": "위\n\n---\n\n***\n\n아래",
+    "image": "![캡션](https://example.com/a.png)\n\n![](https://example.com/b.png)\n",
+    "image_then_text": "![캡션](https://example.com/a.png)\n다음 줄 문단\n",
+    "code_languages": "```js\nconst a = 1;\n\n```\n\n```\n그냥 텍스트\n```\n\n```unknown\nx\n```",
+    "nested_numbered": "1. 첫째\n   1. 하위\n2. 둘째\n",
+    "long_paragraph": ("한국어 문장입니다. " * 500).rstrip(),
+    "fullwidth_nfd": unicodedata.normalize("NFD", "안녕하세요！  질문이 있습니다？\n\n시간：  오후 3시，"),
+    "empty": "",
+}
+
+
+# ------------------------------------------------------------------ #
+# 동등성
+# ------------------------------------------------------------------ #
+
+class TestEquivalence:
+
+    @pytest.mark.parametrize("korean_optimize", [True, False])
+    @pytest.mark.parametrize("name", sorted(EQUIVALENT_DOCUMENTS))
+    def test_same_blocks(self, name, korean_optimize):
+        text = EQUIVALENT_DOCUMENTS[name]
+        assert convert(text, korean_optimize, engine="mistune") == convert(text, korean_optimize)
+
+    def test_sample_fixture(self):
+        path = str(FIXTURES / "sample.md")
+        assert convert_file(path, engine="mistune") == convert_file(path)
+
+    def test_memoized_cells(self):
+        text = EQUIVALENT_DOCUMENTS["sections"]
+        assert convert(text, memoize_cells=True, engine="mistune") == convert(text)
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError, match="알 수 없는 파서 엔진"):
+            convert("문단", engine="regex")
+
+
+# ------------------------------------------------------------------ #
+# CommonMark 구조 (줄 단위 엔진과 다른 부분)
+# ------------------------------------------------------------------ #
+
+def _children(block: dict) -> list[dict]:
+    return block[block["type"]].get("children", [])
+
+
+class TestCommonMarkStructure:
+
+    def test_deep_nesting(self):
+        blocks = convert("- 1\n  - 2\n    - 3\n      - 4\n", engine="mistune")
+        depth, block = 1, blocks[0]
+        while _children(block):
+            depth, block = depth + 1, _children(block)[0]
+        assert depth == 4
+
+    def test_mixed_list_types_nest(self):
+        blocks = convert("- 글머리\n  1. 번호\n  - [x] 할일\n", engine="mistune")
+        assert len(blocks) == 1
+        assert [b["type"] for b in _children(blocks[0])] == ["numbered_list_item", "to_do"]
+        assert _children(blocks[0])[1]["to_do"]["checked"] is True
+
+    def test_code_block_inside_list_item(self):
+        blocks = convert("- 설치\n\n  ```bash\n  pip install x\n  ```\n", engine="mistune")
+        child = _children(blocks[0])[0]
+        assert child["code"]["language"] == "bash"
+        assert child["code"]["rich_text"][0]["text"]["content"] == "pip install x"
+
+    def test_multiline_quote_is_one_block(self):
+        blocks = convert("> 첫 줄\n> 둘째 줄\n>\n> 새 문단", engine="mistune")
+        assert len(blocks) == 1
+        assert blocks[0]["quote"]["rich_text"][0]["text"]["content"] == "첫 줄 둘째 줄"
+        assert _children(blocks[0])[0]["type"] == "paragraph"
+
+    def test_escaped_pipe_in_table_cell(self):
+        blocks = convert("| a | b |\n|---|---|\n| x \\| y | z |\n", engine="mistune")
+        cells = blocks[0]["table"]["children"][1]["table_row"]["cells"]
+        assert cells[0][0]["text"]["content"] == "x | y"
+        assert blocks[0]["table"]["table_width"] == 2
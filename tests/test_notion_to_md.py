@@ -1,8 +1,19 @@
 """Notion → 마크다운 변환기 테스트"""
 from __future__ import annotations
 
+import io
+
 import pytest
-from md_notion_bridge.notion_to_md import convert, rich_text_to_md
+from md_notion_bridge.blocks import CompactBlock, compact_block
+from md_notion_bridge.notion_to_md import (
+    _CONVERTERS,
+    MarkdownWriter,
+    convert,
+    convert_page,
+    register_converter,
+    rich_text_to_md,
+    write_page,
+)
 
 
 # ------------------------------------------------------------------ #
@@ -158,4 +169,125 @@ class TestConvert:
             _block("bulleted_list_item", rich_text=[_rt("둘")]),
         ]
         result = convert(blocks)
-        assert "\n\n" not in result
\ No newline at end of file
+        assert "\n\n" not in result
+
+# ------------------------------------------------------------------ #
+# 스트리밍 writer 테스트
+# ------------------------------------------------------------------ #
+
+def _mixed_blocks() -> list[dict]:
+    return [
+        {"type": "paragraph", "paragraph": {"rich_text": [_rt("문단")]}},
+        {"type": "paragraph", "paragraph": {"rich_text": []}},
+        {"type": "bulleted_list_item", "bulleted_list_item": {"rich_text": [_rt("하나")]}},
+        {"type": "to_do", "to_do": {"rich_text": [_rt("할 일")], "checked": True}},
+        {"type": "divider", "divider": {}},
+        {"type": "divider", "divider": {}},
+        {"type": "quote", "quote": {"rich_text": [_rt("인용")]}},
+        {"type": "paragraph", "paragraph": {"rich_text": []}},
+    ]
+
+
+class TestMarkdownWriter:
+
+    def test_matches_convert(self):
+        blocks = _mixed_blocks()
+        buffer = io.StringIO()
+        writer = MarkdownWriter(buffer)
+        writer.write_all(iter(blocks))
+        writer.close()
+        assert buffer.getvalue() == convert(blocks)
+
+    def test_trailing_blank_dropped_on_close(self):
+        buffer = io.StringIO()
+        writer = MarkdownWriter(buffer)
+        writer.write({"type": "divider", "divider": {}})
+        writer.close()
+        assert buffer.getvalue() == "---"
+
+    @pytest.mark.parametrize("blocks", [[], _mixed_blocks()])
+    def test_write_page_matches_convert_page(self, blocks):
+        page = {"properties": {"title": {"title": [{"plain_text": "제목"}]}}}
+        buffer = io.StringIO()
+        count = write_page(page, iter(blocks), buffer)
+        assert buffer.getvalue() == convert_page(page, blocks)
+        assert count == len(blocks)
+
+
+# ------------------------------------------------------------------ #
+# 변환 함수 등록표 / CompactBlock 테스트
+# ------------------------------------------------------------------ #
+
+class TestConverterRegistry:
+
+    def test_unsupported_type_comment(self):
+        assert convert([{"type": "bookmark", "bookmark": {}}]) == (
+            "<!-- unsupported block: bookmark -->"
+        )
+
+    def test_register_new_type(self, monkeypatch):
+        monkeypatch.setitem(_CONVERTERS, "bookmark", _CONVERTERS["divider"])
+
+        @register_converter("bookmark")
+        def _bookmark(block, data, depth):
+            return f"<{data['url']}>"
+
+        blocks = [{"type": "bookmark", "bookmark": {"url": "https://example.com"}}]
+        assert convert(blocks) == "<https://example.com>"
+
+    def test_nested_list_uses_registry(self):
+        child = {"type": "bulleted_list_item", "bulleted_list_item": {"rich_text": [_rt("자식")]}}
+        parent = {
+            "type": "bulleted_list_item",
+            "bulleted_list_item": {"rich_text": [_rt("부모")]},
+            "children": [child],
+        }
+        assert convert([parent]) == "- 부모\n - 자식"
+
+
+class TestCompactBlock:
+
+    def _api_block(self, block_type: str, **data) -> dict:
+        """API 응답과 같은 모양 (변환에 쓰지 않는 필드 포함)"""
+        return {
+            "object": "block",
+            "id": "blk-1",
+            "created_time": "2026-01-01T00:00:00.000Z",
+            "last_edited_time": "2026-01-02T00:00:00.000Z",
+            "created_by": {"object": "user", "id": "u"},
+            "has_children": False,
+            "archived": False,
+            "type": block_type,
+            block_type: data,
+        }
+
+    def test_same_markdown_as_dict(self):
+        blocks = _mixed_blocks() + [
+            self._api_block("heading_2", rich_text=[_rt("제목", bold=True)]),
+            self._api_block("code", rich_text=[_rt("x = 1")], language="python"),
+            {
+                "type": "table",
+                "table": {"has_column_header": True},
+                "children": [{"type": "table_row", "table_row": {"cells": [[_rt("a")], [_rt("b")]]}}],
+            },
+        ]
+        assert convert([compact_block(b) for b in blocks]) == convert(blocks)
+
+    def test_drops_unused_fields(self):
+        block = compact_block(self._api_block("paragraph", rich_text=[_rt("문단", italic=True)]))
+        assert block.to_dict() == {
+            "type": "paragraph",
+            "paragraph": {"rich_text": [{"plain_text": "문단", "annotations": {"italic": True}}]},
+            "id": "blk-1",
+            "last_edited_time": "2026-01-02T00:00:00.000Z",
+        }
+        assert not hasattr(block, "__dict__")
+
+    def test_dict_style_access(self):
+        block = CompactBlock("divider", {}, id="d")
+        assert block["type"] == "divider" and block["id"] == "d"
+        assert block.get("children", []) == []
+        block["children"] = []
+        assert "children" in block
+        with pytest.raises(KeyError):
+            block["object"]
@@ -0,0 +1,304 @@
+"""증분 동기화 (push --sync) 테스트"""
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from notion_client.errors import HTTPResponseError
+
+from md_notion_bridge.md_to_notion import convert
+from md_notion_bridge import sync
+from md_notion_bridge.retry import RetryStats
+from md_notion_bridge.sync import (
+    STATE_FILENAME,
+    SyncState,
+    batch_sync,
+    block_hash,
+    sync_file,
+)
+
+
+# ------------------------------------------------------------------ #
+# 테스트용 가짜 클라이언트 (페이지 = 블록 목록)
+# ------------------------------------------------------------------ #
+
+class NotFound(HTTPResponseError):
+    """삭제된 페이지 / 블록 (404)"""
+
+    def __init__(self) -> None:
+        Exception.__init__(self, "HTTP 404")
+        self.status = 404
+
+
+class FakeSyncClient:
+    """create / append(after) / update / delete 를 메모리에서 처리 (calls 에는 쓰기만 기록)"""
+
+    def __init__(self) -> None:
+        self.pages: dict[str, list[tuple[str, dict]]] = {}
+        self.titles: dict[str, str] = {}
+        self.archived: set[str] = set()
+        self.calls: list[str] = []
+        self.retry_stats = RetryStats()
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def _id(self, prefix: str) -> str:
+        with self._lock:
+            self._next += 1
+            return f"{prefix}-{self._next}"
+
+    def _locate(self, block_id: str) -> tuple[str, int]:
+        for page_id, blocks in self.pages.items():
+            for i, (bid, _) in enumerate(blocks):
+                if bid == block_id:
+                    return page_id, i
+        raise NotFound()
+
+    def get_page(self, page_id: str) -> dict:
+        if page_id not in self.pages:
+            raise NotFound()
+        return {"id": page_id, "archived": page_id in self.archived}
+
+    def get_blocks(self, block_id: str) -> list[dict]:
+        if block_id not in self.pages:
+            raise NotFound()
+        return [{"id": bid} for bid, _ in self.pages[block_id]]
+
+    def create_page(self, parent_id: str, title: str, children=None) -> dict:
+        self.calls.append("create")
+        page_id = self._id("page")
+        self.pages[page_id] = []
+        self.titles[page_id] = title
+        return {"id": page_id}
+
+    def append_blocks(self, block_id: str, children: list[dict], after=None) -> list[dict]:
+        self.calls.append("append")
+        if block_id not in self.pages:
+            raise NotFound()
+        blocks = self.pages[block_id]
+        index = self._locate(after)[1] + 1 if after else len(blocks)
+        created = [(self._id("block"), b) for b in children]
+        blocks[index:index] = created
+        return [{"id": bid} for bid, _ in created]
+
+    def update_block(self, block_id: str, block: dict) -> dict:
+        self.calls.append("update")
+        page_id, i = self._locate(block_id)
+        self.pages[page_id][i] = (block_id, block)
+        return {"id": block_id}
+
+    def delete_block(self, block_id: str) -> None:
+        self.calls.append("delete")
+        page_id, i = self._locate(block_id)
+        del self.pages[page_id][i]
+
+    def update_page_title(self, page_id: str, title: str) -> dict:
+        self.calls.append("title")
+        self.titles[page_id] = title
+        return {"id": page_id}
+
+    def content(self, page_id: str) -> list[dict]:
+        return [b for _, b in self.pages[page_id]]
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _sync(file: Path, client: FakeSyncClient, state: SyncState):
+    result, file_state = sync_file(file, client, "parent", state.get(file))
+    if file_state:
+        state.set(file, file_state)
+    return result, file_state
+
+
+def _doc(*paragraphs: str) -> str:
+    return "# 제목\n\n" + "\n\n".join(paragraphs) + "\n"
+
+
+# ------------------------------------------------------------------ #
+# 테스트
+# ------------------------------------------------------------------ #
+
+class TestSyncFile:
+
+    def test_first_sync_creates_page(self, tmp_path):
+        file = _write(tmp_path / "a.md", _doc("첫 문단", "둘째 문단"))
+        client, state = FakeSyncClient(), SyncState(tmp_path / STATE_FILENAME)
+
+        result, file_state = _sync(file, client, state)
+
+        assert result.success and not result.skipped
+        assert client.calls == ["create", "append"]
+        assert client.content(file_state.page_id) == convert(file.read_text(encoding="utf-8"))
+
+    def test_unchanged_file_makes_no_calls(self, tmp_path):
+        file = _write(tmp_path / "a.md", _doc("첫 문단"))
+        client, state = FakeSyncClient(), SyncState(tmp_path / STATE_FILENAME)
+        _sync(file, client, state)
+        client.calls.clear()
+
+        result, _ = _sync(file, client, state)
+
+        assert result.skipped
+        assert client.calls == []
+
+    def test_edited_paragraph_updated_in_place(self, tmp_path):
+        file = _write(tmp_path / "a.md", _doc("하나", "둘", "셋"))
+        client, state = FakeSyncClient(), SyncState(tmp_path / STATE_FILENAME)
+        _, before = _sync(file, client, state)
+        client.calls.clear()
+
+        _write(file, _doc("하나", "둘 (수정)", "셋"))
+        result, after = _sync(file, client, state)
+
+        assert client.calls == ["update"]
+        assert [b.block_id for b in after.blocks] == [b.block_id for b in before.blocks]
+        assert client.content(after.page_id) == convert(file.read_text(encoding="utf-8"))
+        assert result.changes == "추가 0 · 수정 1 · 삭제 0"
+
+    def test_replace_with_other_type(self, tmp_path):
+        file = _write(tmp_path / "a.md", _doc("하나", "둘", "셋", "넷"))
+        client, state = FakeSyncClient(), SyncState(tmp_path / STATE_FILENAME)
+        _sync(file, client, state)
+        client.calls.clear()
+
+        _write(file, "# 제목\n\n하나\n\n둘\n\n```\ncode\n```\n\n넷\n")
+        _, after = _sync(file, client, state)
+
+        # 타입이 다른 블록은 삭제 후 앞 블록 뒤에 추가
+        assert client.calls == ["delete", "append"]
+        assert client.content(after.page_id) == convert(file.read_text(encoding="utf-8"))
+
+    def test_insert_at_top_rewrites_tail(self, tmp_path):
+        file = _write(tmp_path / "a.md", "하나\n\n둘\n")
+        client, state = FakeSyncClient(), SyncState(tmp_path / STATE_FILENAME)
+        _sync(file, client, state)
+
+        _write(file, "---\n\n하나\n\n둘\n")
+        _, after = _sync(file, client, state)
+
+        assert client.content(after.page_id) == convert(file.read_text(encoding="utf-8"))
+
+    def test_title_change_updates_page(self, tmp_path):
+        file = _write(tmp_path / "a.md", _doc("본문"))
+        client, state = FakeSyncClient(), SyncState(tmp_path / STATE_FILENAME)
+        _, first = _sync(file, client, state)
+        client.calls.clear()
+
+        _write(file, "# 새 제목\n\n본문\n")
+        _, after = _sync(file, client, state)
+
+        assert client.titles[first.page_id] == "새 제목"
+        assert client.calls[0] == "title"
+        assert client.content(after.page_id) == convert(file.read_text(encoding="utf-8"))
+
+    def test_deleted_page_is_recreated(self, tmp_path):
+        file = _write(tmp_path / "a.md", _doc("본문"))
+        client, state = FakeSyncClient(), SyncState(tmp_path / STATE_FILENAME)
+        _, first = _sync(file, client, state)
+        del client.pages[first.page_id]
+
+        _write(file, _doc("본문", "추가"))
+        result, after = _sync(file, client, state)
+
+        assert result.success
+        assert after.page_id != first.page_id
+        assert client.content(after.page_id) == convert(file.read_text(encoding="utf-8"))
+
+    def test_archived_page_is_recreated(self, tmp_path):
+        file = _write(tmp_path / "a.md", _doc("본문"))
+        client, state = FakeSyncClient(), SyncState(tmp_path / STATE_FILENAME)
+        _, first = _sync(file, client, state)
+        client.archived.add(first.page_id)
+
+        _write(file, _doc("본문", "추가"))
+        _, after = _sync(file, client, state)
+
+        assert after.page_id != first.page_id
+
+    def test_deleted_block_rewrites_same_page(self, tmp_path):
+        file = _write(tmp_path / "a.md", _doc("하나", "둘", "셋"))
+        client, state = FakeSyncClient(), SyncState(tmp_path / STATE_FILENAME)
+        _, first = _sync(file, client, state)
+        del client.pages[first.page_id][2]     # Notion 에서 "둘" 삭제
+
+        _write(file, _doc("하나", "둘 (수정)", "셋"))
+        result, after = _sync(file, client, state)
+
+        assert result.success
+        assert after.page_id == first.page_id
+        assert list(client.pages) == [first.page_id]
+        assert client.content(after.page_id) == convert(file.read_text(encoding="utf-8"))
+
+    def test_partial_failure_rewrites_next_time(self, tmp_path):
+        file = _write(tmp_path / "a.md", _doc("하나", "둘"))
+        client, state = FakeSyncClient(), SyncState(tmp_path / STATE_FILENAME)
+        _, first = _sync(file, client, state)
+
+        # 삭제는 반영됐지만 추가가 실패
+        def broken_append(*args, **kwargs):
+            raise RuntimeError("연결 끊김")
+
+        append, client.append_blocks = client.append_blocks, broken_append
+        _write(file, _doc("하나", "```\ncode\n```"))
+        result, failed = _sync(file, client, state)
+        assert not result.success
+        assert failed.dirty and failed.page_id == first.page_id
+
+        client.append_blocks = append
+        result, after = _sync(file, client, state)
+
+        assert result.success and not result.skipped and not after.dirty
+        assert after.page_id == first.page_id
+        assert client.content(after.page_id) == convert(file.read_text(encoding="utf-8"))
+
+    def test_converter_version_change_resyncs(self, tmp_path, monkeypatch):
+        file = _write(tmp_path / "a.md", _doc("본문"))
+        client, state = FakeSyncClient(), SyncState(tmp_path / STATE_FILENAME)
+        _sync(file, client, state)
+
+        monkeypatch.setattr(sync, "CONVERTER_VERSION", sync.CONVERTER_VERSION + 1)
+        result, _ = _sync(file, client, state)
+
+        assert not result.skipped
+
+
+class TestBatchSync:
+
+    def test_state_round_trip_and_skips(self, tmp_path):
+        files = [
+            _write(tmp_path / "a.md", _doc("가")),
+            _write(tmp_path / "b.md", _doc("나")),
+        ]
+        client = FakeSyncClient()
+
+        report = batch_sync(files, client, "parent", SyncState.for_directory(tmp_path))
+        assert report.success == 2 and report.skipped == 0
+
+        saved = json.loads((tmp_path / STATE_FILENAME).read_text(encoding="utf-8"))
+        assert sorted(saved["files"]) == ["a.md", "b.md"]
+
+        _write(files[1], _doc("나", "다"))
+        report = batch_sync(files, client, "parent", SyncState.for_directory(tmp_path))
+        assert report.success == 2 and report.skipped == 1
+        assert "변경 없음 1건" in report.summary()
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        files = [_write(tmp_path / f"{i}.md", _doc(f"문단 {i}")) for i in range(6)]
+        client = FakeSyncClient()
+
+        report = batch_sync(
+            files, client, "parent", SyncState.for_directory(tmp_path), workers=3
+        )
+
+        assert [r.file for r in report.results] == [f.name for f in files]
+        assert report.failed == 0
+
+
+def test_block_hash_ignores_key_order():
+    a = {"type": "divider", "divider": {}, "object": "block"}
+    b = {"object": "block", "divider": {}, "type": "divider"}
+    assert block_hash(a) == block_hash(b)